@@ -60,6 +60,7 @@ class PersistenceManager:
         """
         self._config_path = config_path or (settings.app_data_dir / "config.json")
         self._preferences: Optional[UserPreferences] = None
+        self._dirty = False  # Deferred updates not yet written
 
     @property
     def preferences(self) -> UserPreferences:
@@ -106,6 +107,24 @@ class PersistenceManager:
         with open(self._config_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
 
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Save preferences if deferred updates are pending."""
+        if self._dirty:
+            self.save()
+
+    def _commit(self, defer: bool) -> None:
+        """Save now, or mark preferences dirty for a later flush().
+
+        Args:
+            defer: Whether to defer the write
+        """
+        if defer:
+            self._dirty = True
+        else:
+            self.save()
+
     def update_window_state(
         self,
         x: int,
@@ -141,25 +160,27 @@ class PersistenceManager:
         prefs.last_model = model_id
         self.save()
 
-    def update_focus_mode(self, enabled: bool) -> None:
+    def update_focus_mode(self, enabled: bool, defer: bool = False) -> None:
         """Update focus mode state and save.
 
         Args:
             enabled: Whether focus mode is enabled
+            defer: Leave the write to a later flush()
         """
         prefs = self.preferences
         prefs.focus_mode = enabled
-        self.save()
+        self._commit(defer)
 
-    def update_inspector_visible(self, visible: bool) -> None:
+    def update_inspector_visible(self, visible: bool, defer: bool = False) -> None:
         """Update inspector visibility and save.
 
         Args:
             visible: Whether inspector is visible
+            defer: Leave the write to a later flush()
         """
         prefs = self.preferences
         prefs.inspector_visible = visible
-        self.save()
+        self._commit(defer)
 
     def update_artifact_options(
         self,
@@ -184,17 +205,19 @@ class PersistenceManager:
         self,
         enabled: bool,
         router: str,
+        defer: bool = False,
     ) -> None:
         """Update Crucible integration settings and save.
 
         Args:
             enabled: Whether Crucible is enabled
             router: Router mode ("Auto", "Custom-Role", or "Custom-Cost")
+            defer: Leave the write to a later flush()
         """
         prefs = self.preferences
         prefs.crucible_enabled = enabled
         prefs.crucible_router = router
-        self.save()
+        self._commit(defer)
 
     def _preferences_to_dict(self, prefs: UserPreferences) -> Dict[str, Any]:
         """Convert preferences to dictionary.
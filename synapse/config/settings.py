@@ -44,6 +44,10 @@ class AppSettings:
     session_list_limit: int = 100
     rag_retrieval_k: int = 5
     rag_search_k: int = 10
+    rag_small_corpus_chunks: int = 1000  # Below this, search inline (no thread hop)
+    session_index_concurrency: int = 8  # Sessions embedded in parallel
+    search_cache_size: int = 32  # Recent conversation searches kept
+    search_cache_ttl: float = 120.0  # Seconds a cached search stays valid
     context_threshold: float = 0.80
 
     # Embedding dimensions
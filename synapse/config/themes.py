@@ -4,6 +4,7 @@ Premium aesthetic inspired by Linear, Raycast, Arc Browser, and Stripe.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass
@@ -132,9 +133,13 @@ fonts = ThemeFonts()
 metrics = ThemeMetrics()
 
 
+@lru_cache(maxsize=1)
 def get_stylesheet() -> str:
     """Generate the complete premium application stylesheet.
 
+    The theme instances are fixed for the process lifetime, so the
+    sheet is formatted once and the same string is returned afterwards.
+
     Returns:
         CSS stylesheet string for Qt
     """
@@ -383,6 +388,450 @@ def get_stylesheet() -> str:
             border-color: {theme.accent};
         }}
 
+        /* === MEMORY PANEL === */
+        MemoryPanel, MemoryPanel QWidget, AddFactDialog, AddFactDialog QWidget {{
+            background-color: {theme.background_secondary};
+        }}
+
+        QFrame#memoryHeader {{
+            background-color: {theme.background_tertiary};
+            border-bottom: 1px solid {theme.border_subtle};
+        }}
+
+        QFrame#memoryToolbar {{
+            background-color: {theme.background_tertiary};
+        }}
+
+        QFrame#memoryFooter {{
+            background-color: {theme.background_tertiary};
+            border-top: 1px solid {theme.border_subtle};
+        }}
+
+        QLabel#memoryTitle {{
+            background-color: transparent;
+            color: {theme.text_muted};
+            font-size: 11px;
+            font-weight: 600;
+            letter-spacing: 1px;
+            font-family: {fonts.ui};
+        }}
+
+        QLabel#memoryCount {{
+            background-color: transparent;
+            color: {theme.text_disabled};
+            font-size: 11px;
+            font-family: {fonts.ui};
+        }}
+
+        QComboBox#memoryFilter {{
+            background-color: {theme.background_elevated};
+            color: {theme.text_primary};
+            border: 1px solid {theme.border};
+            border-radius: {metrics.radius_small}px;
+            padding: 4px 12px;
+            font-size: 12px;
+            font-family: {fonts.ui};
+            min-width: 120px;
+        }}
+
+        QComboBox#memoryFilter::drop-down, QComboBox#memoryCategory::drop-down {{
+            border: none;
+        }}
+
+        QPushButton#memoryAddButton {{
+            background-color: {theme.accent};
+            color: white;
+            border: none;
+            border-radius: {metrics.radius_small}px;
+            padding: 6px 12px;
+            font-size: 12px;
+            font-family: {fonts.ui};
+        }}
+
+        QPushButton#memoryAddButton:hover {{
+            background-color: {theme.accent_hover};
+        }}
+
+        QListView#memoryFacts {{
+            background-color: {theme.background_secondary};
+            border: none;
+            padding: {metrics.padding_medium}px {metrics.padding_large}px;
+        }}
+
+        QListView#memoryFacts QScrollBar:vertical {{
+            background: {theme.background_secondary};
+            width: 8px;
+        }}
+
+        QListView#memoryFacts QScrollBar::handle:vertical {{
+            background: {theme.border};
+            border-radius: 4px;
+        }}
+
+        QPushButton#memoryClearButton {{
+            background-color: transparent;
+            color: {theme.text_disabled};
+            border: none;
+            font-size: 12px;
+            font-family: {fonts.ui};
+        }}
+
+        QPushButton#memoryClearButton:hover {{
+            color: {theme.error};
+        }}
+
+        QPushButton#memoryCloseButton {{
+            background-color: {theme.background_elevated};
+            color: {theme.text_primary};
+            border: 1px solid {theme.border};
+            border-radius: {metrics.radius_small}px;
+            padding: 8px 24px;
+            font-family: {fonts.ui};
+        }}
+
+        QPushButton#memoryCloseButton:hover {{
+            border-color: {theme.accent};
+        }}
+
+        QMenu#memoryFactMenu {{
+            background-color: {theme.background_elevated};
+            font-family: {fonts.ui};
+            border-radius: {metrics.radius_medium}px;
+            padding: {metrics.padding_small}px;
+        }}
+
+        QMenu#memoryFactMenu::item:selected {{
+            color: white;
+        }}
+
+        QLabel#memoryFieldLabel {{
+            color: {theme.text_secondary};
+            font-size: {metrics.font_normal}px;
+            font-family: {fonts.ui};
+        }}
+
+        QComboBox#memoryCategory {{
+            background-color: {theme.background_elevated};
+            color: {theme.text_primary};
+            border: 1px solid {theme.border};
+            border-radius: {metrics.radius_small}px;
+            padding: 6px 12px;
+            font-family: {fonts.ui};
+            min-width: 120px;
+        }}
+
+        QComboBox#memoryCategory QAbstractItemView {{
+            background-color: {theme.background_elevated};
+            color: {theme.text_primary};
+            selection-background-color: {theme.accent};
+        }}
+
+        QTextEdit#memoryContentInput {{
+            background-color: {theme.background_elevated};
+            color: {theme.text_primary};
+            border: 1px solid {theme.border};
+            border-radius: {metrics.radius_medium}px;
+            padding: {metrics.padding_small}px;
+            font-size: {metrics.font_normal}px;
+            font-family: {fonts.chat};
+        }}
+
+        QTextEdit#memoryContentInput:focus {{
+            border-color: {theme.accent};
+        }}
+
+        QPushButton#memoryCancelButton {{
+            background-color: transparent;
+            color: {theme.text_secondary};
+            border: 1px solid {theme.border};
+            border-radius: {metrics.radius_small}px;
+            padding: 8px 16px;
+            font-family: {fonts.ui};
+        }}
+
+        QPushButton#memoryCancelButton:hover {{
+            background-color: {theme.background_elevated};
+        }}
+
+        QPushButton#memorySaveButton {{
+            background-color: {theme.accent};
+            color: white;
+            border: none;
+            border-radius: {metrics.radius_small}px;
+            padding: 8px 16px;
+            font-family: {fonts.ui};
+            font-weight: 500;
+        }}
+
+        QPushButton#memorySaveButton:hover {{
+            background-color: {theme.accent_hover};
+        }}
+
+        /* === SCRATCHPAD === */
+        ScratchpadPanel, QFrame#scratchpadContent {{
+            background-color: {theme.background_tertiary};
+        }}
+
+        QFrame#scratchpadHeader {{
+            background-color: {theme.background_tertiary};
+            border-bottom: 1px solid {theme.border_subtle};
+        }}
+
+        QFrame#scratchpadHeader:hover {{
+            background-color: {theme.background_elevated};
+        }}
+
+        QFrame#scratchpadHeader QLabel {{
+            background-color: transparent;
+            font-family: {fonts.ui};
+        }}
+
+        QLabel#scratchpadIndicator {{
+            color: {theme.text_muted};
+            font-size: 10px;
+        }}
+
+        QLabel#scratchpadTitle {{
+            color: {theme.text_muted};
+            font-size: 10px;
+            font-weight: 600;
+            letter-spacing: 1px;
+        }}
+
+        QLabel#scratchpadVisibility {{
+            color: {theme.text_disabled};
+            font-size: 9px;
+        }}
+
+        QPushButton#scratchpadClearButton {{
+            background-color: transparent;
+            color: {theme.text_disabled};
+            border: none;
+            font-size: 10px;
+            font-family: {fonts.ui};
+            padding: 2px 6px;
+        }}
+
+        QPushButton#scratchpadClearButton:hover {{
+            color: {theme.text_muted};
+        }}
+
+        QTextEdit#scratchpadEditor {{
+            background-color: {theme.background_elevated};
+            color: {theme.text_primary};
+            border: 1px solid {theme.border_subtle};
+            border-radius: {metrics.radius_small}px;
+            padding: {metrics.padding_small}px;
+            font-size: {metrics.font_small}px;
+            font-family: {fonts.mono};
+        }}
+
+        QTextEdit#scratchpadEditor:focus {{
+            border-color: {theme.accent};
+        }}
+
+        /* === SIDE PANEL === */
+        SidePanel {{
+            background-color: {theme.background_secondary};
+            border-left: 1px solid {theme.border};
+        }}
+
+        QFrame#sideHeader {{
+            background-color: {theme.background_tertiary};
+            border-bottom: 1px solid {theme.border_subtle};
+        }}
+
+        QLabel#sideTitle {{
+            background-color: transparent;
+            color: {theme.text_muted};
+            font-size: 11px;
+            font-weight: 600;
+            letter-spacing: 1px;
+            font-family: {fonts.ui};
+        }}
+
+        QPushButton#sideMergeButton {{
+            background-color: transparent;
+            color: {theme.text_muted};
+            border: 1px solid {theme.border};
+            border-radius: {metrics.radius_small}px;
+            padding: 4px 12px;
+            font-size: 11px;
+            font-family: {fonts.ui};
+        }}
+
+        QPushButton#sideMergeButton:hover {{
+            background-color: {theme.background_elevated};
+            color: {theme.success};
+            border-color: {theme.success};
+        }}
+
+        QPushButton#sideCloseButton {{
+            background-color: transparent;
+            color: {theme.text_muted};
+            border: none;
+            font-size: 14px;
+        }}
+
+        QPushButton#sideCloseButton:hover {{
+            color: {theme.error};
+        }}
+
+        QListView#sideMessages {{
+            background-color: transparent;
+            border: none;
+            padding: {metrics.padding_medium}px;
+        }}
+
+        QListView#sideMessages QScrollBar:vertical {{
+            background: {theme.background_secondary};
+            width: 6px;
+        }}
+
+        QListView#sideMessages QScrollBar::handle:vertical {{
+            background: {theme.border};
+            border-radius: 3px;
+            min-height: 20px;
+        }}
+
+        SideInputPanel {{
+            background-color: {theme.background_tertiary};
+            border-top: 1px solid {theme.border_subtle};
+        }}
+
+        QPlainTextEdit#sideInput {{
+            background-color: {theme.background_elevated};
+            color: {theme.text_primary};
+            border: 1px solid {theme.border};
+            border-radius: {metrics.radius_medium}px;
+            padding: {metrics.padding_small}px;
+            font-size: {metrics.font_normal}px;
+            font-family: {fonts.chat};
+        }}
+
+        QPlainTextEdit#sideInput:focus {{
+            border: 2px solid {theme.accent};
+        }}
+
+        QPushButton#sideSendButton {{
+            background-color: {theme.accent};
+            color: white;
+            border: none;
+            border-radius: {metrics.radius_medium}px;
+            padding: {metrics.padding_medium}px {metrics.padding_large}px;
+            font-size: {metrics.font_normal}px;
+            font-family: {fonts.ui};
+            font-weight: 500;
+        }}
+
+        QPushButton#sideSendButton:hover {{
+            background-color: {theme.accent_hover};
+        }}
+
+        QPushButton#sideSendButton:disabled {{
+            background-color: {theme.text_disabled};
+        }}
+
+        /* === SIDEBAR === */
+        Sidebar {{
+            background-color: {theme.background_tertiary};
+            border-right: 1px solid {theme.border_subtle};
+        }}
+
+        ModelSelector, ContextBudgetIndicator, DocumentPanel, CruciblePanel {{
+            background-color: {theme.background_elevated};
+            border-radius: {metrics.radius_large}px;
+            border: 1px solid {theme.border_subtle};
+        }}
+
+        QLabel#sidebarSectionLabel {{
+            color: {theme.text_muted};
+            font-size: {metrics.font_small}px;
+            font-weight: 600;
+            font-family: {fonts.ui};
+            letter-spacing: 1px;
+            background: transparent;
+        }}
+
+        QProgressBar#contextBudgetBar {{
+            background-color: {theme.background};
+            border: 1px solid {theme.border};
+            border-radius: {metrics.radius_medium}px;
+        }}
+
+        QProgressBar#contextBudgetBar::chunk {{
+            border-radius: 5px;
+        }}
+
+        QProgressBar#contextBudgetBar[budget="green"]::chunk {{
+            background-color: {theme.budget_green};
+        }}
+
+        QProgressBar#contextBudgetBar[budget="yellow"]::chunk {{
+            background-color: {theme.budget_yellow};
+        }}
+
+        QProgressBar#contextBudgetBar[budget="orange"]::chunk {{
+            background-color: {theme.budget_orange};
+        }}
+
+        QProgressBar#contextBudgetBar[budget="red"]::chunk {{
+            background-color: {theme.budget_red};
+        }}
+
+        QLabel#contextTokenLabel {{
+            font-size: {metrics.font_small}px;
+            font-family: {fonts.mono};
+            font-weight: 500;
+            background: transparent;
+        }}
+
+        QLabel#contextTokenLabel[budget="green"] {{
+            color: {theme.budget_green};
+        }}
+
+        QLabel#contextTokenLabel[budget="yellow"] {{
+            color: {theme.budget_yellow};
+        }}
+
+        QLabel#contextTokenLabel[budget="orange"] {{
+            color: {theme.budget_orange};
+        }}
+
+        QLabel#contextTokenLabel[budget="red"] {{
+            color: {theme.budget_red};
+        }}
+
+        QPushButton#inspectorButton {{
+            border-radius: {metrics.radius_medium}px;
+            padding: {metrics.padding_medium}px;
+            font-size: {metrics.font_normal}px;
+            font-family: {fonts.ui};
+        }}
+
+        QPushButton#inspectorButton[inspectorActive="false"] {{
+            background-color: transparent;
+            color: {theme.text_muted};
+            border: 1px solid {theme.border_subtle};
+        }}
+
+        QPushButton#inspectorButton[inspectorActive="false"]:hover {{
+            background-color: {theme.background_elevated};
+            color: {theme.text_primary};
+            border-color: {theme.accent};
+        }}
+
+        QPushButton#inspectorButton[inspectorActive="true"] {{
+            background-color: {theme.accent};
+            color: white;
+            border: none;
+            font-weight: 500;
+        }}
+
+        QPushButton#inspectorButton[inspectorActive="true"]:hover {{
+            background-color: {theme.accent_hover};
+        }}
+
         /* === TEXT BROWSER === */
         QTextBrowser {{
             background-color: transparent;
@@ -1,12 +1,15 @@
 """Anthropic Claude adapter implementation."""
 
-from typing import List, Dict, Any, AsyncIterator
+from typing import List, Dict, Any, AsyncIterator, Optional
 
 import anthropic
 
 from .base_adapter import LLMAdapter, StreamChunk
 from ..config.settings import get_api_key
 
+# The API accepts at most four cache_control markers per request
+MAX_CACHE_BREAKPOINTS = 4
+
 
 class AnthropicAdapter(LLMAdapter):
     """Adapter for Anthropic Claude models.
@@ -48,6 +51,7 @@ class AnthropicAdapter(LLMAdapter):
         messages: List[Dict[str, Any]],
         system: str = "",
         max_tokens: int = 4096,
+        cache_breakpoints: Optional[List[int]] = None,
     ) -> AsyncIterator[StreamChunk]:
         """Stream a response from Claude.
 
@@ -55,6 +59,8 @@ class AnthropicAdapter(LLMAdapter):
             messages: List of message dicts with 'role' and 'content' keys
             system: System prompt
             max_tokens: Maximum tokens to generate
+            cache_breakpoints: Offsets into the system prompt that end
+                cacheable prefixes
 
         Yields:
             StreamChunk objects containing response text
@@ -63,7 +69,7 @@ class AnthropicAdapter(LLMAdapter):
             async with self._client.messages.stream(
                 model=self._model_id,
                 max_tokens=max_tokens,
-                system=system if system else anthropic.NOT_GIVEN,
+                system=self._build_system(system, cache_breakpoints),
                 messages=messages,
             ) as stream:
                 async for text in stream.text_stream:
@@ -82,6 +88,46 @@ class AnthropicAdapter(LLMAdapter):
         except anthropic.APIError as e:
             raise RuntimeError(f"Anthropic API error: {e}") from e
 
+    @staticmethod
+    def _build_system(
+        system: str,
+        cache_breakpoints: Optional[List[int]] = None,
+    ) -> Any:
+        """Build the system parameter, splitting it at cache breakpoints.
+
+        Each block ending at a breakpoint is marked for ephemeral prompt
+        caching, so repeated requests sharing that prefix reuse it.
+
+        Args:
+            system: System prompt
+            cache_breakpoints: Offsets into the system prompt
+
+        Returns:
+            System prompt string, list of text blocks, or NOT_GIVEN
+        """
+        if not system:
+            return anthropic.NOT_GIVEN
+        if not cache_breakpoints:
+            return system
+
+        blocks = []
+        start = 0
+        offsets = sorted({min(end, len(system)) for end in cache_breakpoints})
+        for end in offsets[-MAX_CACHE_BREAKPOINTS:]:
+            if end <= start:
+                continue
+            blocks.append({
+                "type": "text",
+                "text": system[start:end],
+                "cache_control": {"type": "ephemeral"},
+            })
+            start = end
+
+        if start < len(system):
+            blocks.append({"type": "text", "text": system[start:]})
+
+        return blocks
+
     async def complete(
         self,
         messages: List[Dict[str, Any]],
@@ -1,7 +1,7 @@
 """Base adapter interface for LLM providers."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, AsyncIterator
+from typing import List, Dict, Any, AsyncIterator, Optional
 from dataclasses import dataclass
 
 
@@ -27,6 +27,7 @@ class LLMAdapter(ABC):
         messages: List[Dict[str, Any]],
         system: str = "",
         max_tokens: int = 4096,
+        cache_breakpoints: Optional[List[int]] = None,
     ) -> AsyncIterator[StreamChunk]:
         """Stream a response from the LLM.
 
@@ -34,6 +35,8 @@ class LLMAdapter(ABC):
             messages: List of message dicts with 'role' and 'content' keys
             system: System prompt
             max_tokens: Maximum tokens to generate
+            cache_breakpoints: Offsets into the system prompt that end
+                stable, cacheable prefixes (providers may ignore these)
 
         Yields:
             StreamChunk objects containing response text
@@ -3,7 +3,7 @@
 Gab AI uses an OpenAI-compatible API.
 """
 
-from typing import List, Dict, Any, AsyncIterator
+from typing import List, Dict, Any, AsyncIterator, Optional
 
 from openai import AsyncOpenAI, APIError
 
@@ -59,6 +59,7 @@ class GabAIAdapter(LLMAdapter):
         messages: List[Dict[str, Any]],
         system: str = "",
         max_tokens: int = 4096,
+        cache_breakpoints: Optional[List[int]] = None,
     ) -> AsyncIterator[StreamChunk]:
         """Stream a response from Gab AI.
 
@@ -66,6 +67,8 @@ class GabAIAdapter(LLMAdapter):
             messages: List of message dicts with 'role' and 'content' keys
             system: System prompt
             max_tokens: Maximum tokens to generate
+            cache_breakpoints: Ignored; prompt prefixes are cached by the
+                provider without explicit markers
 
         Yields:
             StreamChunk objects containing response text
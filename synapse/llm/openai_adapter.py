@@ -1,6 +1,6 @@
 """OpenAI adapter implementation."""
 
-from typing import List, Dict, Any, AsyncIterator
+from typing import List, Dict, Any, AsyncIterator, Optional
 
 from openai import AsyncOpenAI, APIError
 
@@ -52,6 +52,7 @@ class OpenAIAdapter(LLMAdapter):
         messages: List[Dict[str, Any]],
         system: str = "",
         max_tokens: int = 4096,
+        cache_breakpoints: Optional[List[int]] = None,
     ) -> AsyncIterator[StreamChunk]:
         """Stream a response from OpenAI.
 
@@ -59,6 +60,8 @@ class OpenAIAdapter(LLMAdapter):
             messages: List of message dicts with 'role' and 'content' keys
             system: System prompt
             max_tokens: Maximum tokens to generate
+            cache_breakpoints: Ignored; prompt prefixes are cached by the
+                provider without explicit markers
 
         Yields:
             StreamChunk objects containing response text
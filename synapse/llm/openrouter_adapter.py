@@ -3,7 +3,7 @@
 OpenRouter uses an OpenAI-compatible API with a different base URL.
 """
 
-from typing import List, Dict, Any, AsyncIterator
+from typing import List, Dict, Any, AsyncIterator, Optional
 
 from openai import AsyncOpenAI, APIError
 
@@ -63,6 +63,7 @@ class OpenRouterAdapter(LLMAdapter):
         messages: List[Dict[str, Any]],
         system: str = "",
         max_tokens: int = 4096,
+        cache_breakpoints: Optional[List[int]] = None,
     ) -> AsyncIterator[StreamChunk]:
         """Stream a response from OpenRouter.
 
@@ -70,6 +71,8 @@ class OpenRouterAdapter(LLMAdapter):
             messages: List of message dicts with 'role' and 'content' keys
             system: System prompt
             max_tokens: Maximum tokens to generate
+            cache_breakpoints: Ignored; prompt prefixes are cached by the
+                provider without explicit markers
 
         Yields:
             StreamChunk objects containing response text
@@ -16,10 +16,16 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from ..storage import RagResult
 
-@dataclass
+
+@dataclass(slots=True)
 class Message:
-    """A single message in the conversation."""
+    """A single message in the conversation.
+
+    Slotted, since long conversations hold many of these for the
+    whole session.
+    """
 
     role: str  # "user" or "assistant"
     content: str
@@ -46,12 +52,23 @@ class ConversationHistory:
 
     messages: List[Message] = field(default_factory=list)
     _next_index: int = 0
+    _version: int = 0  # Bumped on every mutation
+    _dicts_cache: Optional[List[Dict[str, str]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _dicts_version: int = field(default=-1, repr=False, compare=False)
+
+    @property
+    def version(self) -> int:
+        """Get the mutation counter for change detection."""
+        return self._version
 
     def add_user_message(self, content: str) -> Message:
         """Add a user message to the history."""
         msg = Message(role="user", content=content, index=self._next_index)
         self.messages.append(msg)
         self._next_index += 1
+        self._version += 1
         return msg
 
     def add_assistant_message(self, content: str) -> Message:
@@ -59,6 +76,7 @@ class ConversationHistory:
         msg = Message(role="assistant", content=content, index=self._next_index)
         self.messages.append(msg)
         self._next_index += 1
+        self._version += 1
         return msg
 
     def to_api_format(self, include_summarized: bool = False) -> List[Dict[str, str]]:
@@ -74,6 +92,21 @@ class ConversationHistory:
             return [msg.to_dict() for msg in self.messages]
         return [msg.to_dict() for msg in self.messages if not msg.is_summarized]
 
+    def as_dicts(self) -> List[Dict[str, str]]:
+        """Get all messages as role/content dicts, cached until mutation.
+
+        The returned list is shared and replaced (never modified) when
+        history changes, so callers may keep it as a snapshot but must
+        not mutate it.
+
+        Returns:
+            List of message dicts including summarized messages
+        """
+        if self._dicts_version != self._version or self._dicts_cache is None:
+            self._dicts_cache = [msg.to_dict() for msg in self.messages]
+            self._dicts_version = self._version
+        return self._dicts_cache
+
     def get_active_messages(self) -> List[Message]:
         """Get only non-summarized messages."""
         return [msg for msg in self.messages if not msg.is_summarized]
@@ -96,6 +129,8 @@ class ConversationHistory:
             if msg.index <= up_to_index and not msg.is_summarized:
                 msg.is_summarized = True
                 count += 1
+        if count:
+            self._version += 1
         return count
 
     def remove_last_exchange(self) -> Optional[tuple]:
@@ -107,6 +142,8 @@ class ConversationHistory:
         if len(self.messages) < 2:
             return None
 
+        self._version += 1
+
         # Check if last two are user-assistant pair
         if (self.messages[-2].role == "user" and
                 self.messages[-1].role == "assistant"):
@@ -134,6 +171,7 @@ class ConversationHistory:
         """Clear all messages from history."""
         self.messages.clear()
         self._next_index = 0
+        self._version += 1
 
     def __len__(self) -> int:
         """Return number of messages."""
@@ -170,9 +208,19 @@ class PromptBuilder:
         self._memory_context: Optional[str] = None
         self._scratchpad_content: Optional[str] = None
         self._rag_context: Optional[str] = None
-        self._rag_chunks: List[Dict[str, Any]] = []  # For inspector
+        self._rag_chunks: List[RagResult] = []  # For inspector
         self._youtube_context: Optional[str] = None
         self._intent_hint: Optional[str] = None
+        self._context_version = 0  # Bumped whenever an injection changes
+
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever the assembled prompt may change.
+
+        Combines system prompt injections and conversation history, so
+        callers can skip rebuilding views of an unchanged prompt.
+        """
+        return self._context_version + self.history.version
 
     def set_summary(self, xml_summary: str) -> None:
         """Set the summary block to inject into prompts.
@@ -180,6 +228,7 @@ class PromptBuilder:
         Args:
             xml_summary: The XML summary content
         """
+        self._context_version += 1
         if xml_summary:
             self._summary_block = (
                 "PREVIOUS CONTEXT HAS BEEN SUMMARIZED AS FOLLOWS:\n\n"
@@ -191,6 +240,7 @@ class PromptBuilder:
 
     def clear_summary(self) -> None:
         """Clear the summary block."""
+        self._context_version += 1
         self._summary_block = None
 
     def set_memory_context(self, memory_block: str) -> None:
@@ -199,10 +249,12 @@ class PromptBuilder:
         Args:
             memory_block: The formatted memory context from UnifiedMemory
         """
+        self._context_version += 1
         self._memory_context = memory_block if memory_block else None
 
     def clear_memory_context(self) -> None:
         """Clear the memory context."""
+        self._context_version += 1
         self._memory_context = None
 
     def set_scratchpad(self, content: str) -> None:
@@ -211,6 +263,7 @@ class PromptBuilder:
         Args:
             content: The scratchpad text content
         """
+        self._context_version += 1
         if content and content.strip():
             self._scratchpad_content = (
                 "<Scratchpad>\n"
@@ -223,6 +276,7 @@ class PromptBuilder:
 
     def clear_scratchpad(self) -> None:
         """Clear the scratchpad content."""
+        self._context_version += 1
         self._scratchpad_content = None
 
     def set_intent_hint(self, hint: str) -> None:
@@ -231,11 +285,12 @@ class PromptBuilder:
         Args:
             hint: The intent hint string
         """
+        self._context_version += 1
         self._intent_hint = hint
 
     def set_rag_context(
         self,
-        chunks: List[Dict[str, Any]],
+        chunks: List[RagResult],
         query: str = "",
     ) -> None:
         """Set RAG context to inject into prompts.
@@ -244,9 +299,10 @@ class PromptBuilder:
         to the LLM in the system prompt, not to the user.
 
         Args:
-            chunks: List of chunk dicts with content and metadata
+            chunks: Retrieved chunks with content and metadata
             query: The query used for retrieval
         """
+        self._context_version += 1
         if not chunks:
             self._rag_context = None
             self._rag_chunks = []
@@ -263,22 +319,18 @@ class PromptBuilder:
         ]
 
         for i, chunk in enumerate(chunks):
-            source = chunk.get("source_file", "unknown")
-            section = chunk.get("page_or_section", "")
-            score = chunk.get("similarity_score", 0)
-            content = chunk.get("content", "")
-
-            lines.append(f"[Source {i + 1}: {source}")
-            if section:
-                lines.append(f" Section: {section}")
-            lines.append(f" Relevance: {score:.2f}]")
-            lines.append(content)
+            lines.append(f"[Source {i + 1}: {chunk.source_file or 'unknown'}")
+            if chunk.page_or_section:
+                lines.append(f" Section: {chunk.page_or_section}")
+            lines.append(f" Relevance: {chunk.similarity_score:.2f}]")
+            lines.append(chunk.content)
             lines.append("")
 
         self._rag_context = "\n".join(lines)
 
     def clear_rag_context(self) -> None:
         """Clear the RAG context."""
+        self._context_version += 1
         self._rag_context = None
         self._rag_chunks = []
 
@@ -288,17 +340,19 @@ class PromptBuilder:
         Args:
             context_block: The formatted YouTube transcript block
         """
+        self._context_version += 1
         self._youtube_context = context_block
 
     def clear_youtube_context(self) -> None:
         """Clear the YouTube context."""
+        self._context_version += 1
         self._youtube_context = None
 
-    def get_rag_chunks(self) -> List[Dict[str, Any]]:
+    def get_rag_chunks(self) -> List[RagResult]:
         """Get the current RAG chunks for inspection.
 
         Returns:
-            List of chunk dicts with content and metadata
+            List of retrieved chunks with content and metadata
         """
         return self._rag_chunks.copy()
 
@@ -491,6 +545,7 @@ class PromptBuilder:
 
     def clear_history(self) -> None:
         """Clear the conversation history, summary, and all context."""
+        self._context_version += 1
         self.history.clear()
         self._summary_block = None
         self._rag_context = None
@@ -9,6 +9,30 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
+# Patterns are compiled once at import; analyze_message runs on every turn
+_HEADING_RE = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+
+_QUESTION_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\?$',  # Ends with question mark
+        r'^(how|what|why|when|where|can|could|would|should|is|are|do|does)\s',
+        r'^explain\s',
+        r'^tell me about\s',
+        r'^describe\s',
+    )
+]
+
+_TOPIC_RES = [
+    re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+    for pattern in (
+        r'^##?\s+(.+)$',  # Markdown heading
+        r"^(?:let's|let me|i'll|i will)\s+(?:discuss|explain|cover|talk about)\s+(.+?)[\.\n]",
+        r'^(?:topic|section|part):\s*(.+)$',
+    )
+]
+
+
 @dataclass
 class TOCEntry:
     """A single entry in the table of contents."""
@@ -153,7 +177,7 @@ class TOCGenerator:
             Heading text or None
         """
         # Match markdown headings (# Heading)
-        match = re.search(r'^#+\s+(.+)$', message, re.MULTILINE)
+        match = _HEADING_RE.search(message)
         if match:
             return match.group(1).strip()[:50]
         return None
@@ -172,17 +196,9 @@ class TOCGenerator:
             return False
 
         # Check for question patterns
-        question_patterns = [
-            r'\?$',  # Ends with question mark
-            r'^(how|what|why|when|where|can|could|would|should|is|are|do|does)\s',
-            r'^explain\s',
-            r'^tell me about\s',
-            r'^describe\s',
-        ]
-
         message_lower = message.lower().strip()
-        for pattern in question_patterns:
-            if re.search(pattern, message_lower, re.IGNORECASE):
+        for pattern in _QUESTION_RES:
+            if pattern.search(message_lower):
                 return True
 
         return False
@@ -220,14 +236,8 @@ class TOCGenerator:
             Topic title or None
         """
         # Look for explicit topic markers
-        patterns = [
-            r'^##?\s+(.+)$',  # Markdown heading
-            r"^(?:let's|let me|i'll|i will)\s+(?:discuss|explain|cover|talk about)\s+(.+?)[\.\n]",
-            r'^(?:topic|section|part):\s*(.+)$',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, message, re.MULTILINE | re.IGNORECASE)
+        for pattern in _TOPIC_RES:
+            match = pattern.search(message)
             if match:
                 return match.group(1).strip()[:50]
 
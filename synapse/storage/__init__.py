@@ -9,7 +9,7 @@ This module handles all data storage including:
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, NamedTuple, Set
 from pathlib import Path
 from datetime import datetime
 import uuid
@@ -219,6 +219,21 @@ class RetrievalResult:
         )
 
 
+class RagResult(NamedTuple):
+    """A fused retrieval hit ready for prompt injection.
+
+    A lightweight tuple rather than a dict, since one is built per
+    retrieved chunk on every query.
+    """
+
+    chunk_id: str
+    content: str
+    source_file: str
+    page_or_section: str
+    similarity_score: float
+    combined_score: float
+
+
 @dataclass
 class ChunkMetadata:
     """Metadata for RAG injection into prompts."""
@@ -258,7 +273,7 @@ class SessionRecord:
     token_count: int = 0
     drift_events: int = 0
     waypoints: List[Dict[str, Any]] = field(default_factory=list)
-    artifacts_generated: List[str] = field(default_factory=list)
+    artifacts_generated: Set[str] = field(default_factory=set)
     messages: List[Dict[str, str]] = field(default_factory=list)
     # Fork tracking
     fork_source_session_id: Optional[str] = None
@@ -281,7 +296,7 @@ class SessionRecord:
         cls,
         source_session_id: str,
         fork_point_index: int,
-        messages: List[Dict[str, str]],
+        messages: Iterable[Dict[str, str]],
         models_used: Optional[List[str]] = None,
     ) -> "SessionRecord":
         """Create a new session record as a fork of another session.
@@ -289,7 +304,7 @@ class SessionRecord:
         Args:
             source_session_id: ID of the session being forked
             fork_point_index: Message index where fork occurs
-            messages: Messages up to the fork point
+            messages: Messages up to the fork point (consumed once)
             models_used: Models used in the source session
 
         Returns:
@@ -299,7 +314,7 @@ class SessionRecord:
             session_id=str(uuid.uuid4()),
             started_at=datetime.now(),
             models_used=models_used or [],
-            messages=messages,
+            messages=list(messages),
             fork_source_session_id=source_session_id,
             fork_point_index=fork_point_index,
         )
@@ -320,7 +335,7 @@ class SessionRecord:
             "token_count": self.token_count,
             "drift_events": self.drift_events,
             "waypoints": self.waypoints,
-            "artifacts_generated": self.artifacts_generated,
+            "artifacts_generated": sorted(self.artifacts_generated),
             "messages": self.messages,
         }
         if self.fork_source_session_id:
@@ -333,6 +348,7 @@ __all__ = [
     "Chunk",
     "ParentDocument",
     "RetrievalResult",
+    "RagResult",
     "ChunkMetadata",
     "SessionRecord",
 ]
@@ -4,17 +4,19 @@ Indexes conversation messages for semantic retrieval,
 enabling search across all past conversations.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 import json
+import time
 
 import tiktoken
 from openai import AsyncOpenAI
 
 from . import Chunk, ParentDocument, SessionRecord
 from .vector_store_client import FAISSVectorStore
-from ..config.settings import get_api_key
+from ..config.settings import get_api_key, settings
 
 
 # Max tokens for text-embedding-3-small (with safety margin)
@@ -129,6 +131,11 @@ class ConversationIndexer:
         # OpenAI client (lazy init)
         self._openai: Optional[AsyncOpenAI] = None
 
+        # Recent searches: (normalized query, k) -> (time, results)
+        self._search_cache: OrderedDict[
+            Tuple[str, int], Tuple[float, List[ConversationSearchResult]]
+        ] = OrderedDict()
+
     def _get_openai(self) -> AsyncOpenAI:
         """Get or create OpenAI client."""
         if self._openai is None:
@@ -221,6 +228,7 @@ class ConversationIndexer:
         # Index
         self._vector_store.add_parent(parent)
         self._vector_store.index(chunks, {"session_id": session.session_id})
+        self._search_cache.clear()
 
         # Save metadata
         self._save_metadata()
@@ -241,6 +249,13 @@ class ConversationIndexer:
         Returns:
             List of search results
         """
+        # Repeated queries skip the embedding call and vector search
+        key = (query.strip().lower(), k)
+        cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < settings.search_cache_ttl:
+            self._search_cache.move_to_end(key)
+            return list(cached[1])
+
         # Get query embedding
         openai = self._get_openai()
         response = await openai.embeddings.create(
@@ -280,7 +295,12 @@ class ConversationIndexer:
                 )
             )
 
-        return search_results
+        self._search_cache[key] = (time.monotonic(), search_results)
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > settings.search_cache_size:
+            self._search_cache.popitem(last=False)
+
+        return list(search_results)
 
     async def _embed_chunks(self, chunks: List[Chunk]) -> List[Chunk]:
         """Generate embeddings for chunks.
@@ -324,6 +344,7 @@ class ConversationIndexer:
         self._vector_store.clear()
         self._sessions.clear()
         self._message_contexts.clear()
+        self._search_cache.clear()
         self._save_metadata()
 
     def _save_metadata(self) -> None:
@@ -6,24 +6,33 @@ for later retrieval and analysis.
 Uses atomic writes and file locking for data integrity.
 """
 
+import gzip
 import json
 import os
 import sys
 import tempfile
 import shutil
-from typing import List, Optional, Iterator
+from typing import Dict, List, Optional, Iterator, TextIO
 from pathlib import Path
 from datetime import datetime
 from contextlib import contextmanager
 
 from . import SessionRecord
 
+# gzip level for snapshots; favours speed over ratio
+SNAPSHOT_COMPRESSLEVEL = 3
+
 
 class ConversationStore:
     """Manages conversation session archives.
 
     Stores sessions as JSONL (one JSON record per line) for
     efficient append-only writes and line-by-line reading.
+    Saving a session appends its latest record to the archive
+    file, which acts as a journal. compact() folds the journal
+    into a gzip-compressed snapshot alongside it and removes the
+    journal. Readers read the snapshot, then the journal, keeping
+    the last record per session ID.
 
     Uses atomic writes (temp file + rename) and file locking
     to prevent data corruption from concurrent access.
@@ -36,6 +45,7 @@ class ConversationStore:
             archive_path: Path to the JSONL archive file
         """
         self._archive_path = archive_path
+        self._snapshot_path = archive_path.with_name(archive_path.name + '.gz')
         self._archive_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock_path = archive_path.with_suffix('.lock')
 
@@ -79,9 +89,12 @@ class ConversationStore:
                     pass  # May be held by another process
 
     def _atomic_write(self, sessions: List[SessionRecord]) -> None:
-        """Atomically write sessions to archive file.
+        """Atomically write sessions to the snapshot and drop the journal.
 
-        Uses write-to-temp-then-rename pattern for crash safety.
+        Uses write-to-temp-then-rename pattern for crash safety. The
+        journal is only removed once the snapshot is in place; if that
+        fails, its records duplicate the snapshot's and the last-record
+        rule keeps reads correct.
 
         Args:
             sessions: Sessions to write
@@ -93,16 +106,19 @@ class ConversationStore:
         )
 
         try:
-            # Write to temp file
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                for session in sessions:
-                    json.dump(session.to_dict(), f)
-                    f.write('\n')
-                f.flush()
-                os.fsync(f.fileno())  # Ensure data is on disk
+            # Write compressed records to temp file
+            with os.fdopen(temp_fd, 'wb') as raw:
+                with gzip.GzipFile(
+                    fileobj=raw, mode='wb', compresslevel=SNAPSHOT_COMPRESSLEVEL
+                ) as f:
+                    for session in sessions:
+                        f.write(json.dumps(session.to_dict()).encode('utf-8'))
+                        f.write(b'\n')
+                raw.flush()
+                os.fsync(raw.fileno())  # Ensure data is on disk
 
             # Atomic rename (overwrites existing file)
-            shutil.move(temp_path, str(self._archive_path))
+            shutil.move(temp_path, str(self._snapshot_path))
 
         except Exception:
             # Clean up temp file on failure
@@ -112,10 +128,36 @@ class ConversationStore:
                 pass
             raise
 
+        # Journal records are now part of the snapshot
+        try:
+            self._archive_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _append_record(self, session: SessionRecord) -> None:
+        """Append one session record to the journal.
+
+        Args:
+            session: Session to append
+        """
+        with open(self._archive_path, 'a+b') as f:
+            # Start on a fresh line if a previous write was torn
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+
+            f.write(json.dumps(session.to_dict()).encode('utf-8'))
+            f.write(b'\n')
+            f.flush()
+            os.fsync(f.fileno())  # Ensure data is on disk
+
     def save_session(self, session: SessionRecord) -> None:
         """Save a session record to the archive.
 
-        Uses atomic write with file locking for thread safety.
+        Appends the record rather than rewriting the archive; any
+        earlier record for the same session is superseded until the
+        next compact().
 
         Args:
             session: The session record to save
@@ -125,22 +167,19 @@ class ConversationStore:
             session.ended_at = datetime.now()
 
         with self._file_lock():
-            # Load existing sessions
-            existing = list(self._iter_sessions_unlocked())
+            self._append_record(session)
 
-            # Update or append
-            found = False
-            for i, s in enumerate(existing):
-                if s.session_id == session.session_id:
-                    existing[i] = session
-                    found = True
-                    break
+    def compact(self) -> None:
+        """Fold the journal into the compressed snapshot.
 
-            if not found:
-                existing.append(session)
+        Superseded records are dropped. Does nothing if there is no
+        journal to fold.
+        """
+        with self._file_lock():
+            if not self._archive_path.exists():
+                return
 
-            # Atomic write
-            self._atomic_write(existing)
+            self._atomic_write(list(self._iter_sessions_unlocked()))
 
     def get_session(self, session_id: str) -> Optional[SessionRecord]:
         """Get a specific session by ID.
@@ -266,8 +305,9 @@ class ConversationStore:
     def clear(self) -> None:
         """Clear all session records."""
         with self._file_lock():
-            if self._archive_path.exists():
-                self._archive_path.unlink()
+            for path in (self._snapshot_path, self._archive_path):
+                if path.exists():
+                    path.unlink()
 
     def _iter_sessions(self) -> Iterator[SessionRecord]:
         """Iterate over all stored sessions (with locking).
@@ -284,27 +324,57 @@ class ConversationStore:
         Use only when lock is already held.
 
         Yields:
-            SessionRecord objects
+            Latest SessionRecord for each session ID
         """
-        if not self._archive_path.exists():
-            return
+        # Keyed by ID in first-saved order; later records replace earlier
+        sessions: Dict[str, SessionRecord] = {}
+        for session in self._iter_records_unlocked():
+            sessions[session.session_id] = session
+        yield from sessions.values()
 
-        with open(self._archive_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
+    def _iter_records_unlocked(self) -> Iterator[SessionRecord]:
+        """Iterate over every stored record, superseded or not.
 
-                try:
-                    data = json.loads(line)
-                    yield self._dict_to_session(data)
-                except json.JSONDecodeError as e:
-                    # Log but don't crash on malformed lines
-                    print(f"Warning: Skipping malformed line {line_num}: {e}")
-                    continue
-                except KeyError as e:
-                    print(f"Warning: Missing field in line {line_num}: {e}")
-                    continue
+        Use only when lock is already held.
+
+        Yields:
+            SessionRecord objects, snapshot first, then journal
+        """
+        if self._snapshot_path.exists():
+            try:
+                with gzip.open(self._snapshot_path, "rt", encoding="utf-8") as f:
+                    yield from self._parse_records(f)
+            except (OSError, EOFError) as e:
+                print(f"Warning: Unreadable session snapshot: {e}")
+
+        if self._archive_path.exists():
+            with open(self._archive_path, "r", encoding="utf-8") as f:
+                yield from self._parse_records(f)
+
+    def _parse_records(self, f: TextIO) -> Iterator[SessionRecord]:
+        """Parse JSONL session records from an open text file.
+
+        Args:
+            f: File positioned at the first record
+
+        Yields:
+            SessionRecord objects in file order
+        """
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                data = json.loads(line)
+                yield self._dict_to_session(data)
+            except json.JSONDecodeError as e:
+                # Log but don't crash on malformed lines
+                print(f"Warning: Skipping malformed line {line_num}: {e}")
+                continue
+            except KeyError as e:
+                print(f"Warning: Missing field in line {line_num}: {e}")
+                continue
 
     def _dict_to_session(self, data: dict) -> SessionRecord:
         """Convert dictionary to SessionRecord.
@@ -328,7 +398,7 @@ class ConversationStore:
             token_count=data.get("token_count", 0),
             drift_events=data.get("drift_events", 0),
             waypoints=data.get("waypoints", []),
-            artifacts_generated=data.get("artifacts_generated", []),
+            artifacts_generated=set(data.get("artifacts_generated", [])),
             messages=data.get("messages", []),
             fork_source_session_id=data.get("fork_source_session_id"),
             fork_point_index=data.get("fork_point_index"),
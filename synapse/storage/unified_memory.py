@@ -8,6 +8,7 @@ import json
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 import uuid
 
@@ -23,6 +24,11 @@ class MemoryFact:
     source_session: Optional[str] = None
     keywords: List[str] = field(default_factory=list)
 
+    @cached_property
+    def created_date(self) -> str:
+        """Creation date as YYYY-MM-DD, formatted once per fact."""
+        return self.created_at.strftime("%Y-%m-%d")
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
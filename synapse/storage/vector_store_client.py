@@ -91,6 +91,15 @@ class VectorStoreClient(ABC):
         """
         ...
 
+    @abstractmethod
+    def chunk_count(self) -> int:
+        """Get the number of indexed chunks.
+
+        Returns:
+            Number of chunks in the index
+        """
+        ...
+
     @abstractmethod
     def clear(self) -> None:
         """Clear all indexed data."""
@@ -302,6 +311,14 @@ class FAISSVectorStore(VectorStoreClient):
         """
         return list(self._parents.keys())
 
+    def chunk_count(self) -> int:
+        """Get the number of indexed chunks.
+
+        Returns:
+            Number of vectors in the FAISS index
+        """
+        return self._index.ntotal
+
     def clear(self) -> None:
         """Clear all indexed data."""
         self._index = self._faiss.IndexFlatIP(self._dimension)
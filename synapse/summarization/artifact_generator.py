@@ -6,7 +6,7 @@ Generates structured artifacts from conversation history:
 - Research index (key terms, entities, sources)
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Any, Iterable, Mapping, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
@@ -78,7 +78,7 @@ OUTPUT (markdown research index):"""
 
     async def generate_artifacts(
         self,
-        messages: List[Dict[str, str]],
+        messages: Iterable[Mapping[str, str]],
         adapter: LLMAdapter,
         generate_outline: bool = True,
         generate_decisions: bool = True,
@@ -87,7 +87,7 @@ OUTPUT (markdown research index):"""
         """Generate artifacts from conversation history.
 
         Args:
-            messages: List of message dicts with 'role' and 'content'
+            messages: Message mappings with 'role' and 'content' (iterated once)
             adapter: LLM adapter to use for generation
             generate_outline: Whether to generate conversation outline
             generate_decisions: Whether to generate decision log
@@ -159,21 +159,19 @@ OUTPUT (markdown research index):"""
         response = await adapter.complete(messages, system, max_tokens=2000)
         return response.strip()
 
-    def _format_conversation(self, messages: List[Dict[str, str]]) -> str:
+    def _format_conversation(self, messages: Iterable[Mapping[str, str]]) -> str:
         """Format conversation messages for prompts.
 
         Args:
-            messages: List of message dicts
+            messages: Message mappings (iterated once)
 
         Returns:
             Formatted conversation string
         """
-        lines = []
-        for msg in messages:
-            role = msg.get("role", "unknown").upper()
-            content = msg.get("content", "")
-            lines.append(f"[{role}]: {content}")
-        return "\n\n".join(lines)
+        return "\n\n".join(
+            f"[{msg.get('role', 'unknown').upper()}]: {msg.get('content', '')}"
+            for msg in messages
+        )
 
     def save_artifacts(
         self,
@@ -18,6 +18,10 @@ from dataclasses import dataclass
 from typing import List, Set, Optional
 
 
+# Compiled once at import; keyword extraction runs on every message
+_KEYWORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+
 @dataclass
 class DriftResult:
     """Result of drift analysis."""
@@ -138,7 +142,7 @@ class DriftDetector:
             Set of keywords
         """
         # Convert to lowercase and extract words
-        words = re.findall(r'\b[a-z]{3,}\b', text.lower())
+        words = _KEYWORD_RE.findall(text.lower())
 
         # Filter out stop words and keep meaningful terms
         keywords = {
@@ -653,7 +653,52 @@ class ChatPanel(QWidget):
         Returns:
             Message index
         """
-        bubble = MessageBubble("user", content, timestamp=timestamp)
+        bubble, message_index = self._create_message_bubble("user", content, timestamp)
+        self._add_bubble(bubble, align_right=True)
+        return message_index
+
+    def load_messages_bulk(self, messages: list[tuple[str, str]]) -> list[int]:
+        """Add completed messages in one batch, e.g. when restoring a session.
+
+        Bubbles are rendered directly rather than through the streaming
+        buffer, with container updates suspended until all are added.
+
+        Args:
+            messages: (role, content) pairs with role "user" or "assistant"
+
+        Returns:
+            Message indices, in the same order as the input
+        """
+        indices = []
+        self.messages_container.setUpdatesEnabled(False)
+        try:
+            for role, content in messages:
+                bubble, message_index = self._create_message_bubble(role, content)
+                self._add_bubble(bubble, align_right=role == "user", scroll=False)
+                indices.append(message_index)
+        finally:
+            self.messages_container.setUpdatesEnabled(True)
+
+        QTimer.singleShot(10, self._scroll_to_bottom)
+        return indices
+
+    def _create_message_bubble(
+        self,
+        role: str,
+        content: str = "",
+        timestamp: Optional[datetime] = None,
+    ) -> tuple[MessageBubble, int]:
+        """Create a bubble and assign it the next message index.
+
+        Args:
+            role: "user" or "assistant"
+            content: Initial message content
+            timestamp: Message timestamp (defaults to now)
+
+        Returns:
+            Tuple of (bubble, message index)
+        """
+        bubble = MessageBubble(role, content, timestamp=timestamp)
         message_index = self._next_message_index
         self._message_indices[bubble] = message_index
         self._next_message_index += 1
@@ -662,9 +707,7 @@ class ChatPanel(QWidget):
         bubble.fork_requested.connect(
             lambda idx=message_index: self.fork_requested.emit(idx)
         )
-
-        self._add_bubble(bubble, align_right=True)
-        return message_index
+        return bubble, message_index
 
     def start_assistant_message(
         self,
@@ -690,18 +733,9 @@ class ChatPanel(QWidget):
         self._streaming_buffer.clear()
         self._update_timer.start()
 
-        bubble = MessageBubble("assistant", "", timestamp=timestamp)
+        bubble, message_index = self._create_message_bubble("assistant", "", timestamp)
         bubble.show_typing()
         self._current_assistant_bubble = bubble
-        message_index = self._next_message_index
-        self._message_indices[bubble] = message_index
-        self._next_message_index += 1
-
-        # Connect fork signal
-        bubble.fork_requested.connect(
-            lambda idx=message_index: self.fork_requested.emit(idx)
-        )
-
         self._add_bubble(bubble)
         return message_index
 
@@ -820,37 +854,37 @@ class ChatPanel(QWidget):
         self._add_bubble(bubble)
         self._current_assistant_bubble = None
 
-    def _add_bubble(self, bubble: MessageBubble, align_right: bool = False) -> None:
+    def _add_bubble(
+        self,
+        bubble: MessageBubble,
+        align_right: bool = False,
+        scroll: bool = True,
+    ) -> None:
         """Add a bubble to the layout with optional alignment.
 
         Args:
             bubble: The message bubble to add
             align_right: Whether to align the bubble to the right (for user messages)
+            scroll: Whether to schedule a scroll to bottom
         """
-        # Remove the stretch if this is the first message
-        if not self._bubbles:
-            item = self.messages_layout.takeAt(0)
-            if item:
-                del item
-
         self._bubbles.append(bubble)
 
+        widget: QWidget = bubble
         if align_right:
             # Create a container to align user messages to the right
-            container = QWidget()
-            container_layout = QHBoxLayout(container)
+            widget = QWidget()
+            container_layout = QHBoxLayout(widget)
             container_layout.setContentsMargins(0, 0, 0, 0)
             container_layout.addStretch()
             container_layout.addWidget(bubble)
-            self.messages_layout.addWidget(container)
-        else:
-            self.messages_layout.addWidget(bubble)
 
-        # Add stretch after messages
-        self.messages_layout.addStretch()
+        # Insert above the single trailing stretch that keeps messages
+        # top-aligned, so the layout holds one item per message
+        self.messages_layout.insertWidget(self.messages_layout.count() - 1, widget)
 
         # Scroll to bottom with smooth delay
-        QTimer.singleShot(10, self._scroll_to_bottom)
+        if scroll:
+            QTimer.singleShot(10, self._scroll_to_bottom)
 
     def _scroll_to_bottom(self) -> None:
         """Scroll the chat to the bottom."""
@@ -886,8 +920,8 @@ class ChatPanel(QWidget):
         self._update_timer.stop()
         self._streaming_buffer.clear()
 
-        # Remove all widgets from layout
-        while self.messages_layout.count():
+        # Remove all bubbles, keeping the trailing stretch in place
+        while self.messages_layout.count() > 1:
             item = self.messages_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
@@ -900,9 +934,6 @@ class ChatPanel(QWidget):
         self._user_scrolled_up = False
         self._scroll_button.hide()
 
-        # Re-add the stretch
-        self.messages_layout.addStretch()
-
     def scroll_to_message(self, message_index: int) -> None:
         """Scroll to a specific message by its index.
 
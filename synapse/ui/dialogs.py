@@ -17,8 +17,12 @@ from PySide6.QtWidgets import (
     QWidget,
     QListWidget,
     QListWidgetItem,
+    QListView,
+    QTextEdit,
+    QLineEdit,
+    QApplication,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont
 
 if TYPE_CHECKING:
@@ -566,8 +570,6 @@ class NotificationToast(QLabel):
             x: X position
             y: Y position
         """
-        from PySide6.QtCore import QTimer
-
         self.move(x, y)
         self.show()
         self.raise_()
@@ -684,6 +686,10 @@ class SessionBrowserDialog(QDialog):
                 background-color: {theme.background_tertiary};
             }}
         """)
+        # Rows are all one line: skip per-row size queries, lay out in batches
+        self.session_list.setUniformItemSizes(True)
+        self.session_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.session_list.setBatchSize(64)
         self.session_list.itemDoubleClicked.connect(self._on_item_double_clicked)
         layout.addWidget(self.session_list, stretch=1)
 
@@ -727,16 +733,20 @@ class SessionBrowserDialog(QDialog):
             self.session_list.item(0).setFlags(Qt.ItemFlag.NoItemFlags)
             return
 
-        for session in self._sessions:
-            started = session.started_at.strftime("%Y-%m-%d %H:%M")
-            models = ", ".join(session.models_used[:2]) if session.models_used else "unknown"
-            if len(session.models_used) > 2:
-                models += f" +{len(session.models_used) - 2}"
-
-            item_text = f"{started} | {models} | {session.token_count:,} tokens"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, session.session_id)
-            self.session_list.addItem(item)
+        self.session_list.setUpdatesEnabled(False)
+        try:
+            for session in self._sessions:
+                started = session.started_at.strftime("%Y-%m-%d %H:%M")
+                models = ", ".join(session.models_used[:2]) if session.models_used else "unknown"
+                if len(session.models_used) > 2:
+                    models += f" +{len(session.models_used) - 2}"
+
+                item_text = f"{started} | {models} | {session.token_count:,} tokens"
+                item = QListWidgetItem(item_text)
+                item.setData(Qt.ItemDataRole.UserRole, session.session_id)
+                self.session_list.addItem(item)
+        finally:
+            self.session_list.setUpdatesEnabled(True)
 
     def _on_selection_changed(self) -> None:
         """Handle session selection change."""
@@ -754,7 +764,7 @@ class SessionBrowserDialog(QDialog):
             info += f"Duration: {session.started_at.strftime('%H:%M')} - {ended}\n"
             info += f"Drift events: {session.drift_events}"
             if session.artifacts_generated:
-                info += f" | Artifacts: {', '.join(session.artifacts_generated)}"
+                info += f" | Artifacts: {', '.join(sorted(session.artifacts_generated))}"
             self.info_label.setText(info)
 
     def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
@@ -921,7 +931,6 @@ class SummaryViewerDialog(QDialog):
         layout.addLayout(header_layout)
 
         # XML content display
-        from PySide6.QtWidgets import QTextEdit
         self.content_display = QTextEdit()
         self.content_display.setReadOnly(True)
         self.content_display.setStyleSheet(f"""
@@ -998,7 +1007,6 @@ class SummaryViewerDialog(QDialog):
 
     def _on_copy(self) -> None:
         """Copy XML to clipboard."""
-        from PySide6.QtWidgets import QApplication
         clipboard = QApplication.clipboard()
         clipboard.setText(self._summary_xml)
 
@@ -1007,7 +1015,6 @@ class SummaryViewerDialog(QDialog):
         if sender:
             original_text = sender.text()
             sender.setText("Copied!")
-            from PySide6.QtCore import QTimer
             QTimer.singleShot(1500, lambda: sender.setText(original_text))
 
     def _primary_button_style(self) -> str:
@@ -1131,7 +1138,6 @@ class ConversationSearchDialog(QDialog):
         layout.addWidget(title)
 
         # Search input
-        from PySide6.QtWidgets import QLineEdit
         search_layout = QHBoxLayout()
         search_layout.setSpacing(metrics.padding_small)
 
@@ -1201,12 +1207,15 @@ class ConversationSearchDialog(QDialog):
                 background-color: {theme.background_tertiary};
             }}
         """)
+        # Rows are all two lines: skip per-row size queries, lay out in batches
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.results_list.setBatchSize(64)
         self.results_list.itemDoubleClicked.connect(self._on_item_double_clicked)
         self.results_list.itemSelectionChanged.connect(self._on_selection_changed)
         layout.addWidget(self.results_list, stretch=1)
 
         # Preview area
-        from PySide6.QtWidgets import QTextEdit
         preview_label = QLabel("Preview")
         preview_label.setStyleSheet(f"""
             QLabel {{
@@ -1285,20 +1294,24 @@ class ConversationSearchDialog(QDialog):
 
         self.status_label.setText(f"Found {len(results)} result(s) for \"{query}\"")
 
-        for result in results:
-            # Format: [role] [date] - content preview
-            role_icon = "You" if result.role == "user" else "AI"
-            date_str = result.session_date.strftime("%b %d, %Y")
-            content_preview = result.message_content[:80].replace("\n", " ")
-            if len(result.message_content) > 80:
-                content_preview += "..."
-
-            score_pct = int(result.similarity_score * 100)
-            item_text = f"[{role_icon}] {date_str} ({score_pct}%)\n{content_preview}"
-
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, result)
-            self.results_list.addItem(item)
+        self.results_list.setUpdatesEnabled(False)
+        try:
+            for result in results:
+                # Format: [role] [date] - content preview
+                role_icon = "You" if result.role == "user" else "AI"
+                date_str = result.session_date.strftime("%b %d, %Y")
+                content_preview = result.message_content[:80].replace("\n", " ")
+                if len(result.message_content) > 80:
+                    content_preview += "..."
+
+                score_pct = int(result.similarity_score * 100)
+                item_text = f"[{role_icon}] {date_str} ({score_pct}%)\n{content_preview}"
+
+                item = QListWidgetItem(item_text)
+                item.setData(Qt.ItemDataRole.UserRole, result)
+                self.results_list.addItem(item)
+        finally:
+            self.results_list.setUpdatesEnabled(True)
 
     def _on_selection_changed(self) -> None:
         """Handle result selection change."""
@@ -1343,6 +1356,15 @@ class ConversationSearchDialog(QDialog):
         self.index_btn.setEnabled(False)
         self.index_requested.emit()
 
+    def set_index_progress(self, done: int, total: int) -> None:
+        """Update UI while sessions are being indexed.
+
+        Args:
+            done: Number of sessions processed so far
+            total: Number of sessions to process
+        """
+        self.index_btn.setText(f"Indexing {done}/{total}...")
+
     def set_index_complete(self, count: int) -> None:
         """Update UI after indexing completes.
 
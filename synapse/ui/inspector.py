@@ -20,8 +20,10 @@ from PySide6.QtWidgets import (
     QTreeWidgetItem,
 )
 from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QTextCursor
 
 from ..config.themes import theme, fonts, metrics
+from ..storage import RagResult
 
 
 class InspectorPanel(QWidget):
@@ -216,9 +218,22 @@ class InspectorPanel(QWidget):
         """
         self.prompt_view.setPlainText(prompt_text)
 
+    def append_prompt(self, text: str) -> None:
+        """Append text to the end of the prompt view.
+
+        Avoids re-laying out the whole document when only new
+        messages were added since the last update.
+
+        Args:
+            text: The text to append
+        """
+        cursor = QTextCursor(self.prompt_view.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+
     def update_rag_context(
         self,
-        chunks: List[Dict[str, Any]],
+        chunks: List[RagResult],
         query: str = "",
     ) -> None:
         """Update the RAG context view.
@@ -239,13 +254,13 @@ class InspectorPanel(QWidget):
         else:
             for i, chunk in enumerate(chunks):
                 lines.append(f"[Chunk {i + 1}]")
-                lines.append(f"  Source: {chunk.get('source_file', 'unknown')}")
-                lines.append(f"  Section: {chunk.get('page_or_section', '-')}")
-                lines.append(f"  Score: {chunk.get('similarity_score', 0):.3f}")
-                lines.append(f"  Content ({len(chunk.get('content', ''))} chars):")
+                lines.append(f"  Source: {chunk.source_file or 'unknown'}")
+                lines.append(f"  Section: {chunk.page_or_section or '-'}")
+                lines.append(f"  Score: {chunk.similarity_score:.3f}")
+                lines.append(f"  Content ({len(chunk.content)} chars):")
 
                 # Truncate long content
-                content = chunk.get("content", "")
+                content = chunk.content
                 if len(content) > 500:
                     content = content[:500] + "..."
                 lines.append(f"    {content}")
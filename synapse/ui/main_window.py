@@ -1,8 +1,10 @@
 """Main application window."""
 
 import asyncio
+import itertools
 import traceback
-from typing import Optional, List, Dict, Any, Set
+from contextlib import aclosing
+from typing import Optional, List, Dict, Set
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -17,7 +19,7 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QMessageBox,
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QCoreApplication
 from PySide6.QtGui import QShortcut, QKeySequence, QAction
 
 from .chat_panel import ChatPanel
@@ -29,14 +31,14 @@ from .memory_panel import MemoryPanel
 from .scratchpad_panel import ScratchpadPanel
 from .dialogs import ExitDialog, ExitAction, HelpDialog, AboutDialog, SessionBrowserDialog, NotificationToast, SummaryViewerDialog, ConversationSearchDialog
 from ..config.settings import settings
-from ..config.models import MODELS, get_model, get_available_models
+from ..config.models import MODELS, ModelConfig, get_model, get_available_models
 from ..config.themes import get_stylesheet, theme, fonts, metrics
 from ..config.persistence import persistence
 from ..orchestrator.prompt_builder import PromptBuilder
 from ..orchestrator.context_manager import ContextManager, ContextState
 from ..orchestrator.intent_tracker import IntentTracker
 from ..orchestrator.waypoint_manager import WaypointManager
-from ..orchestrator.toc_generator import TOCGenerator
+from ..orchestrator.toc_generator import TOCGenerator, TOCEntry
 from ..orchestrator.parallel_context import ParallelContextManager
 from ..summarization.summary_generator import SummaryGenerator
 from ..summarization.drift_detector import DriftDetector
@@ -53,8 +55,8 @@ from ..utils.youtube_handler import (
     fetch_transcript,
     estimate_transcript_tokens,
 )
-from ..utils.export import export_to_markdown, generate_export_filename
-from ..storage import SessionRecord
+from ..utils.export import generate_export_filename, save_markdown_export
+from ..storage import SessionRecord, RagResult
 from ..storage.vector_store_client import FAISSVectorStore
 from ..storage.bm25_client import BM25Client, reciprocal_rank_fusion
 from ..storage.document_indexer import DocumentIndexer
@@ -72,6 +74,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self._adapter: Optional[LLMAdapter] = None
         self._current_model_id: str = ""
+        self._current_model_config: Optional[ModelConfig] = None
         self._prompt_builder = PromptBuilder()
         self._token_counter: Optional[TokenCounter] = None
         self._context_manager: Optional[ContextManager] = None
@@ -83,13 +86,22 @@ class MainWindow(QMainWindow):
         self._artifact_generator = ArtifactGenerator()
         self._is_streaming = False
         self._interrupt_requested = False
+        # (prompt builder, version, usage) from the last completed stream
+        self._last_usage: Optional[tuple] = None
         self._summarization_in_progress = False
         self._focus_mode = False
 
+        # Exit flow: artifacts are generated asynchronously, then the
+        # window closes itself once they are done
+        self._exit_in_progress = False
+        self._close_ready = False
+
         # Async task tracking and concurrency control
         self._active_tasks: Set[asyncio.Task] = set()
         self._streaming_lock = asyncio.Lock()
-        self._summarization_lock = asyncio.Lock()
+        # Set while no summarization is running; streams wait on it
+        self._summarization_done = asyncio.Event()
+        self._summarization_done.set()
         self._indexing_lock = asyncio.Lock()
 
         # RAG components (initialized lazily when first document added)
@@ -101,11 +113,19 @@ class MainWindow(QMainWindow):
 
         # Inspector panel
         self._inspector_panel: Optional[InspectorPanel] = None
+        # (prompt builder, version, history version, system prompt,
+        # message count) last rendered; None forces a full rebuild
+        self._inspector_rendered: Optional[tuple] = None
+
+        # (prompt builder, version, context manager) last counted; the
+        # token count is only recomputed when this changes
+        self._token_count_key: Optional[tuple] = None
 
         # Side panel for quick questions
         self._side_panel: Optional[SidePanel] = None
         self._parallel_context = ParallelContextManager()
         self._side_streaming = False
+        self._side_task: Optional[asyncio.Task] = None
 
         # Session tracking
         self._session_record = SessionRecord.create()
@@ -121,6 +141,7 @@ class MainWindow(QMainWindow):
 
         # Conversation indexer for semantic search
         self._conversation_indexer: Optional[ConversationIndexer] = None
+        self._indexer_load_task: Optional[asyncio.Task] = None
         self._search_dialog: Optional[ConversationSearchDialog] = None
 
         # Crucible integration
@@ -128,6 +149,12 @@ class MainWindow(QMainWindow):
         self._crucible_router = "Auto"
         self._crucible_adapter = None  # Lazy initialization
 
+        # Coalesces preference writes from rapid UI toggles
+        self._prefs_flush_timer = QTimer(self)
+        self._prefs_flush_timer.setSingleShot(True)
+        self._prefs_flush_timer.setInterval(250)
+        self._prefs_flush_timer.timeout.connect(persistence.flush)
+
         self._setup_ui()
         self._setup_shortcuts()
         self._setup_default_model()
@@ -168,12 +195,18 @@ class MainWindow(QMainWindow):
         self.sidebar = Sidebar()
         self.sidebar.model_changed.connect(self._on_model_changed)
         self.sidebar.regenerate_requested.connect(self._on_regenerate_requested)
-        self.sidebar.document_added.connect(self._on_document_added)
+        # Queued: these handlers may lazily build RAG/Crucible components,
+        # so let the file dialog close or the checkbox repaint first
+        self.sidebar.document_added.connect(
+            self._on_document_added, Qt.ConnectionType.QueuedConnection
+        )
         self.sidebar.document_removed.connect(self._on_document_removed)
         self.sidebar.documents_cleared.connect(self._on_documents_cleared)
         self.sidebar.inspector_toggled.connect(self._on_inspector_toggled)
         self.sidebar.jump_to_message.connect(self._on_jump_to_message)
-        self.sidebar.crucible_toggled.connect(self._on_crucible_toggled)
+        self.sidebar.crucible_toggled.connect(
+            self._on_crucible_toggled, Qt.ConnectionType.QueuedConnection
+        )
         self.sidebar.crucible_router_changed.connect(self._on_crucible_router_changed)
         main_layout.addWidget(self.sidebar)
 
@@ -630,6 +663,7 @@ class MainWindow(QMainWindow):
 
             # Update current model
             self._current_model_id = model_id
+            self._current_model_config = model_config
 
             # Update UI
             self.model_label.setText(f"Model: {model_config.display_name}")
@@ -637,6 +671,11 @@ class MainWindow(QMainWindow):
                 f"Switched to {model_config.display_name}", 3000
             )
 
+            # Token summary in the inspector depends on the model, and the
+            # previous provider's usage doesn't apply to the new counter
+            self._inspector_rendered = None
+            self._last_usage = None
+
             # Update context display
             self._update_token_count()
 
@@ -659,9 +698,7 @@ class MainWindow(QMainWindow):
                 persistence.update_last_model(model_id)
 
                 # Show notification toast
-                model_config = get_model(model_id)
-                if model_config:
-                    self._show_model_notification(model_config.display_name)
+                self._show_model_notification(self._current_model_config.display_name)
 
     def _show_model_notification(self, model_name: str) -> None:
         """Show a notification toast for model switch.
@@ -786,37 +823,42 @@ class MainWindow(QMainWindow):
         Args:
             message: The user's message
         """
-        # Add user message to UI and history
-        user_msg_index = self.chat_panel.add_user_message(message)
-        self._prompt_builder.add_user_message(message)
-
-        # Analyze message for TOC entry
-        toc_entry = self._toc_generator.analyze_message(message, "user", user_msg_index)
-        if toc_entry:
-            self.sidebar.add_toc_entry(toc_entry)
-        self.sidebar.set_toc_current_index(user_msg_index)
-
-        # Update memory context (filter by current message for relevance)
-        self._update_memory_context(message)
-
-        # Update scratchpad context
-        self._update_scratchpad_context()
-
-        # Update context manager with message count
-        if self._context_manager:
-            self._context_manager.update_message_counts(
-                self._prompt_builder.get_message_count(),
-                len(self._prompt_builder.history.get_summarized_messages())
-            )
+        # Coalesce the per-turn widget updates below into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Add user message to UI and history
+            user_msg_index = self.chat_panel.add_user_message(message)
+            self._prompt_builder.add_user_message(message)
+
+            # Analyze message for TOC entry
+            toc_entry = self._toc_generator.analyze_message(message, "user", user_msg_index)
+            if toc_entry:
+                self.sidebar.add_toc_entry(toc_entry)
+            self.sidebar.set_toc_current_index(user_msg_index)
+
+            # Update memory context (filter by current message for relevance)
+            self._update_memory_context(message)
+
+            # Update scratchpad context
+            self._update_scratchpad_context()
+
+            # Update context manager with message count
+            if self._context_manager:
+                self._context_manager.update_message_counts(
+                    self._prompt_builder.get_message_count(),
+                    len(self._prompt_builder.history.get_summarized_messages())
+                )
 
-        # Update token count (this may trigger summarization)
-        self._update_token_count()
+            # Update token count (this may trigger summarization)
+            self._update_token_count()
 
-        # Start streaming response
-        self._is_streaming = True
-        self.input_panel.set_enabled(False)
-        self.sidebar.set_regenerate_enabled(False)
-        assistant_msg_index = self.chat_panel.start_assistant_message()
+            # Start streaming response
+            self._is_streaming = True
+            self.input_panel.set_enabled(False)
+            self.sidebar.set_regenerate_enabled(False)
+            assistant_msg_index = self.chat_panel.start_assistant_message()
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Route through Crucible or standard LLM
         if self._crucible_enabled and self._crucible_adapter:
@@ -839,13 +881,12 @@ class MainWindow(QMainWindow):
         # Acquire streaming lock to prevent concurrent operations
         async with self._streaming_lock:
             # Check if summarization is in progress
-            if self._summarization_lock.locked():
+            if not self._summarization_done.is_set():
                 self.status_bar.showMessage(
                     "Waiting for summarization to complete...", 2000
                 )
                 # Wait for summarization to finish
-                async with self._summarization_lock:
-                    pass
+                await self._summarization_done.wait()
 
             await self._stream_response_with_rag_impl(user_message, assistant_msg_index)
 
@@ -871,8 +912,9 @@ class MainWindow(QMainWindow):
         else:
             self._prompt_builder.clear_rag_context()
 
-        # Update inspector
-        self._update_inspector()
+        # Update inspector (skip entirely while hidden)
+        if self._inspector_panel and self._inspector_panel.isVisible():
+            self._update_inspector()
 
         # Stream the response
         await self._stream_response(assistant_msg_index)
@@ -886,28 +928,35 @@ class MainWindow(QMainWindow):
         if not self._adapter:
             return
 
-        full_response = ""
+        response_parts: List[str] = []
+        usage = None
 
         try:
             messages = self._prompt_builder.build_messages()
             system = self._prompt_builder.get_system_prompt()
 
-            async for chunk in self._adapter.stream(messages, system):
-                # Check for interrupt request
-                if self._interrupt_requested:
-                    break
+            # aclosing() ends the provider stream as soon as we stop
+            # reading, so an interrupt stops token generation right away
+            async with aclosing(self._adapter.stream(messages, system)) as stream:
+                async for chunk in stream:
+                    # Check for interrupt request
+                    if self._interrupt_requested:
+                        break
+
+                    if chunk.text:
+                        response_parts.append(chunk.text)
+                        self.chat_panel.append_to_assistant_message(chunk.text)
+
+                    if chunk.is_final and chunk.usage:
+                        usage = chunk.usage
+                        # Update status with actual usage
+                        self.status_bar.showMessage(
+                            f"Input: {chunk.usage['input_tokens']} | "
+                            f"Output: {chunk.usage['output_tokens']} tokens",
+                            5000
+                        )
 
-                if chunk.text:
-                    full_response += chunk.text
-                    self.chat_panel.append_to_assistant_message(chunk.text)
-
-                if chunk.is_final and chunk.usage:
-                    # Update status with actual usage
-                    self.status_bar.showMessage(
-                        f"Input: {chunk.usage['input_tokens']} | "
-                        f"Output: {chunk.usage['output_tokens']} tokens",
-                        5000
-                    )
+            full_response = "".join(response_parts)
 
             # Check if we were interrupted
             if self._interrupt_requested:
@@ -930,6 +979,13 @@ class MainWindow(QMainWindow):
                 self._prompt_builder.add_assistant_message(full_response)
                 self.chat_panel.finish_assistant_message()
 
+                # Provider usage covers exactly this prompt plus the reply;
+                # some providers only report output tokens, so require both
+                if usage and usage.get("input_tokens"):
+                    self._last_usage = (
+                        self._prompt_builder, self._prompt_builder.version, usage
+                    )
+
                 # Analyze completed response for TOC entry
                 if assistant_msg_index >= 0:
                     toc_entry = self._toc_generator.analyze_message(
@@ -1025,76 +1081,93 @@ class MainWindow(QMainWindow):
         if self._streaming_lock.locked():
             return
 
-        async with self._summarization_lock:
-            self._summarization_in_progress = True
+        self._summarization_in_progress = True
+        self._summarization_done.clear()
 
-            try:
-                # Get waypoint boundary if any
-                boundary = self._waypoint_manager.get_summarization_boundary(
-                    self._prompt_builder.get_message_count()
-                )
+        try:
+            # Get waypoint boundary if any
+            boundary = self._waypoint_manager.get_summarization_boundary(
+                self._prompt_builder.get_message_count()
+            )
 
-                # Get messages to summarize
-                messages = self._prompt_builder.get_messages_for_summarization(boundary)
-                if not messages:
-                    return
+            # Get messages to summarize
+            messages = self._prompt_builder.get_messages_for_summarization(boundary)
+            if not messages:
+                return
 
-                # Get the highest index being summarized
-                highest_index = self._prompt_builder.get_highest_summarizable_index(boundary)
-                if highest_index < 0:
-                    return
+            # Get the highest index being summarized
+            highest_index = self._prompt_builder.get_highest_summarizable_index(boundary)
+            if highest_index < 0:
+                return
 
-                # Generate summary
-                result = await self._summary_generator.generate_summary(
-                    messages=messages,
-                    adapter=self._adapter,
-                    intent_mode=self._intent_tracker.current_mode,
-                )
+            # Generate summary
+            result = await self._summary_generator.generate_summary(
+                messages=messages,
+                adapter=self._adapter,
+                intent_mode=self._intent_tracker.current_mode,
+            )
 
-                if result.success:
-                    # Set summary in prompt builder
-                    self._prompt_builder.set_summary(result.xml_summary)
+            if result.success:
+                # Set summary in prompt builder
+                self._prompt_builder.set_summary(result.xml_summary)
 
-                    # Mark messages as summarized
-                    self._prompt_builder.mark_messages_summarized(highest_index)
+                # Mark messages as summarized
+                self._prompt_builder.mark_messages_summarized(highest_index)
 
-                    # Update context manager
-                    if self._context_manager:
-                        self._context_manager.mark_messages_summarized(
-                            len(self._prompt_builder.history.get_summarized_messages())
-                        )
-                        self._context_manager.clear_drift_signal()
+                # Update context manager
+                if self._context_manager:
+                    self._context_manager.mark_messages_summarized(
+                        len(self._prompt_builder.history.get_summarized_messages())
+                    )
+                    self._context_manager.clear_drift_signal()
 
-                    # Clear waypoints that were summarized past
-                    self._waypoint_manager.clear_summarized_waypoints(highest_index)
+                # Clear waypoints that were summarized past
+                self._waypoint_manager.clear_summarized_waypoints(highest_index)
 
-                    # Reset drift detector with remaining messages
-                    active_messages = self._prompt_builder.history.get_active_messages()
-                    self._drift_detector.force_recalculate_centroid(
-                        [m.content for m in active_messages]
-                    )
+                # Reset drift detector with remaining messages
+                active_messages = self._prompt_builder.history.get_active_messages()
+                self._drift_detector.force_recalculate_centroid(
+                    [m.content for m in active_messages]
+                )
 
-                    # Update token count
-                    self._update_token_count()
+                # Update token count
+                self._update_token_count()
 
-                    # Silent - user should not see interruption
+                # Silent - user should not see interruption
 
-            except Exception as e:
-                # Log error but don't interrupt user
-                self.status_bar.showMessage(f"Summarization failed: {e}", 3000)
+        except Exception as e:
+            # Log error but don't interrupt user
+            self.status_bar.showMessage(f"Summarization failed: {e}", 3000)
 
-            finally:
-                self._summarization_in_progress = False
+        finally:
+            self._summarization_in_progress = False
+            self._summarization_done.set()
 
     def _update_token_count(self) -> None:
         """Update the token count display and check thresholds."""
         if not self._token_counter or not self._context_manager:
             return
 
-        # Count tokens for active messages only
-        messages = self._prompt_builder.build_messages()
-        system = self._prompt_builder.get_system_prompt()
-        total_tokens = self._token_counter.count_prompt(system, messages)
+        # Skip if neither the prompt nor the model changed since last count
+        key = (self._prompt_builder, self._prompt_builder.version, self._context_manager)
+        if key == self._token_count_key:
+            return
+        self._token_count_key = key
+
+        # Reuse the provider's usage if nothing changed since the last
+        # stream; otherwise count tokens for active messages only
+        last = self._last_usage
+        if (last and last[0] is self._prompt_builder
+                and last[1] == self._prompt_builder.version):
+            usage = last[2]
+            total_tokens = usage["input_tokens"] + usage["output_tokens"]
+        else:
+            messages = self._prompt_builder.build_messages()
+            system = self._prompt_builder.get_system_prompt()
+            total_tokens = self._token_counter.count_prompt(system, messages)
+
+        # Keep the session record current so saving never re-tokenizes
+        self._session_record.token_count = total_tokens
 
         # Update displays
         self.token_label.setText(f"Tokens: {total_tokens:,}")
@@ -1204,15 +1277,34 @@ class MainWindow(QMainWindow):
             doc_id: Document ID to remove
         """
         if self._document_indexer:
-            self._document_indexer.delete_document(doc_id)
-            self.status_bar.showMessage("Document removed", 2000)
+            self._create_task(self._remove_document(doc_id), name="document_remove")
+
+    async def _remove_document(self, doc_id: str) -> None:
+        """Delete a document from the indexes off the event loop.
+
+        Uses indexing lock so a removal never races a query or indexing run.
+
+        Args:
+            doc_id: Document ID to remove
+        """
+        async with self._indexing_lock:
+            await asyncio.to_thread(self._document_indexer.delete_document, doc_id)
+        self.status_bar.showMessage("Document removed", 2000)
 
     def _on_documents_cleared(self) -> None:
         """Handle clear all documents signal."""
-        if self._vector_store:
-            self._vector_store.clear()
-        if self._bm25_client:
-            self._bm25_client.clear()
+        self._create_task(self._clear_documents(), name="documents_clear")
+
+    async def _clear_documents(self) -> None:
+        """Clear all indexed documents off the event loop.
+
+        Uses indexing lock so a clear never races a query or indexing run.
+        """
+        async with self._indexing_lock:
+            if self._vector_store:
+                await asyncio.to_thread(self._vector_store.clear)
+            if self._bm25_client:
+                await asyncio.to_thread(self._bm25_client.clear)
         self.status_bar.showMessage("All documents cleared", 2000)
 
     def _on_inspector_toggled(self, visible: bool) -> None:
@@ -1256,19 +1348,19 @@ class MainWindow(QMainWindow):
 
         # Get messages up to and including the fork point
         all_messages = self._prompt_builder.history.messages
-        if message_index >= len(all_messages):
+        if not all_messages:
+            self.status_bar.showMessage("No messages to fork", 3000)
+            return
+        if not 0 <= message_index < len(all_messages):
             self.status_bar.showMessage("Cannot fork from this message", 3000)
             return
 
-        # Messages to include in fork (up to and including fork point)
-        fork_messages = [
+        # Messages to include in fork (up to and including fork point);
+        # consumed once by create_fork, so no intermediate slice or list
+        fork_messages = (
             {"role": msg.role, "content": msg.content}
-            for msg in all_messages[: message_index + 1]
-        ]
-
-        if not fork_messages:
-            self.status_bar.showMessage("No messages to fork", 3000)
-            return
+            for msg in itertools.islice(all_messages, message_index + 1)
+        )
 
         # Save current session first
         current_session_id = self._session_record.session_id
@@ -1313,26 +1405,7 @@ class MainWindow(QMainWindow):
         self.chat_panel.add_system_message(f"🔀 {fork_msg}")
 
         # Load messages
-        for msg in session.messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-
-            if role == "user":
-                msg_index = self.chat_panel.add_user_message(content)
-                self._prompt_builder.add_user_message(content)
-                # Analyze for TOC entry
-                toc_entry = self._toc_generator.analyze_message(content, "user", msg_index)
-                if toc_entry:
-                    self.sidebar.add_toc_entry(toc_entry)
-            elif role == "assistant":
-                msg_index = self.chat_panel.start_assistant_message()
-                self.chat_panel.append_to_assistant_message(content)
-                self.chat_panel.finish_assistant_message()
-                self._prompt_builder.add_assistant_message(content)
-                # Analyze for TOC entry
-                toc_entry = self._toc_generator.analyze_message(content, "assistant", msg_index)
-                if toc_entry:
-                    self.sidebar.add_toc_entry(toc_entry)
+        self._restore_messages(session.messages)
 
         # Update context display
         self._update_token_count()
@@ -1345,7 +1418,39 @@ class MainWindow(QMainWindow):
         # Focus input for continuation
         self.input_panel.focus_input()
 
-    async def _perform_rag_retrieval(self, query: str) -> List[Dict[str, Any]]:
+    def _restore_messages(self, messages: List[Dict[str, str]]) -> None:
+        """Restore saved messages into history, chat panel and TOC.
+
+        Bubbles are added in a single batch rather than one streamed
+        message at a time.
+
+        Args:
+            messages: Saved role/content message dicts
+        """
+        replay = []
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+
+            if role == "user":
+                self._prompt_builder.add_user_message(content)
+            elif role == "assistant":
+                self._prompt_builder.add_assistant_message(content)
+            else:
+                continue
+            replay.append((role, content))
+
+        indices = self.chat_panel.load_messages_bulk(replay)
+
+        # Analyze for TOC entries
+        toc_batch: List[TOCEntry] = []
+        for (role, content), msg_index in zip(replay, indices):
+            toc_entry = self._toc_generator.analyze_message(content, role, msg_index)
+            if toc_entry:
+                toc_batch.append(toc_entry)
+        self.sidebar.add_toc_entries_bulk(toc_batch)
+
+    async def _perform_rag_retrieval(self, query: str) -> List[RagResult]:
         """Perform hybrid RAG retrieval for a query.
 
         Uses indexing lock to prevent conflicts with document indexing.
@@ -1367,15 +1472,30 @@ class MainWindow(QMainWindow):
                 # Get query embedding
                 query_embedding = await self._document_indexer.get_query_embedding(query)
 
-                # Vector search
-                vector_results = self._vector_store.query(
-                    query_embedding, k=settings.rag_search_k
-                )
-
-                # BM25 search
-                bm25_results = self._bm25_client.query(
-                    query, k=settings.rag_search_k
-                )
+                if self._vector_store.chunk_count() < settings.rag_small_corpus_chunks:
+                    # Small corpus: a flat search finishes faster than the
+                    # thread hand-off would, so run both searches inline
+                    vector_results = self._vector_store.query(
+                        query_embedding, k=settings.rag_search_k
+                    )
+                    bm25_results = self._bm25_client.query(
+                        query, k=settings.rag_search_k
+                    )
+                else:
+                    # Vector and BM25 search run concurrently in worker threads
+                    # so the Qt loop keeps painting stream chunks meanwhile
+                    vector_results, bm25_results = await asyncio.gather(
+                        asyncio.to_thread(
+                            self._vector_store.query,
+                            query_embedding,
+                            k=settings.rag_search_k,
+                        ),
+                        asyncio.to_thread(
+                            self._bm25_client.query,
+                            query,
+                            k=settings.rag_search_k,
+                        ),
+                    )
 
                 # Reciprocal rank fusion
                 chunks_dict = {c.chunk.chunk_id: c.chunk for c in vector_results}
@@ -1389,39 +1509,37 @@ class MainWindow(QMainWindow):
                 )
 
                 # Apply blacklist filter
+                vector_by_id = {r.chunk.chunk_id: r for r in vector_results}
                 results = []
                 for chunk_id, score in fused[:settings.rag_retrieval_k]:
                     # Find the vector result for this chunk
-                    vector_result = next(
-                        (r for r in vector_results if r.chunk.chunk_id == chunk_id),
-                        None
-                    )
+                    vector_result = vector_by_id.get(chunk_id)
 
                     if vector_result:
                         # Check blacklist
                         filtered = self._retrieval_blacklist.filter_results([vector_result])
                         if filtered:
                             result = filtered[0]
-                            results.append({
-                                "chunk_id": result.chunk.chunk_id,
-                                "content": result.chunk.content,
-                                "source_file": result.chunk.source_file,
-                                "page_or_section": result.chunk.page_or_section,
-                                "similarity_score": result.similarity_score,
-                                "combined_score": score,
-                            })
+                            results.append(RagResult(
+                                result.chunk.chunk_id,
+                                result.chunk.content,
+                                result.chunk.source_file,
+                                result.chunk.page_or_section,
+                                result.similarity_score,
+                                score,
+                            ))
                     else:
                         # Chunk only from BM25, get it directly
                         chunk = self._bm25_client.get_chunk(chunk_id)
                         if chunk:
-                            results.append({
-                                "chunk_id": chunk.chunk_id,
-                                "content": chunk.content,
-                                "source_file": chunk.source_file,
-                                "page_or_section": chunk.page_or_section,
-                                "similarity_score": 0.0,
-                                "combined_score": score,
-                            })
+                            results.append(RagResult(
+                                chunk.chunk_id,
+                                chunk.content,
+                                chunk.source_file,
+                                chunk.page_or_section,
+                                0.0,
+                                score,
+                            ))
 
                 return results
 
@@ -1434,21 +1552,50 @@ class MainWindow(QMainWindow):
         if not self._inspector_panel or not self._inspector_panel.isVisible():
             return
 
-        # Update prompt view
-        system = self._prompt_builder.get_system_prompt()
-        messages = self._prompt_builder.build_messages()
-        prompt_text = f"=== SYSTEM PROMPT ===\n{system}\n\n"
-        prompt_text += "=== MESSAGES ===\n"
-        for msg in messages:
-            prompt_text += f"[{msg['role'].upper()}]\n{msg['content']}\n\n"
-        self._inspector_panel.update_prompt(prompt_text)
+        # Update prompt view only if the prompt changed since the last render
+        builder = self._prompt_builder
+        history_version = builder.history.version
+        prompt_dirty = (
+            self._inspector_rendered is None
+            or self._inspector_rendered[0] is not builder
+            or self._inspector_rendered[1] != builder.version
+        )
+        if prompt_dirty:
+            system = builder.get_system_prompt()
+            messages = builder.build_messages()
+
+            # Every history mutation bumps its version by one, and only
+            # appends grow the message list, so equal deltas mean the
+            # rendered text is still a valid prefix
+            appended = False
+            if self._inspector_rendered and self._inspector_rendered[0] is builder:
+                _, _, last_history_version, last_system, last_count = self._inspector_rendered
+                added = len(messages) - last_count
+                appended = (
+                    added > 0
+                    and added == history_version - last_history_version
+                    and system == last_system
+                )
+
+            if appended:
+                self._inspector_panel.append_prompt(
+                    self._format_inspector_messages(messages[last_count:])
+                )
+            else:
+                self._inspector_panel.update_prompt(
+                    f"=== SYSTEM PROMPT ===\n{system}\n\n=== MESSAGES ===\n"
+                    + self._format_inspector_messages(messages)
+                )
+            self._inspector_rendered = (
+                builder, builder.version, history_version, system, len(messages)
+            )
 
         # Update RAG context
         rag_chunks = self._prompt_builder.get_rag_chunks()
         self._inspector_panel.update_rag_context(rag_chunks)
 
         # Update metadata
-        model_config = get_model(self._current_model_id)
+        model_config = self._current_model_config
         metadata = {
             "model": {
                 "id": self._current_model_id,
@@ -1467,29 +1614,54 @@ class MainWindow(QMainWindow):
         self._inspector_panel.update_metadata(metadata)
 
         # Update token summary
-        if self._token_counter and self._context_manager:
+        if prompt_dirty and self._token_counter and self._context_manager:
             total = self._token_counter.count_prompt(system, messages)
             self._inspector_panel.update_token_summary(
                 total=total,
                 context_window=self._context_manager.context_window,
             )
 
+    def _format_inspector_messages(self, messages: List[Dict[str, str]]) -> str:
+        """Format messages for the inspector prompt view.
+
+        Args:
+            messages: Message dicts with 'role' and 'content' keys
+
+        Returns:
+            The formatted text block
+        """
+        return "".join(
+            f"[{msg['role'].upper()}]\n{msg['content']}\n\n" for msg in messages
+        )
+
     def closeEvent(self, event) -> None:
         """Handle window close event - save session and window state."""
+        # Second pass, after exit artifacts finished generating
+        if self._close_ready:
+            self._conversation_store.compact()
+            super().closeEvent(event)
+            return
+
+        # Ignore repeated close requests while artifacts are generating
+        if self._exit_in_progress:
+            event.ignore()
+            return
+
         # Cancel all active async tasks
         if self._active_tasks:
             # Cancel tasks synchronously
             for task in list(self._active_tasks):
                 task.cancel()
             # Brief pause to let cancellations process
-            from PySide6.QtCore import QCoreApplication
             QCoreApplication.processEvents()
 
         # Stop any streaming timers
         if hasattr(self, 'chat_panel') and hasattr(self.chat_panel, '_update_timer'):
             self.chat_panel._update_timer.stop()
 
-        # Save window state
+        # Write any deferred preference changes, then window state
+        self._prefs_flush_timer.stop()
+        persistence.flush()
         self._save_window_state()
 
         # Only show exit dialog if there was actual conversation
@@ -1517,13 +1689,23 @@ class MainWindow(QMainWindow):
             # Save artifact preferences
             persistence.update_artifact_options(outline, decisions, research)
 
-            if action == ExitAction.SUMMARIZE_EXIT:
-                # Generate artifacts before exiting
-                self._generate_exit_artifacts(outline, decisions, research)
+            if (action == ExitAction.SUMMARIZE_EXIT and self._adapter
+                    and any([outline, decisions, research])):
+                # Generate artifacts on the running loop, then close
+                event.ignore()
+                self._exit_in_progress = True
+                self._create_task(
+                    self._close_after_artifacts(outline, decisions, research),
+                    name="exit_artifacts",
+                )
+                return
 
             # Save session data
             self._save_session_data()
 
+        # Drop records superseded by in-session saves
+        self._conversation_store.compact()
+
         super().closeEvent(event)
 
     def _save_window_state(self) -> None:
@@ -1561,13 +1743,8 @@ class MainWindow(QMainWindow):
             if self._current_model_id not in self._session_record.models_used:
                 self._session_record.models_used.append(self._current_model_id)
 
-        # Get token count
-        if self._token_counter:
-            messages = self._prompt_builder.build_messages()
-            system = self._prompt_builder.get_system_prompt()
-            self._session_record.token_count = self._token_counter.count_prompt(
-                system, messages
-            )
+        # Token count is kept current by _update_token_count, so closing
+        # the window does no tokenization on the full history.
 
         # Get summary if present
         if self._prompt_builder._summary_block:
@@ -1577,23 +1754,38 @@ class MainWindow(QMainWindow):
         self._session_record.waypoints = self._waypoint_manager.get_waypoints_for_archive()
 
         # Save all conversation messages
-        self._session_record.messages = [
-            {"role": msg.role, "content": msg.content}
-            for msg in self._prompt_builder.history.messages
-        ]
+        self._session_record.messages = self._prompt_builder.history.as_dicts()
 
         # Save to conversation store
         self._conversation_store.save_session(self._session_record)
 
-    def _generate_exit_artifacts(
+    async def _close_after_artifacts(
         self,
         outline: bool,
         decisions: bool,
         research: bool,
     ) -> None:
-        """Generate artifacts before exiting.
+        """Generate exit artifacts, save the session, then close the window.
 
-        Uses QEventLoop for safe blocking in Qt context.
+        Args:
+            outline: Whether to generate conversation outline
+            decisions: Whether to generate decision log
+            research: Whether to generate research index
+        """
+        try:
+            await self._generate_exit_artifacts(outline, decisions, research)
+        finally:
+            self._save_session_data()
+            self._close_ready = True
+            self.close()
+
+    async def _generate_exit_artifacts(
+        self,
+        outline: bool,
+        decisions: bool,
+        research: bool,
+    ) -> None:
+        """Generate artifacts before exiting.
 
         Args:
             outline: Whether to generate conversation outline
@@ -1609,54 +1801,26 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Generating artifacts...")
 
         # Get messages for artifact generation
-        messages = []
-        for msg in self._prompt_builder.history.messages:
-            messages.append({
-                "role": msg.role,
-                "content": msg.content,
-            })
-
-        # Use QEventLoop for Qt-safe blocking
-        from PySide6.QtCore import QEventLoop
+        messages = self._prompt_builder.history.as_dicts()
 
-        loop = QEventLoop()
-        result_holder = {"result": None, "error": None}
-
-        async def generate():
-            try:
-                result_holder["result"] = await self._artifact_generator.generate_artifacts(
+        try:
+            result = await asyncio.wait_for(
+                self._artifact_generator.generate_artifacts(
                     messages=messages,
                     adapter=self._adapter,
                     generate_outline=outline,
                     generate_decisions=decisions,
                     generate_research=research,
-                )
-            except Exception as e:
-                result_holder["error"] = str(e)
-            finally:
-                loop.quit()
-
-        # Schedule the async task
-        task = asyncio.create_task(generate())
-
-        # Run Qt event loop until task completes (with timeout)
-        timeout_ms = settings.artifact_generation_timeout * 1000
-        QTimer.singleShot(timeout_ms, loop.quit)
-        loop.exec()
-
-        # Cancel task if still running (timeout)
-        if not task.done():
-            task.cancel()
+                ),
+                timeout=settings.artifact_generation_timeout,
+            )
+        except asyncio.TimeoutError:
             self.status_bar.showMessage("Artifact generation timed out", 3000)
             return
-
-        if result_holder["error"]:
-            self.status_bar.showMessage(
-                f"Artifact generation error: {result_holder['error']}", 3000
-            )
+        except Exception as e:
+            self.status_bar.showMessage(f"Artifact generation error: {e}", 3000)
             return
 
-        result = result_holder["result"]
         if result and result.success:
             # Save artifacts
             saved = self._artifact_generator.save_artifacts(
@@ -1666,10 +1830,9 @@ class MainWindow(QMainWindow):
             )
 
             # Update session record
-            for path in saved:
-                artifact_type = path.stem.split("_")[-1]
-                if artifact_type not in self._session_record.artifacts_generated:
-                    self._session_record.artifacts_generated.append(artifact_type)
+            self._session_record.artifacts_generated.update(
+                path.stem.rpartition("_")[2] for path in saved
+            )
 
             self.status_bar.showMessage(
                 f"Saved {len(saved)} artifact(s)", 2000
@@ -1692,7 +1855,8 @@ class MainWindow(QMainWindow):
                 self.sidebar.set_inspector_active(True)
 
             # Persist inspector state
-            persistence.update_inspector_visible(not is_visible)
+            persistence.update_inspector_visible(not is_visible, defer=True)
+            self._prefs_flush_timer.start()
 
     def _on_new_conversation(self) -> None:
         """Start a new conversation, clearing the current one."""
@@ -1742,7 +1906,8 @@ class MainWindow(QMainWindow):
             self.sidebar.show()
 
         # Persist focus mode state
-        persistence.update_focus_mode(self._focus_mode)
+        persistence.update_focus_mode(self._focus_mode, defer=True)
+        self._prefs_flush_timer.start()
 
         # Focus input after toggle
         self.input_panel.focus_input()
@@ -1753,14 +1918,16 @@ class MainWindow(QMainWindow):
         if self._inspector_panel and self._inspector_panel.isVisible():
             self._inspector_panel.hide()
             self.sidebar.set_inspector_active(False)
-            persistence.update_inspector_visible(False)
+            persistence.update_inspector_visible(False, defer=True)
+            self._prefs_flush_timer.start()
             return
 
         # Then, exit focus mode if active
         if self._focus_mode:
             self._focus_mode = False
             self.sidebar.show()
-            persistence.update_focus_mode(False)
+            persistence.update_focus_mode(False, defer=True)
+            self._prefs_flush_timer.start()
             self.input_panel.focus_input()
 
     def _on_show_help(self) -> None:
@@ -1791,11 +1958,13 @@ class MainWindow(QMainWindow):
         # Get all messages
         messages = self._prompt_builder.build_all_messages()
 
-        # Estimate token count
+        # Estimate token count (cached per message content by the counter)
         token_count = 0
         if self._token_counter:
-            for msg in messages:
-                token_count += self._token_counter.count(msg.get("content", ""))
+            token_count = sum(
+                self._token_counter.count_text(msg.get("content", ""))
+                for msg in messages
+            )
 
         # Get models used
         models_used = [self._current_model_id] if self._current_model_id else []
@@ -1818,19 +1987,48 @@ class MainWindow(QMainWindow):
         if not filepath.endswith(".md"):
             filepath += ".md"
 
-        # Export
+        # Export off the GUI thread
+        self.status_bar.showMessage("Exporting chat...")
+        self._create_task(
+            self._export_chat(
+                Path(filepath),
+                messages,
+                models_used,
+                token_count,
+                self._session_record.session_id,
+            ),
+            name="export_chat",
+        )
+
+    async def _export_chat(
+        self,
+        filepath: Path,
+        messages: List[Dict[str, str]],
+        models_used: List[str],
+        token_count: int,
+        session_id: str,
+    ) -> None:
+        """Format and write a markdown export in a worker thread.
+
+        Args:
+            filepath: Destination file
+            messages: Snapshot of the messages to export
+            models_used: Model IDs for the export header
+            token_count: Estimated token count for the export header
+            session_id: Session ID for the export header
+        """
         try:
-            markdown_content = export_to_markdown(
-                messages=messages,
+            await asyncio.to_thread(
+                save_markdown_export,
+                filepath,
+                messages,
                 models_used=models_used,
                 token_count=token_count,
-                session_id=self._session_record.session_id,
+                session_id=session_id,
             )
-            Path(filepath).write_text(markdown_content, encoding="utf-8")
 
             # Show confirmation
-            filename = Path(filepath).name
-            self.status_bar.showMessage(f"Chat exported to {filename}", 3000)
+            self.status_bar.showMessage(f"Chat exported to {filepath.name}", 3000)
         except Exception as e:
             self.status_bar.showMessage(f"Export failed: {str(e)}", 5000)
 
@@ -1879,27 +2077,7 @@ class MainWindow(QMainWindow):
             header = f"Loaded session from {started} | {msg_count} messages | Models: {models}"
             self.chat_panel.add_system_message(header)
 
-            for msg in session.messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-
-                if role == "user":
-                    msg_index = self.chat_panel.add_user_message(content)
-                    self._prompt_builder.add_user_message(content)
-                    # Analyze for TOC entry
-                    toc_entry = self._toc_generator.analyze_message(content, "user", msg_index)
-                    if toc_entry:
-                        self.sidebar.add_toc_entry(toc_entry)
-                elif role == "assistant":
-                    # Add assistant message directly (not through streaming)
-                    msg_index = self.chat_panel.start_assistant_message()
-                    self.chat_panel.append_to_assistant_message(content)
-                    self.chat_panel.finish_assistant_message()
-                    self._prompt_builder.add_assistant_message(content)
-                    # Analyze for TOC entry
-                    toc_entry = self._toc_generator.analyze_message(content, "assistant", msg_index)
-                    if toc_entry:
-                        self.sidebar.add_toc_entry(toc_entry)
+            self._restore_messages(session.messages)
 
             # Also restore summary if present (for summarized older messages)
             if has_summary:
@@ -1978,31 +2156,63 @@ class MainWindow(QMainWindow):
 
     def _on_search_conversations(self) -> None:
         """Open the conversation search dialog."""
-        # Initialize conversation indexer if not already done
-        if not self._conversation_indexer:
-            try:
-                self._conversation_indexer = ConversationIndexer(
-                    index_path=settings.app_data_dir / "conversation_index",
-                )
-            except Exception as e:
-                self.status_bar.showMessage(f"Search init failed: {e}", 5000)
-                return
-
-        # Create and show search dialog
+        # Create search dialog
         self._search_dialog = ConversationSearchDialog(self)
         self._search_dialog.search_requested.connect(self._on_search_requested)
         self._search_dialog.index_requested.connect(self._on_index_requested)
         self._search_dialog.session_selected.connect(self._on_search_session_selected)
 
-        # Show index status
+        if self._conversation_indexer:
+            self._show_index_status()
+        else:
+            # Load the index off the GUI thread while the dialog is open
+            self._search_dialog.status_label.setText("Loading search index...")
+            if not self._indexer_load_task:
+                self._indexer_load_task = self._create_task(
+                    self._load_conversation_indexer(),
+                    name="load_conversation_indexer",
+                )
+
+        self._search_dialog.exec()
+
+    async def _load_conversation_indexer(self) -> None:
+        """Load the conversation indexer in a worker thread."""
+        try:
+            self._conversation_indexer = await asyncio.to_thread(
+                ConversationIndexer,
+                index_path=settings.app_data_dir / "conversation_index",
+            )
+        except Exception as e:
+            # Allow a retry the next time search is opened
+            self._indexer_load_task = None
+            if self._search_dialog:
+                self._search_dialog.status_label.setText(f"Search init failed: {e}")
+            return
+
+        if self._search_dialog:
+            self._show_index_status()
+
+    async def _wait_for_conversation_indexer(self) -> Optional[ConversationIndexer]:
+        """Wait for a pending indexer load to finish.
+
+        Returns:
+            The conversation indexer, or None if it failed to load
+        """
+        if not self._conversation_indexer and self._indexer_load_task:
+            # Shield so a cancelled search does not cancel the load
+            await asyncio.shield(self._indexer_load_task)
+        return self._conversation_indexer
+
+    def _show_index_status(self) -> None:
+        """Show the conversation index size in the search dialog."""
         msg_count = self._conversation_indexer.get_indexed_message_count()
         session_count = self._conversation_indexer.get_indexed_session_count()
         if msg_count > 0:
             self._search_dialog.status_label.setText(
                 f"Index contains {session_count} session(s), {msg_count} message(s)"
             )
-
-        self._search_dialog.exec()
+        else:
+            self._search_dialog.status_label.setText("")
 
     def _on_search_requested(self, query: str) -> None:
         """Handle search request from dialog.
@@ -2010,7 +2220,7 @@ class MainWindow(QMainWindow):
         Args:
             query: The search query
         """
-        if not self._conversation_indexer or not self._search_dialog:
+        if not self._search_dialog:
             return
 
         self._create_task(
@@ -2024,40 +2234,62 @@ class MainWindow(QMainWindow):
         Args:
             query: The search query
         """
-        if not self._conversation_indexer or not self._search_dialog:
+        indexer = await self._wait_for_conversation_indexer()
+        if not indexer or not self._search_dialog:
             return
 
         try:
-            results = await self._conversation_indexer.search(query, k=20)
+            results = await indexer.search(query, k=20)
             self._search_dialog.set_results(results, query)
         except Exception as e:
             self._search_dialog.status_label.setText(f"Search error: {str(e)}")
 
     def _on_index_requested(self) -> None:
         """Handle index all sessions request from dialog."""
-        if not self._conversation_indexer or not self._search_dialog:
+        if not self._search_dialog:
             return
 
         self._create_task(self._index_all_sessions(), name="index_sessions")
 
     async def _index_all_sessions(self) -> None:
         """Index all sessions for semantic search."""
-        if not self._conversation_indexer or not self._search_dialog:
+        if not await self._wait_for_conversation_indexer() or not self._search_dialog:
             return
 
         try:
             sessions = self._conversation_store.get_recent_sessions(limit=100)
-            indexed_count = 0
 
-            for session in sessions:
-                # Skip if already indexed
-                if self._conversation_indexer.is_session_indexed(session.session_id):
-                    continue
+            # Skip sessions that are already indexed
+            pending = [
+                session for session in sessions
+                if not self._conversation_indexer.is_session_indexed(session.session_id)
+            ]
+
+            # Embedding requests are I/O-bound, so run a bounded number at once
+            semaphore = asyncio.Semaphore(settings.session_index_concurrency)
+            done = 0
+
+            async def index_one(session: SessionRecord) -> int:
+                nonlocal done
+                try:
+                    async with semaphore:
+                        return await self._conversation_indexer.index_session(session)
+                finally:
+                    done += 1
+                    self._search_dialog.set_index_progress(done, len(pending))
+
+            results = await asyncio.gather(
+                *(index_one(session) for session in pending),
+                return_exceptions=True,
+            )
 
-                # Index session
-                count = await self._conversation_indexer.index_session(session)
-                if count > 0:
-                    indexed_count += 1
+            indexed_count = sum(
+                1 for result in results
+                if not isinstance(result, BaseException) and result > 0
+            )
+            errors = [result for result in results if isinstance(result, Exception)]
+            if errors and not indexed_count:
+                raise errors[0]
 
             self._search_dialog.set_index_complete(indexed_count)
 
@@ -2131,7 +2363,9 @@ class MainWindow(QMainWindow):
         # Stream response
         self._side_streaming = True
         self._side_panel.set_input_enabled(False)
-        self._create_task(self._stream_side_response(), name="side_response")
+        self._side_task = self._create_task(
+            self._stream_side_response(), name="side_response"
+        )
 
     async def _stream_side_response(self) -> None:
         """Stream a response for the side panel."""
@@ -2142,7 +2376,7 @@ class MainWindow(QMainWindow):
         if not active_side:
             return
 
-        full_response = ""
+        response_parts: List[str] = []
 
         try:
             # Build messages for side conversation
@@ -2150,19 +2384,35 @@ class MainWindow(QMainWindow):
 
             # Get summary of main conversation for context
             main_summary = None
-            if self._prompt_builder.get_message_count() > 0:
-                main_summary = f"Main conversation has {self._prompt_builder.get_message_count()} messages about: {self._intent_tracker.current_mode.value}"
+            message_count = self._prompt_builder.get_message_count()
+            if message_count > 0:
+                main_summary = (
+                    f"Main conversation has {message_count} messages about: "
+                    f"{self._intent_tracker.current_mode.value}"
+                )
 
             system = self._parallel_context.get_side_system_prompt(main_summary)
 
-            async for chunk in self._adapter.stream(messages, system):
+            # System prompt and main summary stay fixed across side turns,
+            # so mark them as a cacheable prefix
+            async for chunk in self._adapter.stream(
+                messages, system, cache_breakpoints=[len(system)]
+            ):
                 if chunk.text:
-                    full_response += chunk.text
+                    response_parts.append(chunk.text)
 
             # Add complete response
+            full_response = "".join(response_parts)
             self._parallel_context.add_assistant_message(full_response)
             self._side_panel.finish_assistant_message(full_response)
 
+        except asyncio.CancelledError:
+            # Interrupted: keep what arrived so roles still alternate
+            partial = f"{''.join(response_parts)}\n[interrupted]".lstrip()
+            self._parallel_context.add_assistant_message(partial)
+            self._side_panel.finish_assistant_message(partial)
+            raise
+
         except Exception as e:
             error_msg = str(e)
             self._side_panel.add_assistant_message(f"Error: {error_msg}")
@@ -2206,10 +2456,10 @@ class MainWindow(QMainWindow):
             self._interrupt_requested = True
             self.status_bar.showMessage("Interrupting generation...", 1000)
         elif self._side_streaming:
-            # Also handle side panel streaming
-            self._side_streaming = False
-            if self._side_panel:
-                self._side_panel.set_input_enabled(True)
+            # Cancel the side stream so no further tokens are consumed;
+            # its finally block re-enables the side panel input
+            if self._side_task:
+                self._side_task.cancel()
             self.status_bar.showMessage("Side panel interrupted", 1000)
 
     def _on_rollback_last_exchange(self) -> None:
@@ -2221,6 +2471,10 @@ class MainWindow(QMainWindow):
         # Try to remove last exchange from history
         removed = self._prompt_builder.history.remove_last_exchange()
         if removed:
+            # Drop cached token counts for the rolled-back messages
+            if self._token_counter:
+                self._token_counter.evict(*(msg.content for msg in removed))
+
             # Remove from UI
             self.chat_panel.remove_last_exchange()
             self._update_token_count()
@@ -2282,12 +2536,13 @@ class MainWindow(QMainWindow):
         else:
             self.status_bar.showMessage("Crucible disabled", 2000)
             # Restore model label
-            model_config = get_model(self._current_model_id)
+            model_config = self._current_model_config
             if model_config:
                 self.model_label.setText(f"Model: {model_config.display_name}")
 
         # Save preference
-        persistence.update_crucible_settings(enabled, self._crucible_router)
+        persistence.update_crucible_settings(enabled, self._crucible_router, defer=True)
+        self._prefs_flush_timer.start()
 
     def _on_crucible_router_changed(self, router_mode: str) -> None:
         """Handle Crucible router mode change.
@@ -2301,7 +2556,10 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage(f"Crucible router: {router_mode}", 2000)
 
         # Save preference
-        persistence.update_crucible_settings(self._crucible_enabled, router_mode)
+        persistence.update_crucible_settings(
+            self._crucible_enabled, router_mode, defer=True
+        )
+        self._prefs_flush_timer.start()
 
     async def _stream_crucible_response(self, user_message: str, assistant_msg_index: int = -1) -> None:
         """Stream a response through Crucible deliberation.
@@ -1,6 +1,6 @@
 """Memory panel for viewing and editing unified memory facts."""
 
-from typing import Optional, List
+from typing import Dict, List
 
 from PySide6.QtWidgets import (
     QDialog,
@@ -10,154 +10,239 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QFrame,
-    QListWidget,
-    QListWidgetItem,
+    QGridLayout,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTextEdit,
     QComboBox,
-    QLineEdit,
     QMenu,
-    QSplitter,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QModelIndex,
+    QPoint,
+    QRect,
+    QRectF,
+    QSize,
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QTextOption
 
 from ..config.themes import theme, fonts, metrics
 from ..storage.unified_memory import UnifiedMemory, MemoryFact
+from .painting import css_font
 
 
-class MemoryFactWidget(QFrame):
-    """Widget displaying a single memory fact."""
+# Badge color per memory category
+CATEGORY_COLORS: Dict[str, str] = {
+    "preference": theme.accent,
+    "fact": theme.text_muted,
+    "person": theme.success,
+    "project": theme.warning,
+    "custom": theme.text_secondary,
+}
 
-    edit_requested = Signal(str)  # fact_id
-    delete_requested = Signal(str)  # fact_id
 
-    def __init__(
-        self,
-        fact: MemoryFact,
-        parent: QWidget | None = None
-    ):
-        """Initialize the fact widget.
+class MemoryFactsModel(QAbstractListModel):
+    """List model exposing the filtered, sorted memory facts."""
+
+    FactRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent: QWidget | None = None):
+        """Initialize the model.
 
         Args:
-            fact: The memory fact to display
-            parent: Parent widget
+            parent: Parent object
         """
         super().__init__(parent)
-        self._fact = fact
-        self._setup_ui()
+        self._facts: List[MemoryFact] = []
+        self._rows: Dict[str, int] = {}
 
-    def _setup_ui(self) -> None:
-        """Set up the widget UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(
-            metrics.padding_medium,
-            metrics.padding_small,
-            metrics.padding_medium,
-            metrics.padding_small,
+    def set_facts(self, facts: List[MemoryFact]) -> None:
+        """Replace the displayed facts.
+
+        Args:
+            facts: Facts in display order
+        """
+        if facts is self._facts:
+            return
+        self.beginResetModel()
+        self._facts = facts
+        self._rows = {f.fact_id: row for row, f in enumerate(facts)}
+        self.endResetModel()
+
+    def fact_changed(self, fact_id: str) -> None:
+        """Notify views that a shown fact was edited in place.
+
+        Args:
+            fact_id: ID of the edited fact
+        """
+        row = self._rows.get(fact_id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of facts."""
+        return 0 if parent.isValid() else len(self._facts)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return data for a fact row.
+
+        DisplayRole yields the content, UserRole the fact id and
+        FactRole the MemoryFact itself.
+        """
+        if not index.isValid() or not 0 <= index.row() < len(self._facts):
+            return None
+        fact = self._facts[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return fact.content
+        if role == Qt.ItemDataRole.UserRole:
+            return fact.fact_id
+        if role == self.FactRole:
+            return fact
+        return None
+
+
+class MemoryFactDelegate(QStyledItemDelegate):
+    """Paints a memory fact card without per-row child widgets."""
+
+    PAD_H = metrics.padding_medium
+    PAD_V = metrics.padding_small
+    ROW_SPACING = 4
+    CARD_GAP = metrics.padding_small
+    BADGE_PAD_H = 6
+    BADGE_PAD_V = 2
+
+    def __init__(self, parent: QWidget | None = None):
+        """Initialize the delegate.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        # css_font() returns a shared instance; copy before customizing
+        self._badge_font = QFont(css_font(fonts.ui, 9, QFont.Weight.DemiBold))
+        self._badge_font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 0.5)
+        self._date_font = css_font(fonts.ui, 10)
+        self._content_font = css_font(fonts.chat, metrics.font_normal)
+        self._badge_metrics = QFontMetrics(self._badge_font)
+        self._content_metrics = QFontMetrics(self._content_font)
+        self._header_height = max(
+            self._badge_metrics.height() + 2 * self.BADGE_PAD_V,
+            QFontMetrics(self._date_font).height(),
         )
-        layout.setSpacing(4)
 
-        # Header row with category badge
-        header_row = QHBoxLayout()
-        header_row.setSpacing(8)
+        # Paint resources shared by every row
+        self._card_brush = QColor(theme.background_elevated)
+        self._border_pen = QPen(QColor(theme.border_subtle), 1)
+        self._hover_pen = QPen(QColor(theme.border), 1)
+        self._date_color = QColor(theme.text_disabled)
+        self._content_color = QColor(theme.text_primary)
+        self._category_colors = {
+            category: QColor(color) for category, color in CATEGORY_COLORS.items()
+        }
+        self._default_category_color = QColor(theme.text_muted)
+        self._text_option = QTextOption()
+        self._text_option.setWrapMode(QTextOption.WrapMode.WordWrap)
+
+        # Wrapped content heights, valid for _cached_width only
+        self._height_cache: Dict[str, int] = {}
+        self._cached_width = -1
+
+    def _content_width(self, option: QStyleOptionViewItem) -> int:
+        """Return the text width available inside a card."""
+        view = option.widget
+        width = view.viewport().width() if view is not None else option.rect.width()
+        return max(1, width - 2 * self.PAD_H - 2)
+
+    def _content_height(self, text: str, width: int) -> int:
+        """Return the wrapped height of content text, cached per width."""
+        if width != self._cached_width:
+            self._height_cache.clear()
+            self._cached_width = width
+        height = self._height_cache.get(text)
+        if height is None:
+            rect = self._content_metrics.boundingRect(
+                QRect(0, 0, width, 100000),
+                Qt.TextFlag.TextWordWrap,
+                text,
+            )
+            height = rect.height()
+            self._height_cache[text] = height
+        return height
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Return the card size for a fact."""
+        fact: MemoryFact = index.data(MemoryFactsModel.FactRole)
+        width = self._content_width(option)
+        height = (
+            2 + 2 * self.PAD_V
+            + self._header_height
+            + self.ROW_SPACING
+            + self._content_height(fact.content, width)
+            + self.CARD_GAP
+        )
+        return QSize(width + 2 * self.PAD_H + 2, height)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """Draw the card frame, category badge, date and content."""
+        fact: MemoryFact = index.data(MemoryFactsModel.FactRole)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card frame
+        card = QRectF(option.rect.adjusted(0, 0, 0, -self.CARD_GAP)).adjusted(0.5, 0.5, -0.5, -0.5)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(self._hover_pen if hovered else self._border_pen)
+        painter.setBrush(self._card_brush)
+        painter.drawRoundedRect(card, metrics.radius_medium, metrics.radius_medium)
+
+        x = option.rect.left() + 1 + self.PAD_H
+        y = option.rect.top() + 1 + self.PAD_V
 
         # Category badge
-        category_colors = {
-            "preference": theme.accent,
-            "fact": theme.text_muted,
-            "person": theme.success,
-            "project": theme.warning,
-            "custom": theme.text_secondary,
-        }
-        color = category_colors.get(self._fact.category, theme.text_muted)
-
-        category_label = QLabel(self._fact.category.upper())
-        category_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: 9px;
-                font-weight: 600;
-                letter-spacing: 0.5px;
-                font-family: {fonts.ui};
-                background-color: {theme.background_elevated};
-                padding: 2px 6px;
-                border-radius: 3px;
-            }}
-        """)
-        header_row.addWidget(category_label)
+        category = fact.category.upper()
+        badge_rect = QRect(
+            x,
+            y,
+            self._badge_metrics.horizontalAdvance(category) + 2 * self.BADGE_PAD_H,
+            self._header_height,
+        )
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(badge_rect, 3, 3)
+        painter.setFont(self._badge_font)
+        painter.setPen(self._category_colors.get(fact.category, self._default_category_color))
+        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, category)
 
         # Date
-        date_str = self._fact.created_at.strftime("%Y-%m-%d")
-        date_label = QLabel(date_str)
-        date_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_disabled};
-                font-size: 10px;
-                font-family: {fonts.ui};
-            }}
-        """)
-        header_row.addWidget(date_label)
-        header_row.addStretch()
-
-        layout.addLayout(header_row)
+        date_rect = QRect(
+            badge_rect.right() + 8,
+            y,
+            option.rect.right() - badge_rect.right() - 8 - self.PAD_H,
+            self._header_height,
+        )
+        painter.setFont(self._date_font)
+        painter.setPen(self._date_color)
+        painter.drawText(
+            date_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            fact.created_date,
+        )
 
         # Content
-        content_label = QLabel(self._fact.content)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_primary};
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.chat};
-            }}
-        """)
-        layout.addWidget(content_label)
-
-        # Frame styling
-        self.setStyleSheet(f"""
-            MemoryFactWidget {{
-                background-color: {theme.background_elevated};
-                border: 1px solid {theme.border_subtle};
-                border-radius: {metrics.radius_medium}px;
-            }}
-            MemoryFactWidget:hover {{
-                border-color: {theme.border};
-            }}
-        """)
-
-        # Context menu
-        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.customContextMenuRequested.connect(self._show_context_menu)
-
-    def _show_context_menu(self, pos) -> None:
-        """Show context menu for fact actions."""
-        menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-                padding: {metrics.padding_small}px;
-                font-family: {fonts.ui};
-            }}
-            QMenu::item {{
-                padding: {metrics.padding_small}px {metrics.padding_large}px;
-                border-radius: {metrics.radius_small}px;
-            }}
-            QMenu::item:selected {{
-                background-color: {theme.accent};
-                color: white;
-            }}
-        """)
-
-        edit_action = menu.addAction("Edit")
-        delete_action = menu.addAction("Delete")
-
-        action = menu.exec_(self.mapToGlobal(pos))
-        if action == edit_action:
-            self.edit_requested.emit(self._fact.fact_id)
-        elif action == delete_action:
-            self.delete_requested.emit(self._fact.fact_id)
+        width = self._content_width(option)
+        content_top = y + self._header_height + self.ROW_SPACING
+        content_rect = QRectF(
+            x, content_top, width, self._content_height(fact.content, width)
+        )
+        painter.setFont(self._content_font)
+        painter.setPen(self._content_color)
+        painter.drawText(content_rect, fact.content, self._text_option)
+
+        painter.restore()
 
 
 class AddFactDialog(QDialog):
@@ -176,126 +261,70 @@ class AddFactDialog(QDialog):
         """Set up the dialog UI."""
         self.setWindowTitle("Add Memory")
         self.setMinimumWidth(400)
-        self.setStyleSheet(f"background-color: {theme.background_secondary};")
 
-        layout = QVBoxLayout(self)
+        # One grid instead of nested rows: category row, prompt, input, buttons
+        layout = QGridLayout(self)
         layout.setContentsMargins(
             metrics.padding_large,
             metrics.padding_large,
             metrics.padding_large,
             metrics.padding_large,
         )
-        layout.setSpacing(metrics.padding_medium)
+        layout.setVerticalSpacing(metrics.padding_medium)
+        layout.setColumnStretch(2, 1)
 
         # Category selector
-        category_layout = QHBoxLayout()
         category_label = QLabel("Category:")
-        category_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_secondary};
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.ui};
-            }}
-        """)
-        category_layout.addWidget(category_label)
+        category_label.setObjectName("memoryFieldLabel")
+        layout.addWidget(category_label, 0, 0)
 
         self._category_combo = QComboBox()
         self._category_combo.addItems(["fact", "preference", "person", "project", "custom"])
-        self._category_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_small}px;
-                padding: 6px 12px;
-                font-family: {fonts.ui};
-                min-width: 120px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                selection-background-color: {theme.accent};
-            }}
-        """)
-        category_layout.addWidget(self._category_combo)
-        category_layout.addStretch()
-        layout.addLayout(category_layout)
+        self._category_combo.setObjectName("memoryCategory")
+        layout.addWidget(self._category_combo, 0, 1)
 
         # Content input
         content_label = QLabel("What should I remember?")
-        content_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_secondary};
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.ui};
-            }}
-        """)
-        layout.addWidget(content_label)
+        content_label.setObjectName("memoryFieldLabel")
+        layout.addWidget(content_label, 1, 0, 1, 5)
 
         self._content_input = QTextEdit()
         self._content_input.setPlaceholderText("Enter a fact, preference, or context to remember...")
         self._content_input.setMaximumHeight(100)
-        self._content_input.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-                padding: {metrics.padding_small}px;
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.chat};
-            }}
-            QTextEdit:focus {{
-                border-color: {theme.accent};
-            }}
-        """)
-        layout.addWidget(self._content_input)
+        self._content_input.setObjectName("memoryContentInput")
+        layout.addWidget(self._content_input, 2, 0, 1, 5)
 
         # Buttons
-        button_row = QHBoxLayout()
-        button_row.addStretch()
-
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {theme.text_secondary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_small}px;
-                padding: 8px 16px;
-                font-family: {fonts.ui};
-            }}
-            QPushButton:hover {{
-                background-color: {theme.background_elevated};
-            }}
-        """)
+        cancel_btn.setObjectName("memoryCancelButton")
         cancel_btn.clicked.connect(self.reject)
-        button_row.addWidget(cancel_btn)
+        layout.addWidget(cancel_btn, 3, 3)
 
         save_btn = QPushButton("Save")
         save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        save_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.accent};
-                color: white;
-                border: none;
-                border-radius: {metrics.radius_small}px;
-                padding: 8px 16px;
-                font-family: {fonts.ui};
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {theme.accent_hover};
-            }}
-        """)
+        save_btn.setObjectName("memorySaveButton")
         save_btn.clicked.connect(self.accept)
-        button_row.addWidget(save_btn)
+        layout.addWidget(save_btn, 3, 4)
+
+    def reset(
+        self,
+        title: str = "Add Memory",
+        content: str = "",
+        category: str = "fact"
+    ) -> None:
+        """Reset the dialog fields for another add or edit.
 
-        layout.addLayout(button_row)
+        Args:
+            title: Window title to show
+            content: Initial fact content
+            category: Initially selected category
+        """
+        self.setWindowTitle(title)
+        self._content_input.blockSignals(True)
+        self._content_input.setPlainText(content)
+        self._content_input.blockSignals(False)
+        self._category_combo.setCurrentText(category)
 
     def get_fact_data(self) -> tuple[str, str]:
         """Get the entered fact data.
@@ -325,15 +354,17 @@ class MemoryPanel(QDialog):
         """
         super().__init__(parent)
         self._memory = memory
-        self._fact_widgets: List[MemoryFactWidget] = []
+        self._fact_dialog: AddFactDialog | None = None
+        self._fact_menu: QMenu | None = None
+        # Sorted snapshot of memory, rebuilt only after a mutation
+        self._fact_index: Dict[str, MemoryFact] = {}
+        self._facts_by_category: Dict[str, List[MemoryFact]] | None = None
         self._setup_ui()
-        self._refresh_facts()
 
     def _setup_ui(self) -> None:
         """Set up the dialog UI."""
         self.setWindowTitle("Memory")
         self.setMinimumSize(500, 400)
-        self.setStyleSheet(f"background-color: {theme.background_secondary};")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -341,12 +372,7 @@ class MemoryPanel(QDialog):
 
         # Header
         header = QFrame()
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.background_tertiary};
-                border-bottom: 1px solid {theme.border_subtle};
-            }}
-        """)
+        header.setObjectName("memoryHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(
             metrics.padding_large,
@@ -356,38 +382,20 @@ class MemoryPanel(QDialog):
         )
 
         title = QLabel("UNIFIED MEMORY")
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: 11px;
-                font-weight: 600;
-                letter-spacing: 1px;
-                font-family: {fonts.ui};
-            }}
-        """)
+        title.setObjectName("memoryTitle")
         header_layout.addWidget(title)
         header_layout.addStretch()
 
         # Fact count
         self._count_label = QLabel("0 facts")
-        self._count_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_disabled};
-                font-size: 11px;
-                font-family: {fonts.ui};
-            }}
-        """)
+        self._count_label.setObjectName("memoryCount")
         header_layout.addWidget(self._count_label)
 
         layout.addWidget(header)
 
         # Toolbar
         toolbar = QFrame()
-        toolbar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.background_tertiary};
-            }}
-        """)
+        toolbar.setObjectName("memoryToolbar")
         toolbar_layout = QHBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(
             metrics.padding_large,
@@ -401,21 +409,7 @@ class MemoryPanel(QDialog):
         self._filter_combo.addItem("All Categories", "all")
         for cat in UnifiedMemory.CATEGORIES:
             self._filter_combo.addItem(cat.capitalize(), cat)
-        self._filter_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_small}px;
-                padding: 4px 12px;
-                font-size: 12px;
-                font-family: {fonts.ui};
-                min-width: 120px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-        """)
+        self._filter_combo.setObjectName("memoryFilter")
         self._filter_combo.currentIndexChanged.connect(self._refresh_facts)
         toolbar_layout.addWidget(self._filter_combo)
 
@@ -424,71 +418,33 @@ class MemoryPanel(QDialog):
         # Add button
         add_btn = QPushButton("+ Add Memory")
         add_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.accent};
-                color: white;
-                border: none;
-                border-radius: {metrics.radius_small}px;
-                padding: 6px 12px;
-                font-size: 12px;
-                font-family: {fonts.ui};
-            }}
-            QPushButton:hover {{
-                background-color: {theme.accent_hover};
-            }}
-        """)
+        add_btn.setObjectName("memoryAddButton")
         add_btn.clicked.connect(self._on_add_fact)
         toolbar_layout.addWidget(add_btn)
 
         layout.addWidget(toolbar)
 
         # Facts list
-        self._facts_container = QWidget()
-        self._facts_container.setStyleSheet(f"""
-            QWidget {{
-                background-color: {theme.background_secondary};
-            }}
-        """)
-        self._facts_layout = QVBoxLayout(self._facts_container)
-        self._facts_layout.setContentsMargins(
-            metrics.padding_large,
-            metrics.padding_medium,
-            metrics.padding_large,
-            metrics.padding_medium,
-        )
-        self._facts_layout.setSpacing(metrics.padding_small)
-        self._facts_layout.addStretch()
-
-        from PySide6.QtWidgets import QScrollArea
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {theme.background_secondary};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background: {theme.background_secondary};
-                width: 8px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {theme.border};
-                border-radius: 4px;
-            }}
-        """)
-        scroll.setWidget(self._facts_container)
-        layout.addWidget(scroll, stretch=1)
+        self._facts_model = MemoryFactsModel(self)
+        self._facts_view = QListView()
+        self._facts_view.setModel(self._facts_model)
+        self._facts_view.setItemDelegate(MemoryFactDelegate(self._facts_view))
+        self._facts_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self._facts_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self._facts_view.setResizeMode(QListView.ResizeMode.Adjust)
+        # Rows vary in height, so measure them in batches instead of all at once
+        self._facts_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self._facts_view.setBatchSize(64)
+        self._facts_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._facts_view.setMouseTracking(True)
+        self._facts_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._facts_view.customContextMenuRequested.connect(self._show_fact_menu)
+        self._facts_view.setObjectName("memoryFacts")
+        layout.addWidget(self._facts_view, stretch=1)
 
         # Footer
         footer = QFrame()
-        footer.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.background_tertiary};
-                border-top: 1px solid {theme.border_subtle};
-            }}
-        """)
+        footer.setObjectName("memoryFooter")
         footer_layout = QHBoxLayout(footer)
         footer_layout.setContentsMargins(
             metrics.padding_large,
@@ -499,18 +455,7 @@ class MemoryPanel(QDialog):
 
         clear_btn = QPushButton("Clear All")
         clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {theme.text_disabled};
-                border: none;
-                font-size: 12px;
-                font-family: {fonts.ui};
-            }}
-            QPushButton:hover {{
-                color: {theme.error};
-            }}
-        """)
+        clear_btn.setObjectName("memoryClearButton")
         clear_btn.clicked.connect(self._on_clear_all)
         footer_layout.addWidget(clear_btn)
 
@@ -518,67 +463,97 @@ class MemoryPanel(QDialog):
 
         close_btn = QPushButton("Close")
         close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_small}px;
-                padding: 8px 24px;
-                font-family: {fonts.ui};
-            }}
-            QPushButton:hover {{
-                border-color: {theme.accent};
-            }}
-        """)
+        close_btn.setObjectName("memoryCloseButton")
         close_btn.clicked.connect(self.accept)
         footer_layout.addWidget(close_btn)
 
         layout.addWidget(footer)
 
-    def _refresh_facts(self) -> None:
-        """Refresh the facts list."""
-        # Clear existing widgets
-        for widget in self._fact_widgets:
-            widget.deleteLater()
-        self._fact_widgets.clear()
+    def showEvent(self, event) -> None:
+        """Load facts the first time the panel is shown."""
+        super().showEvent(event)
+        if self._facts_by_category is None:
+            self._refresh_facts()
 
-        # Get filtered facts
-        category = self._filter_combo.currentData()
-        if category == "all":
-            facts = self._memory.get_all_facts()
-        else:
-            facts = self._memory.get_facts_by_category(category)
+    def _load_facts(self) -> None:
+        """Snapshot memory into an id index and per-category buckets."""
+        facts = self._memory.get_all_facts()
 
         # Sort by date descending
         facts.sort(key=lambda f: f.created_at, reverse=True)
 
-        # Update count
-        self._count_label.setText(f"{len(facts)} fact{'s' if len(facts) != 1 else ''}")
+        self._fact_index = {f.fact_id: f for f in facts}
+        # Seed the known categories so the loop does not allocate a
+        # throwaway default list per fact as setdefault would
+        buckets: Dict[str, List[MemoryFact]] = {c: [] for c in UnifiedMemory.CATEGORIES}
+        for fact in facts:
+            bucket = buckets.get(fact.category)
+            if bucket is None:
+                bucket = buckets[fact.category] = []
+            bucket.append(fact)
+        buckets["all"] = facts
+        self._facts_by_category = buckets
+
+    def _invalidate_facts(self) -> None:
+        """Drop the snapshot after memory was mutated and refresh."""
+        self._facts_by_category = None
+        self._refresh_facts()
 
-        # Remove stretch
-        if self._facts_layout.count() > 0:
-            self._facts_layout.takeAt(self._facts_layout.count() - 1)
+    def _refresh_facts(self) -> None:
+        """Refresh the facts list."""
+        if self._facts_by_category is None:
+            self._load_facts()
 
-        # Add fact widgets
-        for fact in facts:
-            widget = MemoryFactWidget(fact)
-            widget.edit_requested.connect(self._on_edit_fact)
-            widget.delete_requested.connect(self._on_delete_fact)
-            self._facts_layout.addWidget(widget)
-            self._fact_widgets.append(widget)
+        # Get filtered facts
+        category = self._filter_combo.currentData()
+        facts = self._facts_by_category.get(category, [])
+
+        # Repaint once after both the count and the list change
+        self.setUpdatesEnabled(False)
+        try:
+            self._count_label.setText(f"{len(facts)} fact{'s' if len(facts) != 1 else ''}")
+            self._facts_model.set_facts(facts)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _show_fact_menu(self, pos: QPoint) -> None:
+        """Show the context menu for the fact under the cursor.
 
-        # Re-add stretch
-        self._facts_layout.addStretch()
+        Args:
+            pos: Click position in viewport coordinates
+        """
+        index = self._facts_view.indexAt(pos)
+        if not index.isValid():
+            return
+        fact_id = index.data(Qt.ItemDataRole.UserRole)
+
+        if self._fact_menu is None:
+            self._fact_menu = QMenu(self)
+            self._fact_menu.setObjectName("memoryFactMenu")
+            self._edit_action = self._fact_menu.addAction("Edit")
+            self._delete_action = self._fact_menu.addAction("Delete")
+
+        action = self._fact_menu.exec_(self._facts_view.viewport().mapToGlobal(pos))
+        if action is self._edit_action:
+            self._on_edit_fact(fact_id)
+        elif action is self._delete_action:
+            self._on_delete_fact(fact_id)
+
+    def _get_fact_dialog(self) -> AddFactDialog:
+        """Return the shared add/edit dialog, creating it on first use."""
+        if self._fact_dialog is None:
+            self._fact_dialog = AddFactDialog(self)
+        return self._fact_dialog
 
     def _on_add_fact(self) -> None:
         """Handle add fact button click."""
-        dialog = AddFactDialog(self)
+        dialog = self._get_fact_dialog()
+        dialog.reset()
         if dialog.exec():
             content, category = dialog.get_fact_data()
             if content:
                 self._memory.add_fact(content, category)
-                self._refresh_facts()
+                self._invalidate_facts()
 
     def _on_edit_fact(self, fact_id: str) -> None:
         """Handle fact edit request.
@@ -586,23 +561,21 @@ class MemoryPanel(QDialog):
         Args:
             fact_id: ID of fact to edit
         """
-        # Find the fact
-        facts = self._memory.get_all_facts()
-        fact = next((f for f in facts if f.fact_id == fact_id), None)
-        if not fact:
+        fact = self._fact_index.get(fact_id)
+        if fact is None:
             return
 
         # Show edit dialog (reuse add dialog)
-        dialog = AddFactDialog(self)
-        dialog.setWindowTitle("Edit Memory")
-        dialog._content_input.setText(fact.content)
-        dialog._category_combo.setCurrentText(fact.category)
+        dialog = self._get_fact_dialog()
+        dialog.reset("Edit Memory", fact.content, fact.category)
 
         if dialog.exec():
             content, _ = dialog.get_fact_data()
-            if content:
-                self._memory.update_fact(fact_id, content)
-                self._refresh_facts()
+            if content and self._memory.update_fact(fact_id, content):
+                # update_fact edits the shared MemoryFact in place, so the
+                # snapshot stays valid; only the row needs re-measuring
+                self._facts_model.fact_changed(fact_id)
+                self._facts_view.doItemsLayout()
 
     def _on_delete_fact(self, fact_id: str) -> None:
         """Handle fact delete request.
@@ -611,10 +584,10 @@ class MemoryPanel(QDialog):
             fact_id: ID of fact to delete
         """
         self._memory.remove_fact(fact_id)
-        self._refresh_facts()
+        self._invalidate_facts()
 
     def _on_clear_all(self) -> None:
         """Handle clear all button click."""
         if self._memory.get_fact_count() > 0:
             self._memory.clear()
-            self._refresh_facts()
+            self._invalidate_facts()
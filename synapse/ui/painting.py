@@ -0,0 +1,31 @@
+"""Helpers shared by item delegates that paint rows directly."""
+
+from functools import lru_cache
+
+from PySide6.QtGui import QFont
+
+
+@lru_cache(maxsize=None)
+def css_font(
+    families: str,
+    pixel_size: int,
+    weight: QFont.Weight = QFont.Weight.Normal
+) -> QFont:
+    """Build a QFont from a CSS font-family list.
+
+    Fonts are cached, so delegates asking for the same family, size and
+    weight share one QFont; callers must not modify the returned font.
+
+    Args:
+        families: Comma-separated CSS font families (as in ``fonts``)
+        pixel_size: Font size in pixels
+        weight: Font weight
+
+    Returns:
+        Configured QFont
+    """
+    font = QFont()
+    font.setFamilies([f.strip().strip("'\"") for f in families.split(",")])
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
@@ -1,7 +1,5 @@
 """Scratchpad panel for private notes visible to the model."""
 
-from typing import Optional
-
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,11 +8,10 @@ from PySide6.QtWidgets import (
     QPushButton,
     QFrame,
     QTextEdit,
-    QSizePolicy,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 
-from ..config.themes import theme, fonts, metrics
+from ..config.themes import metrics
 
 
 class ScratchpadPanel(QFrame):
@@ -24,9 +21,12 @@ class ScratchpadPanel(QFrame):
     but not part of the conversation history.
     """
 
-    # Signal emitted when content changes
+    # Signal emitted when content changes (debounced while typing)
     content_changed = Signal(str)
 
+    # Quiet period before a content change is emitted
+    EMIT_DELAY_MS = 150
+
     def __init__(self, parent: QWidget | None = None):
         """Initialize the scratchpad panel.
 
@@ -35,26 +35,26 @@ class ScratchpadPanel(QFrame):
         """
         super().__init__(parent)
         self._is_collapsed = True
+        # Editor is built on first expand
+        self._content_frame: QFrame | None = None
+        self._editor: QTextEdit | None = None
+        self._last_emitted = ""
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.EMIT_DELAY_MS)
+        self._emit_timer.timeout.connect(self._emit_content_changed)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Set up the panel UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(0)
 
         # Header (always visible)
         self._header = QFrame()
         self._header.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.background_tertiary};
-                border-bottom: 1px solid {theme.border_subtle};
-            }}
-            QFrame:hover {{
-                background-color: {theme.background_elevated};
-            }}
-        """)
+        self._header.setObjectName("scratchpadHeader")
         header_layout = QHBoxLayout(self._header)
         header_layout.setContentsMargins(
             metrics.padding_medium,
@@ -66,69 +66,37 @@ class ScratchpadPanel(QFrame):
 
         # Collapse/expand indicator
         self._toggle_indicator = QLabel("▶")
-        self._toggle_indicator.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: 10px;
-                font-family: {fonts.ui};
-            }}
-        """)
+        self._toggle_indicator.setObjectName("scratchpadIndicator")
         header_layout.addWidget(self._toggle_indicator)
 
         # Title
         title = QLabel("SCRATCHPAD")
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: 10px;
-                font-weight: 600;
-                letter-spacing: 1px;
-                font-family: {fonts.ui};
-            }}
-        """)
+        title.setObjectName("scratchpadTitle")
         header_layout.addWidget(title)
 
         # Visibility indicator
         self._visibility_label = QLabel("(visible to model)")
-        self._visibility_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_disabled};
-                font-size: 9px;
-                font-family: {fonts.ui};
-            }}
-        """)
+        self._visibility_label.setObjectName("scratchpadVisibility")
         header_layout.addWidget(self._visibility_label)
         header_layout.addStretch()
 
         # Clear button
         self._clear_btn = QPushButton("Clear")
         self._clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {theme.text_disabled};
-                border: none;
-                font-size: 10px;
-                font-family: {fonts.ui};
-                padding: 2px 6px;
-            }}
-            QPushButton:hover {{
-                color: {theme.text_muted};
-            }}
-        """)
+        self._clear_btn.setObjectName("scratchpadClearButton")
         self._clear_btn.clicked.connect(self._on_clear)
         self._clear_btn.hide()  # Only visible when expanded
         header_layout.addWidget(self._clear_btn)
 
-        layout.addWidget(self._header)
+        self._layout.addWidget(self._header)
+
+        # Make header clickable
+        self._header.mousePressEvent = self._on_header_clicked
 
-        # Content area (collapsible)
+    def _build_content(self) -> None:
+        """Build the collapsible editor area."""
         self._content_frame = QFrame()
-        self._content_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.background_tertiary};
-            }}
-        """)
+        self._content_frame.setObjectName("scratchpadContent")
         content_layout = QVBoxLayout(self._content_frame)
         content_layout.setContentsMargins(
             metrics.padding_medium,
@@ -146,35 +114,12 @@ class ScratchpadPanel(QFrame):
         )
         self._editor.setMinimumHeight(80)
         self._editor.setMaximumHeight(200)
-        self._editor.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border_subtle};
-                border-radius: {metrics.radius_small}px;
-                padding: {metrics.padding_small}px;
-                font-size: {metrics.font_small}px;
-                font-family: {fonts.mono};
-            }}
-            QTextEdit:focus {{
-                border-color: {theme.accent};
-            }}
-        """)
+        self._editor.setObjectName("scratchpadEditor")
         self._editor.textChanged.connect(self._on_text_changed)
         content_layout.addWidget(self._editor)
 
-        self._content_frame.hide()  # Start collapsed
-        layout.addWidget(self._content_frame)
-
-        # Frame styling
-        self.setStyleSheet(f"""
-            ScratchpadPanel {{
-                background-color: {theme.background_tertiary};
-            }}
-        """)
-
-        # Make header clickable
-        self._header.mousePressEvent = self._on_header_clicked
+        self._content_frame.setVisible(not self._is_collapsed)
+        self._layout.addWidget(self._content_frame)
 
     def _on_header_clicked(self, event) -> None:
         """Handle header click to toggle collapse."""
@@ -183,6 +128,8 @@ class ScratchpadPanel(QFrame):
     def toggle(self) -> None:
         """Toggle the collapsed/expanded state."""
         self._is_collapsed = not self._is_collapsed
+        if self._content_frame is None:
+            self._build_content()
         self._content_frame.setVisible(not self._is_collapsed)
         self._clear_btn.setVisible(not self._is_collapsed)
         self._toggle_indicator.setText("▼" if not self._is_collapsed else "▶")
@@ -198,12 +145,19 @@ class ScratchpadPanel(QFrame):
             self.toggle()
 
     def _on_text_changed(self) -> None:
-        """Handle text changes."""
-        self.content_changed.emit(self._editor.toPlainText())
+        """Handle text changes by restarting the emit timer."""
+        self._emit_timer.start()
+
+    def _emit_content_changed(self) -> None:
+        """Emit content_changed once typing pauses, if the text changed."""
+        content = self.get_content()
+        if content != self._last_emitted:
+            self._last_emitted = content
+            self.content_changed.emit(content)
 
     def _on_clear(self) -> None:
         """Clear the scratchpad content."""
-        self._editor.clear()
+        self.clear()
 
     def get_content(self) -> str:
         """Get the scratchpad content.
@@ -211,6 +165,8 @@ class ScratchpadPanel(QFrame):
         Returns:
             Current scratchpad text
         """
+        if self._editor is None:
+            return ""
         return self._editor.toPlainText()
 
     def set_content(self, content: str) -> None:
@@ -219,13 +175,18 @@ class ScratchpadPanel(QFrame):
         Args:
             content: Text to set
         """
+        if self._editor is None:
+            if not content:
+                return
+            self._build_content()
         self._editor.blockSignals(True)
         self._editor.setPlainText(content)
         self._editor.blockSignals(False)
 
     def clear(self) -> None:
         """Clear the scratchpad content."""
-        self._editor.clear()
+        if self._editor is not None:
+            self._editor.clear()
 
     def is_empty(self) -> bool:
         """Check if scratchpad is empty.
@@ -233,7 +194,7 @@ class ScratchpadPanel(QFrame):
         Returns:
             True if empty
         """
-        return not self._editor.toPlainText().strip()
+        return not self.get_content().strip()
 
     def focus_editor(self) -> None:
         """Focus the editor and expand if collapsed."""
@@ -1,23 +1,48 @@
 """Side panel for quick questions without polluting main conversation."""
 
-from typing import Optional
-from datetime import datetime
+import math
+from typing import Dict, List, Tuple
 
 from PySide6.QtWidgets import (
+    QApplication,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
+    QListView,
+    QMenu,
     QPushButton,
     QFrame,
-    QTextEdit,
-    QScrollArea,
-    QSizePolicy,
+    QPlainTextEdit,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+)
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    Slot,
+    QEvent,
+    QMetaObject,
+    QAbstractListModel,
+    QModelIndex,
+    QPoint,
+    QRect,
+    QSize,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPen,
+    QStaticText,
+    QTextOption,
+    QTransform,
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QKeyEvent
 
 from ..config.themes import theme, fonts, metrics
+from .painting import css_font
 
 
 class SideInputPanel(QFrame):
@@ -46,65 +71,30 @@ class SideInputPanel(QFrame):
         layout.setSpacing(metrics.padding_small)
 
         # Text input
-        self._input = QTextEdit()
+        self._input = QPlainTextEdit()
         self._input.setPlaceholderText("Ask a quick side question...")
         self._input.setMaximumHeight(80)
-        self._input.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-                padding: {metrics.padding_small}px;
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.chat};
-            }}
-            QTextEdit:focus {{
-                border: 2px solid {theme.accent};
-            }}
-        """)
+        self._input.setObjectName("sideInput")
         self._input.installEventFilter(self)
         layout.addWidget(self._input, stretch=1)
 
         # Send button
         self._send_btn = QPushButton("Ask")
         self._send_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._send_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.accent};
-                color: white;
-                border: none;
-                border-radius: {metrics.radius_medium}px;
-                padding: {metrics.padding_medium}px {metrics.padding_large}px;
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.ui};
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {theme.accent_hover};
-            }}
-            QPushButton:disabled {{
-                background-color: {theme.text_disabled};
-            }}
-        """)
+        self._send_btn.setObjectName("sideSendButton")
         self._send_btn.clicked.connect(self._on_send)
         layout.addWidget(self._send_btn)
 
-        self.setStyleSheet(f"""
-            SideInputPanel {{
-                background-color: {theme.background_tertiary};
-                border-top: 1px solid {theme.border_subtle};
-            }}
-        """)
-
     def eventFilter(self, obj, event) -> bool:
         """Handle key events for Enter to send."""
-        if obj == self._input and isinstance(event, QKeyEvent):
+        # Enum compare first: most events reaching the filter aren't keys
+        if event.type() == QEvent.Type.KeyPress and obj is self._input:
             if event.key() == Qt.Key.Key_Return and not event.modifiers():
                 self._on_send()
                 return True
         return super().eventFilter(obj, event)
 
+    @Slot()
     def _on_send(self) -> None:
         """Handle send button click."""
         text = self._input.toPlainText().strip()
@@ -126,77 +116,219 @@ class SideInputPanel(QFrame):
         self._input.setFocus()
 
 
-class SideMessageBubble(QFrame):
-    """Simple message bubble for side panel."""
+class SideMessagesModel(QAbstractListModel):
+    """List model of side panel messages as (role, content) pairs.
+
+    Content longer than PREVIEW_CHARS is shown cropped until the row is
+    expanded, so a huge answer does not have to be laid out in full.
+    """
+
+    RoleRole = Qt.ItemDataRole.UserRole
+    ContentRole = Qt.ItemDataRole.UserRole + 1
+    PREVIEW_CHARS = 2000
+
+    def __init__(self, parent: QWidget | None = None):
+        """Initialize the model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._messages: List[Tuple[str, str]] = []
+        # Cropped display text for long messages that are not expanded
+        self._previews: Dict[int, str] = {}
 
-    def __init__(
-        self,
-        role: str,
-        content: str,
-        parent: QWidget | None = None
-    ):
-        """Initialize the message bubble.
+    def _track_preview(self, row: int, content: str) -> None:
+        """Remember a cropped preview for a message if it is long."""
+        if len(content) > self.PREVIEW_CHARS:
+            self._previews[row] = content[:self.PREVIEW_CHARS].rstrip() + "…"
+
+    def append(self, role: str, content: str) -> None:
+        """Append a message.
 
         Args:
             role: "user" or "assistant"
             content: Message content
-            parent: Parent widget
+        """
+        row = len(self._messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._messages.append((role, content))
+        self._track_preview(row, content)
+        self.endInsertRows()
+
+    def is_cropped(self, row: int) -> bool:
+        """Return True if a message is currently shown as a preview."""
+        return row in self._previews
+
+    def expand(self, row: int) -> None:
+        """Show the full content of a cropped message.
+
+        Args:
+            row: Message row
+        """
+        if self._previews.pop(row, None) is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def clear(self) -> None:
+        """Remove all messages."""
+        if not self._messages:
+            return
+        self.beginResetModel()
+        self._messages = []
+        self._previews = {}
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of messages."""
+        return 0 if parent.isValid() else len(self._messages)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return the shown text (DisplayRole), full text (ContentRole) or
+        speaker (RoleRole) of a row."""
+        if not index.isValid() or not 0 <= index.row() < len(self._messages):
+            return None
+        speaker, content = self._messages[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._previews.get(index.row(), content)
+        if role == self.ContentRole:
+            return content
+        if role == self.RoleRole:
+            return speaker
+        return None
+
+
+class SideBubbleDelegate(QStyledItemDelegate):
+    """Paints side panel message bubbles without per-message widgets."""
+
+    PAD_H = metrics.padding_medium
+    PAD_V = metrics.padding_small
+    ROLE_SPACING = 2
+    BUBBLE_PAD = metrics.padding_small
+    ROW_GAP = metrics.padding_small
+
+    def __init__(self, parent: QWidget | None = None):
+        """Initialize the delegate.
+
+        Args:
+            parent: Parent object
         """
         super().__init__(parent)
-        self.role = role
-        self._setup_ui(content)
+        self._role_font = css_font(fonts.ui, 10, QFont.Weight.DemiBold)
+        self._content_font = css_font(fonts.chat, metrics.font_normal)
+        role_height = QFontMetrics(self._role_font).height()
+        # Fixed row geometry: bubble offset and everything around the text
+        self._bubble_top = self.PAD_V + role_height + self.ROLE_SPACING
+        self._row_chrome = self._bubble_top + 2 * self.BUBBLE_PAD + self.PAD_V + self.ROW_GAP
+        self._bubble_chrome = 2 * self.BUBBLE_PAD
+        self._radius = metrics.radius_medium
+        # Brushes and pens are built once; setBrush/setPen with a QColor
+        # would construct a new one on every paint
+        self._role_pen = QPen(QColor(theme.text_muted))
+        self._bubble_colors = {
+            "user": (QBrush(QColor(theme.user_bubble_start)), QPen(QColor("#ffffff"))),
+            "assistant": (
+                QBrush(QColor(theme.background_elevated)),
+                QPen(QColor(theme.text_primary)),
+            ),
+        }
+        self._text_option = QTextOption()
+        self._text_option.setWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+        self._role_texts = {
+            "user": self._prepared("You", self._role_font),
+            "assistant": self._prepared("Side", self._role_font),
+        }
+        # Laid-out content per message text, valid for _cached_width only
+        self._static_cache: Dict[str, QStaticText] = {}
+        self._cached_width = -1
+
+    def _prepared(self, text: str, font: QFont, width: int = -1) -> QStaticText:
+        """Lay out plain text once so paints reuse the glyph positions."""
+        static = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+        static.setTextOption(self._text_option)
+        static.setTextWidth(width)
+        static.prepare(QTransform(), font)
+        return static
+
+    def _text_width(self, option: QStyleOptionViewItem) -> int:
+        """Return the text width available inside a bubble."""
+        view = option.widget
+        width = view.viewport().width() if view is not None else option.rect.width()
+        return max(1, width - 2 * (self.PAD_H + self.BUBBLE_PAD))
+
+    def clear_cache(self) -> None:
+        """Drop laid-out text for messages that are no longer shown."""
+        self._static_cache.clear()
+
+    def _content_text(self, text: str, width: int) -> QStaticText:
+        """Return the laid-out content for a message, cached per width."""
+        if width != self._cached_width:
+            self._static_cache.clear()
+            self._cached_width = width
+        static = self._static_cache.get(text)
+        if static is None:
+            static = self._prepared(text, self._content_font, width)
+            self._static_cache[text] = static
+        return static
+
+    def _text_height(self, text: str, width: int) -> int:
+        """Return the wrapped height of content text."""
+        return math.ceil(self._content_text(text, width).size().height())
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Return the row size for a message."""
+        width = self._text_width(option)
+        return QSize(
+            width + 2 * (self.PAD_H + self.BUBBLE_PAD),
+            self._row_chrome + self._text_height(index.data(), width),
+        )
 
-    def _setup_ui(self, content: str) -> None:
-        """Set up the bubble UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(
-            metrics.padding_medium,
-            metrics.padding_small,
-            metrics.padding_medium,
-            metrics.padding_small,
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """Draw the role label and the rounded content bubble."""
+        speaker = index.data(SideMessagesModel.RoleRole)
+        content = index.data()
+        background, foreground = self._bubble_colors.get(
+            speaker, self._bubble_colors["assistant"]
         )
-        layout.setSpacing(2)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = option.rect
+        x = rect.left() + self.PAD_H
+        top = rect.top()
+        bubble_top = top + self._bubble_top
+        chrome = self._bubble_chrome
+        radius = self._radius
+        width = self._text_width(option)
+        static = self._content_text(content, width)
 
         # Role label
-        role_text = "You" if self.role == "user" else "Side"
-        role_label = QLabel(role_text)
-        role_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: 10px;
-                font-weight: 600;
-                font-family: {fonts.ui};
-            }}
-        """)
-        layout.addWidget(role_label)
-
-        # Content
-        content_label = QLabel(content)
-        content_label.setWordWrap(True)
-        content_label.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextSelectableByMouse
+        painter.setFont(self._role_font)
+        painter.setPen(self._role_pen)
+        painter.drawStaticText(
+            x, top + self.PAD_V, self._role_texts["user" if speaker == "user" else "assistant"]
         )
 
-        if self.role == "user":
-            bg_color = theme.user_bubble_start
-            text_color = "#ffffff"
-        else:
-            bg_color = theme.background_elevated
-            text_color = theme.text_primary
-
-        content_label.setStyleSheet(f"""
-            QLabel {{
-                color: {text_color};
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.chat};
-                padding: {metrics.padding_small}px;
-                background-color: {bg_color};
-                border-radius: {metrics.radius_medium}px;
-            }}
-        """)
-        layout.addWidget(content_label)
+        # Bubble
+        bubble = QRect(
+            x,
+            bubble_top,
+            width + chrome,
+            math.ceil(static.size().height()) + chrome,
+        )
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(bubble, radius, radius)
+
+        painter.setFont(self._content_font)
+        painter.setPen(foreground)
+        painter.drawStaticText(
+            x + self.BUBBLE_PAD, bubble_top + self.BUBBLE_PAD, static
+        )
 
-        self.setStyleSheet("SideMessageBubble { background: transparent; }")
+        painter.restore()
 
 
 class SidePanel(QFrame):
@@ -213,6 +345,13 @@ class SidePanel(QFrame):
             parent: Parent widget
         """
         super().__init__(parent)
+        # The model is cheap and takes messages at any time; the view and
+        # its delegate are built on first show
+        self._messages_model = SideMessagesModel(self)
+        self._messages_view: QListView | None = None
+        self._message_menu: QMenu | None = None
+        # One queued scroll covers any burst of appended messages
+        self._scroll_pending = False
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -220,18 +359,14 @@ class SidePanel(QFrame):
         self.setMinimumWidth(400)
         self.setMaximumWidth(500)
 
-        layout = QVBoxLayout(self)
+        self._layout = QVBoxLayout(self)
+        layout = self._layout
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         # Header
         header = QFrame()
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme.background_tertiary};
-                border-bottom: 1px solid {theme.border_subtle};
-            }}
-        """)
+        header.setObjectName("sideHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(
             metrics.padding_large,
@@ -243,15 +378,7 @@ class SidePanel(QFrame):
 
         # Title
         title = QLabel("SIDE QUESTION")
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: 11px;
-                font-weight: 600;
-                letter-spacing: 1px;
-                font-family: {fonts.ui};
-            }}
-        """)
+        title.setObjectName("sideTitle")
         header_layout.addWidget(title)
         header_layout.addStretch()
 
@@ -259,22 +386,8 @@ class SidePanel(QFrame):
         self._merge_btn = QPushButton("Merge")
         self._merge_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self._merge_btn.setToolTip("Merge insights into main conversation")
-        self._merge_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {theme.text_muted};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_small}px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-family: {fonts.ui};
-            }}
-            QPushButton:hover {{
-                background-color: {theme.background_elevated};
-                color: {theme.success};
-                border-color: {theme.success};
-            }}
-        """)
+        self._merge_btn.setObjectName("sideMergeButton")
+        # Signal-to-signal forwards stay in C++; no Python hop per click
         self._merge_btn.clicked.connect(self.merge_requested)
         header_layout.addWidget(self._merge_btn)
 
@@ -282,73 +395,41 @@ class SidePanel(QFrame):
         close_btn = QPushButton("✕")
         close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         close_btn.setFixedSize(24, 24)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {theme.text_muted};
-                border: none;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                color: {theme.error};
-            }}
-        """)
+        close_btn.setObjectName("sideCloseButton")
         close_btn.clicked.connect(self.closed)
         header_layout.addWidget(close_btn)
 
         layout.addWidget(header)
 
-        # Messages area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {theme.background_secondary};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background: {theme.background_secondary};
-                width: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {theme.border};
-                border-radius: 3px;
-                min-height: 20px;
-            }}
-        """)
-
-        self._messages_container = QWidget()
-        self._messages_container.setStyleSheet(f"""
-            QWidget {{
-                background-color: {theme.background_secondary};
-            }}
-        """)
-        self._messages_layout = QVBoxLayout(self._messages_container)
-        self._messages_layout.setContentsMargins(
-            metrics.padding_medium,
-            metrics.padding_medium,
-            metrics.padding_medium,
-            metrics.padding_medium,
-        )
-        self._messages_layout.setSpacing(metrics.padding_small)
-        self._messages_layout.addStretch()
-
-        scroll.setWidget(self._messages_container)
-        self._scroll_area = scroll
-        layout.addWidget(scroll, stretch=1)
-
         # Input panel
         self.input_panel = SideInputPanel()
         layout.addWidget(self.input_panel)
 
-        # Panel styling
-        self.setStyleSheet(f"""
-            SidePanel {{
-                background-color: {theme.background_secondary};
-                border-left: 1px solid {theme.border};
-            }}
-        """)
+    def showEvent(self, event) -> None:
+        """Build the messages view the first time the panel is shown."""
+        if self._messages_view is None:
+            self._setup_messages_view()
+        super().showEvent(event)
+
+    def _setup_messages_view(self) -> None:
+        """Create the message list view and its delegate."""
+        self._messages_view = QListView()
+        self._messages_view.setModel(self._messages_model)
+        delegate = SideBubbleDelegate(self._messages_view)
+        self._messages_model.modelReset.connect(delegate.clear_cache)
+        self._messages_view.setItemDelegate(delegate)
+        self._messages_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self._messages_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self._messages_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self._messages_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._messages_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._messages_view.customContextMenuRequested.connect(self._show_message_menu)
+        self._messages_view.doubleClicked.connect(self._expand_message)
+        self._messages_view.setObjectName("sideMessages")
+        # SidePanel already fills this area; don't paint the viewport again
+        self._messages_view.viewport().setAutoFillBackground(False)
+        # Between the header and the input panel
+        self._layout.insertWidget(1, self._messages_view, stretch=1)
 
     def add_user_message(self, content: str) -> None:
         """Add a user message to the panel.
@@ -356,8 +437,7 @@ class SidePanel(QFrame):
         Args:
             content: Message content
         """
-        bubble = SideMessageBubble("user", content)
-        self._add_bubble(bubble)
+        self._add_message("user", content)
 
     def add_assistant_message(self, content: str) -> None:
         """Add an assistant message to the panel.
@@ -365,20 +445,7 @@ class SidePanel(QFrame):
         Args:
             content: Message content
         """
-        bubble = SideMessageBubble("assistant", content)
-        self._add_bubble(bubble)
-
-    def start_assistant_message(self) -> None:
-        """Start an assistant message (show typing indicator)."""
-        # For now, just add a placeholder that will be replaced
-        pass
-
-    def append_to_assistant_message(self, text: str) -> None:
-        """Append text to current assistant message.
-
-        For side panel, we accumulate until finish.
-        """
-        pass
+        self._add_message("assistant", content)
 
     def finish_assistant_message(self, full_content: str) -> None:
         """Finish assistant message with full content.
@@ -388,34 +455,76 @@ class SidePanel(QFrame):
         """
         self.add_assistant_message(full_content)
 
-    def _add_bubble(self, bubble: SideMessageBubble) -> None:
-        """Add a bubble to the messages layout.
+    def _add_message(self, role: str, content: str) -> None:
+        """Append a message to the list and scroll to it.
 
         Args:
-            bubble: The message bubble to add
+            role: "user" or "assistant"
+            content: Message content
         """
-        # Remove stretch
-        stretch_item = self._messages_layout.takeAt(
-            self._messages_layout.count() - 1
-        )
-
-        self._messages_layout.addWidget(bubble)
-        self._messages_layout.addStretch()
+        self._messages_model.append(role, content)
 
         # Scroll to bottom
-        QTimer.singleShot(10, self._scroll_to_bottom)
+        self._request_scroll()
 
+    def _request_scroll(self) -> None:
+        """Scroll to the bottom once control returns to the event loop."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QMetaObject.invokeMethod(
+                self, "_scroll_to_bottom", Qt.ConnectionType.QueuedConnection
+            )
+
+    @Slot()
     def _scroll_to_bottom(self) -> None:
         """Scroll to bottom of messages."""
-        scrollbar = self._scroll_area.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._scroll_pending = False
+        if self._messages_view is not None:
+            self._messages_view.scrollToBottom()
+
+    def _show_message_menu(self, pos: QPoint) -> None:
+        """Offer copying (or expanding) the message under the cursor.
+
+        Bubbles are painted rather than QLabels, so this replaces
+        mouse text selection.
+
+        Args:
+            pos: Click position in viewport coordinates
+        """
+        index = self._messages_view.indexAt(pos)
+        if not index.isValid():
+            return
+        # One menu serves every right-click
+        if self._message_menu is None:
+            self._message_menu = QMenu(self)
+            self._copy_action = self._message_menu.addAction("Copy")
+            self._more_action = self._message_menu.addAction("Show more")
+        self._more_action.setVisible(self._messages_model.is_cropped(index.row()))
+
+        chosen = self._message_menu.exec(self._messages_view.viewport().mapToGlobal(pos))
+        if chosen is self._copy_action:
+            QApplication.clipboard().setText(index.data(SideMessagesModel.ContentRole))
+        elif chosen is self._more_action:
+            self._expand_message(index)
+
+    def _expand_message(self, index: QModelIndex) -> None:
+        """Swap a cropped message for its full content."""
+        self._messages_model.expand(index.row())
+        # Row heights are cached by the view; relayout once for the new height
+        self._messages_view.doItemsLayout()
 
     def clear(self) -> None:
         """Clear all messages."""
-        while self._messages_layout.count() > 1:
-            item = self._messages_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        view = self._messages_view
+        if view is None:
+            self._messages_model.clear()
+            return
+        # The reset also relayouts and updates the scrollbar; paint once
+        view.setUpdatesEnabled(False)
+        try:
+            self._messages_model.clear()
+        finally:
+            view.setUpdatesEnabled(True)
 
     def set_input_enabled(self, enabled: bool) -> None:
         """Enable or disable input.
@@ -1,5 +1,7 @@
 """Premium sidebar panel with model selector and settings."""
 
+import os
+from itertools import groupby
 from typing import List
 from pathlib import Path
 
@@ -12,14 +14,22 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QPushButton,
     QFrame,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QFileDialog,
     QMenu,
     QCheckBox,
     QMessageBox,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QModelIndex,
+    QPoint,
+    QSignalBlocker,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 from ..config.themes import theme, fonts, metrics
 from ..config.models import MODELS, get_available_models, ModelConfig
@@ -27,6 +37,253 @@ from ..orchestrator.toc_generator import TOCEntry
 from .toc_panel import TOCPanel
 
 
+# Provider headers in the model selector, in display order
+_PROVIDER_NAMES = {
+    "anthropic": "Anthropic",
+    "openai": "OpenAI",
+    "openrouter": "OpenRouter",
+    "gabai": "Gab AI",
+}
+_PROVIDER_ORDER = {provider: i for i, provider in enumerate(_PROVIDER_NAMES)}
+
+# Crucible router modes; the first is the default
+_ROUTER_MODES = ("Auto", "Custom-Role", "Custom-Cost")
+
+# Models with configured API keys; reset by ModelSelector.refresh()
+_available_models: List[ModelConfig] | None = None
+
+
+def _get_available_models() -> List[ModelConfig]:
+    """Get the cached list of models with configured API keys."""
+    global _available_models
+    if _available_models is None:
+        _available_models = get_available_models()
+    return _available_models
+
+
+# Stylesheets are formatted once at import; the theme does not change at runtime.
+_MODEL_COMBO_QSS = f"""
+    QComboBox {{
+        background-color: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: {metrics.radius_medium}px;
+        padding: {metrics.padding_medium}px;
+        min-height: 28px;
+        font-family: {fonts.ui};
+        font-size: {metrics.font_normal}px;
+    }}
+    QComboBox:hover {{
+        border-color: {theme.accent};
+    }}
+    QComboBox:focus {{
+        border: 2px solid {theme.border_focus};
+    }}
+    QComboBox::drop-down {{
+        border: none;
+        width: 24px;
+    }}
+    QComboBox::down-arrow {{
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 6px solid {theme.text_muted};
+        margin-right: {metrics.padding_small}px;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: {metrics.radius_medium}px;
+        selection-background-color: {theme.accent};
+        outline: none;
+        padding: {metrics.padding_small}px;
+    }}
+"""
+_DOC_LIST_QSS = f"""
+    QListView {{
+        background-color: {theme.background};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: {metrics.radius_medium}px;
+        font-size: {metrics.font_small}px;
+        font-family: {fonts.ui};
+        outline: none;
+    }}
+    QListView::item {{
+        padding: {metrics.padding_small}px {metrics.padding_medium}px;
+        border-radius: {metrics.radius_small}px;
+        border-left: 3px solid transparent;
+    }}
+    QListView::item:selected {{
+        background-color: {theme.accent_subtle};
+        border-left: 3px solid {theme.accent};
+    }}
+    QListView::item:hover {{
+        background-color: {theme.background_elevated};
+    }}
+"""
+_ADD_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        color: {theme.text_muted};
+        border: 1px dashed {theme.border};
+        border-radius: {metrics.radius_small}px;
+        padding: {metrics.padding_small}px {metrics.padding_medium}px;
+        font-size: {metrics.font_small}px;
+        font-family: {fonts.ui};
+    }}
+    QPushButton:hover {{
+        background-color: {theme.background_elevated};
+        color: {theme.accent};
+        border-color: {theme.accent};
+    }}
+"""
+_CLEAR_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        color: {theme.text_disabled};
+        border: 1px solid {theme.border_subtle};
+        border-radius: {metrics.radius_small}px;
+        padding: {metrics.padding_small}px {metrics.padding_medium}px;
+        font-size: {metrics.font_small}px;
+        font-family: {fonts.ui};
+    }}
+    QPushButton:hover {{
+        background-color: {theme.background_elevated};
+        color: {theme.error};
+        border-color: {theme.error};
+    }}
+"""
+_MENU_QSS = f"""
+    QMenu {{
+        background-color: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: {metrics.radius_medium}px;
+        padding: {metrics.padding_small}px;
+        font-family: {fonts.ui};
+        font-size: {metrics.font_normal}px;
+    }}
+    QMenu::item {{
+        padding: {metrics.padding_small}px {metrics.padding_large}px;
+        border-radius: {metrics.radius_small}px;
+    }}
+    QMenu::item:selected {{
+        background-color: {theme.accent};
+    }}
+"""
+_TOGGLE_QSS = f"""
+    QCheckBox {{
+        color: {theme.text_primary};
+        font-size: {metrics.font_normal}px;
+        font-family: {fonts.ui};
+        spacing: {metrics.padding_small}px;
+    }}
+    QCheckBox::indicator {{
+        width: 16px;
+        height: 16px;
+        border-radius: {metrics.radius_small}px;
+        border: 1px solid {theme.border};
+        background-color: {theme.background};
+    }}
+    QCheckBox::indicator:checked {{
+        background-color: {theme.accent};
+        border-color: {theme.accent};
+    }}
+    QCheckBox::indicator:hover {{
+        border-color: {theme.accent};
+    }}
+"""
+_ROUTER_LABEL_QSS = f"""
+    QLabel {{
+        color: {theme.text_secondary};
+        font-size: {metrics.font_small}px;
+        font-family: {fonts.ui};
+        background: transparent;
+    }}
+"""
+_ROUTER_COMBO_QSS = f"""
+    QComboBox {{
+        background-color: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        border-radius: {metrics.radius_small}px;
+        padding: {metrics.padding_small}px;
+        min-height: 20px;
+        font-family: {fonts.ui};
+        font-size: {metrics.font_small}px;
+    }}
+    QComboBox:hover {{
+        border-color: {theme.accent};
+    }}
+    QComboBox:disabled {{
+        color: {theme.text_disabled};
+        background-color: {theme.background};
+    }}
+    QComboBox::drop-down {{
+        border: none;
+        width: 20px;
+    }}
+    QComboBox::down-arrow {{
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 5px solid {theme.text_muted};
+        margin-right: {metrics.padding_small}px;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {theme.background_elevated};
+        color: {theme.text_primary};
+        border: 1px solid {theme.border};
+        selection-background-color: {theme.accent};
+    }}
+"""
+_WARNING_LABEL_QSS = f"""
+    QLabel {{
+        color: {theme.budget_orange};
+        font-size: {metrics.font_small}px;
+        font-family: {fonts.ui};
+        background: transparent;
+    }}
+"""
+_REGENERATE_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        color: {theme.text_secondary};
+        border: 1px solid {theme.border};
+        border-radius: {metrics.radius_medium}px;
+        padding: {metrics.padding_medium}px;
+        font-size: {metrics.font_normal}px;
+        font-family: {fonts.ui};
+    }}
+    QPushButton:hover {{
+        background-color: {theme.background_elevated};
+        color: {theme.text_primary};
+        border-color: {theme.accent};
+    }}
+    QPushButton:pressed {{
+        background-color: {theme.accent_pressed};
+        color: white;
+    }}
+    QPushButton:disabled {{
+        color: {theme.text_disabled};
+        border-color: {theme.border_subtle};
+    }}
+"""
+
+
+def _budget_bucket(percentage: int) -> str:
+    """Return the usage bucket for a context budget percentage."""
+    if percentage >= 90:
+        return "red"
+    if percentage >= 80:
+        return "orange"
+    if percentage >= 60:
+        return "yellow"
+    return "green"
+
+
 class ModelSelector(QFrame):
     """Premium model selection dropdown with provider grouping."""
 
@@ -40,6 +297,7 @@ class ModelSelector(QFrame):
         """
         super().__init__(parent)
         self._current_model_id: str = ""
+        self._id_to_index: dict[str, int] = {}  # model_id -> combo row
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -55,119 +313,66 @@ class ModelSelector(QFrame):
 
         # Section label - uppercase, muted
         label = QLabel("MODEL")
-        label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: {metrics.font_small}px;
-                font-weight: 600;
-                font-family: {fonts.ui};
-                letter-spacing: 1px;
-                background: transparent;
-            }}
-        """)
+        label.setObjectName("sidebarSectionLabel")
         layout.addWidget(label)
 
         # Premium dropdown
         self.combo = QComboBox()
-        self.combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-                padding: {metrics.padding_medium}px;
-                min-height: 28px;
-                font-family: {fonts.ui};
-                font-size: {metrics.font_normal}px;
-            }}
-            QComboBox:hover {{
-                border-color: {theme.accent};
-            }}
-            QComboBox:focus {{
-                border: 2px solid {theme.border_focus};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid {theme.text_muted};
-                margin-right: {metrics.padding_small}px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-                selection-background-color: {theme.accent};
-                outline: none;
-                padding: {metrics.padding_small}px;
-            }}
-        """)
-        self.combo.currentIndexChanged.connect(self._on_selection_changed)
+        self.combo.setStyleSheet(_MODEL_COMBO_QSS)
+        # activated fires for user choices only, not programmatic selection
+        self.combo.activated.connect(self._on_selection_changed)
         layout.addWidget(self.combo)
 
         # Populate with available models
         self._populate_models()
 
-        # Premium frame styling
-        self.setStyleSheet(f"""
-            ModelSelector {{
-                background-color: {theme.background_elevated};
-                border-radius: {metrics.radius_large}px;
-                border: 1px solid {theme.border_subtle};
-            }}
-        """)
-
     def _populate_models(self) -> None:
-        """Populate the dropdown with available models."""
-        self.combo.clear()
+        """Populate the dropdown with available models.
 
-        available = get_available_models()
+        Rows are built in a detached model that is installed in one step,
+        so the combo sees a single reset instead of a signal per item.
+        """
+        self._id_to_index.clear()
+        items = QStandardItemModel(self.combo)
 
-        # Group by provider
-        providers = {"anthropic": [], "openai": [], "openrouter": [], "gabai": []}
-        for model in available:
-            providers[model.provider].append(model)
+        # Group by provider; the sort is stable so model order is kept
+        available = sorted(
+            _get_available_models(), key=lambda m: _PROVIDER_ORDER[m.provider]
+        )
 
         # Add models grouped by provider
-        provider_names = {
-            "anthropic": "Anthropic",
-            "openai": "OpenAI",
-            "openrouter": "OpenRouter",
-            "gabai": "Gab AI",
-        }
-
-        for provider_id, models in providers.items():
-            if models:
-                # Add separator/header for provider
-                self.combo.addItem(f"── {provider_names[provider_id]} ──", None)
-                # Make header non-selectable
-                idx = self.combo.count() - 1
-                self.combo.model().item(idx).setEnabled(False)
-
-                for model in models:
-                    self.combo.addItem(model.display_name, model.model_id)
+        for provider_id, models in groupby(available, key=lambda m: m.provider):
+            # Add separator/header for provider (non-selectable)
+            header = QStandardItem(f"── {_PROVIDER_NAMES[provider_id]} ──")
+            header.setEnabled(False)
+            items.appendRow(header)
+
+            for model in models:
+                item = QStandardItem(model.display_name)
+                item.setData(model.model_id, Qt.ItemDataRole.UserRole)
+                self._id_to_index[model.model_id] = items.rowCount()
+                items.appendRow(item)
 
         # If no models available, show message
-        if self.combo.count() == 0:
-            self.combo.addItem("No API keys configured", None)
+        if items.rowCount() == 0:
+            items.appendRow(QStandardItem("No API keys configured"))
             self.combo.setEnabled(False)
 
+        # Replaces (and deletes) the previous model
+        self.combo.setModel(items)
+
     def set_model(self, model_id: str) -> None:
         """Set the currently selected model.
 
         Args:
             model_id: The model ID to select
         """
-        for i in range(self.combo.count()):
-            if self.combo.itemData(i) == model_id:
-                self.combo.setCurrentIndex(i)
-                self._current_model_id = model_id
-                return
+        index = self._id_to_index.get(model_id)
+        if index is not None:
+            # Programmatic selection; don't echo model_changed to the caller
+            with QSignalBlocker(self.combo):
+                self.combo.setCurrentIndex(index)
+            self._current_model_id = model_id
 
     def get_model(self) -> str | None:
         """Get the currently selected model ID.
@@ -179,15 +384,18 @@ class ModelSelector(QFrame):
 
     def refresh(self) -> None:
         """Refresh the model list (e.g., after API keys change)."""
+        global _available_models
+        _available_models = None
         current = self._current_model_id
-        self._populate_models()
-        if current:
-            self.set_model(current)
+        with QSignalBlocker(self.combo):
+            self._populate_models()
+            if current:
+                self.set_model(current)
 
     def _on_selection_changed(self, index: int) -> None:
-        """Handle selection change."""
+        """Handle a model chosen by the user."""
         model_id = self.combo.itemData(index)
-        if model_id and model_id != self._current_model_id:
+        if model_id:
             self._current_model_id = model_id
             self.model_changed.emit(model_id)
 
@@ -195,6 +403,9 @@ class ModelSelector(QFrame):
 class ContextBudgetIndicator(QFrame):
     """Premium visual indicator for context window usage."""
 
+    # Token counts arrive per streamed chunk; repaint at most this often
+    FLUSH_DELAY_MS = 50
+
     def __init__(self, parent: QWidget | None = None):
         """Initialize the indicator.
 
@@ -202,6 +413,16 @@ class ContextBudgetIndicator(QFrame):
             parent: Parent widget
         """
         super().__init__(parent)
+        self._last_bucket: str | None = None
+        self._pending: tuple[int, int] | None = None
+        self._shown: tuple[int, int] | None = None
+        # The context window rarely changes; format it once per value
+        self._max_cached = -1
+        self._max_text = ""
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self._flush)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -217,16 +438,7 @@ class ContextBudgetIndicator(QFrame):
 
         # Section label
         label = QLabel("CONTEXT BUDGET")
-        label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: {metrics.font_small}px;
-                font-weight: 600;
-                font-family: {fonts.ui};
-                letter-spacing: 1px;
-                background: transparent;
-            }}
-        """)
+        label.setObjectName("sidebarSectionLabel")
         layout.addWidget(label)
 
         # Premium progress bar
@@ -235,47 +447,52 @@ class ContextBudgetIndicator(QFrame):
         self.progress.setValue(0)
         self.progress.setTextVisible(False)
         self.progress.setFixedHeight(6)
+        self.progress.setObjectName("contextBudgetBar")
         layout.addWidget(self.progress)
 
         # Token count label (must be created before _update_progress_style)
         self.token_label = QLabel("0 / 0 tokens")
-        self.token_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: {metrics.font_small}px;
-                font-family: {fonts.mono};
-                font-weight: 500;
-                background: transparent;
-            }}
-        """)
+        self.token_label.setObjectName("contextTokenLabel")
         layout.addWidget(self.token_label)
 
         # Apply initial progress style (after token_label exists)
         self._update_progress_style(0)
 
-        # Premium frame styling
-        self.setStyleSheet(f"""
-            ContextBudgetIndicator {{
-                background-color: {theme.background_elevated};
-                border-radius: {metrics.radius_large}px;
-                border: 1px solid {theme.border_subtle};
-            }}
-        """)
-
     def update(self, current: int, maximum: int) -> None:
         """Update the indicator.
 
+        Updates are coalesced; only the latest counts are drawn.
+
         Args:
             current: Current token count
             maximum: Maximum tokens (context window)
         """
+        self._pending = (current, maximum)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Apply the most recent pending counts."""
+        if self._pending is None:
+            return
+        counts = self._pending
+        self._pending = None
+        if counts == self._shown:
+            return
+        self._shown = counts
+        current, maximum = counts
         if maximum == 0:
             percentage = 0
         else:
             percentage = int((current / maximum) * 100)
 
-        self.progress.setValue(min(100, percentage))
-        self.token_label.setText(f"{current:,} / {maximum:,} tokens")
+        value = min(100, percentage)
+        if value != self.progress.value():
+            self.progress.setValue(value)
+        if maximum != self._max_cached:
+            self._max_cached = maximum
+            self._max_text = f"{maximum:,}"
+        self.token_label.setText(f"{current:,} / {self._max_text} tokens")
         self._update_progress_style(percentage)
 
     def _update_progress_style(self, percentage: int) -> None:
@@ -286,37 +503,144 @@ class ContextBudgetIndicator(QFrame):
         Args:
             percentage: Current percentage
         """
-        if percentage >= 90:
-            color = theme.budget_red
-        elif percentage >= 80:
-            color = theme.budget_orange
-        elif percentage >= 60:
-            color = theme.budget_yellow
+        bucket = _budget_bucket(percentage)
+        # Only repolish on a color change
+        if bucket == self._last_bucket:
+            return
+        self._last_bucket = bucket
+        # The global stylesheet selects colors by the "budget" property;
+        # repolish so Qt re-matches the rules without parsing any QSS
+        for widget in (self.progress, self.token_label):
+            widget.setProperty("budget", bucket)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+
+
+class DocumentListModel(QAbstractListModel):
+    """List model of attached documents, revealed to the view in batches.
+
+    Single appends are shown at once while the list is fully exposed.
+    add_many() exposes at most one batch; the rest is paged in through
+    fetchMore() in BATCH_SIZE steps as the view scrolls.
+    """
+
+    BATCH_SIZE = 50
+
+    def __init__(self, parent: QWidget | None = None):
+        """Initialize the model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._ids: List[str] = []  # doc_ids in row order
+        self._docs: dict[str, tuple[str, str]] = {}  # doc_id -> (name, path)
+        self._rows: dict[str, int] = {}  # doc_id -> row
+        self._loaded = 0  # Rows exposed to the view
+
+    def document_count(self) -> int:
+        """Return the number of documents, including unfetched ones."""
+        return len(self._ids)
+
+    def add(self, doc_id: str, name: str, path: str) -> None:
+        """Append a document.
+
+        Args:
+            doc_id: Document ID
+            name: Display name
+            path: File path
+        """
+        self._rows[doc_id] = len(self._ids)
+        self._ids.append(doc_id)
+        self._docs[doc_id] = (name, path)
+        # Show the row right away while the list is fully exposed;
+        # otherwise fetchMore() reveals it after the earlier unfetched rows
+        row = len(self._ids) - 1
+        if self._loaded == row:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._loaded += 1
+            self.endInsertRows()
+
+    def add_many(self, documents: List[tuple[str, str, str]]) -> None:
+        """Append several documents, exposing at most one batch now.
+
+        Args:
+            documents: (doc_id, name, path) tuples in order
+        """
+        if not documents:
+            return
+        fully_exposed = self._loaded == len(self._ids)
+        for doc_id, name, path in documents:
+            self._rows[doc_id] = len(self._ids)
+            self._ids.append(doc_id)
+            self._docs[doc_id] = (name, path)
+        if fully_exposed:
+            self.fetchMore(QModelIndex())
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document if present.
+
+        Args:
+            doc_id: Document ID
+        """
+        row = self._rows.pop(doc_id, None)
+        if row is None:
+            return
+        del self._docs[doc_id]
+        if row < self._loaded:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._ids[row]
+            self._loaded -= 1
+            self.endRemoveRows()
         else:
-            color = theme.budget_green
-
-        self.progress.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {theme.background};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 5px;
-            }}
-        """)
-
-        # Update label color to match
-        self.token_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: {metrics.font_small}px;
-                font-family: {fonts.mono};
-                font-weight: 500;
-                background: transparent;
-            }}
-        """)
+            del self._ids[row]
+        # Later rows moved up by one
+        for i in range(row, len(self._ids)):
+            self._rows[self._ids[i]] = i
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        if not self._ids:
+            return
+        self.beginResetModel()
+        self._ids = []
+        self._docs = {}
+        self._rows = {}
+        self._loaded = 0
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of rows fetched so far."""
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Return True while some documents are not yet exposed."""
+        return not parent.isValid() and self._loaded < len(self._ids)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Expose the next batch of documents."""
+        if parent.isValid():
+            return
+        count = min(self.BATCH_SIZE, len(self._ids) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return the name (DisplayRole), path (ToolTipRole) or id (UserRole)."""
+        if not index.isValid() or not 0 <= index.row() < self._loaded:
+            return None
+        doc_id = self._ids[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return doc_id
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._docs[doc_id][0]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._docs[doc_id][1]
+        return None
 
 
 class DocumentPanel(QFrame):
@@ -333,7 +657,9 @@ class DocumentPanel(QFrame):
             parent: Parent widget
         """
         super().__init__(parent)
-        self._documents: List[dict] = []  # {doc_id, name, path}
+        self._documents = DocumentListModel(self)
+        self._file_dialog: QFileDialog | None = None
+        self._context_menu: QMenu | None = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -349,44 +675,14 @@ class DocumentPanel(QFrame):
 
         # Section label
         label = QLabel("DOCUMENTS")
-        label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: {metrics.font_small}px;
-                font-weight: 600;
-                font-family: {fonts.ui};
-                letter-spacing: 1px;
-                background: transparent;
-            }}
-        """)
+        label.setObjectName("sidebarSectionLabel")
         layout.addWidget(label)
 
         # Premium document list
-        self.doc_list = QListWidget()
+        self.doc_list = QListView()
+        self.doc_list.setModel(self._documents)
         self.doc_list.setMaximumHeight(120)
-        self.doc_list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {theme.background};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-                font-size: {metrics.font_small}px;
-                font-family: {fonts.ui};
-                outline: none;
-            }}
-            QListWidget::item {{
-                padding: {metrics.padding_small}px {metrics.padding_medium}px;
-                border-radius: {metrics.radius_small}px;
-                border-left: 3px solid transparent;
-            }}
-            QListWidget::item:selected {{
-                background-color: {theme.accent_subtle};
-                border-left: 3px solid {theme.accent};
-            }}
-            QListWidget::item:hover {{
-                background-color: {theme.background_elevated};
-            }}
-        """)
+        self.doc_list.setStyleSheet(_DOC_LIST_QSS)
         self.doc_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.doc_list.customContextMenuRequested.connect(self._show_context_menu)
         layout.addWidget(self.doc_list)
@@ -398,106 +694,63 @@ class DocumentPanel(QFrame):
         # Add button - dashed border style
         self.add_button = QPushButton("+ Add")
         self.add_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.add_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {theme.text_muted};
-                border: 1px dashed {theme.border};
-                border-radius: {metrics.radius_small}px;
-                padding: {metrics.padding_small}px {metrics.padding_medium}px;
-                font-size: {metrics.font_small}px;
-                font-family: {fonts.ui};
-            }}
-            QPushButton:hover {{
-                background-color: {theme.background_elevated};
-                color: {theme.accent};
-                border-color: {theme.accent};
-            }}
-        """)
+        self.add_button.setStyleSheet(_ADD_BUTTON_QSS)
         self.add_button.clicked.connect(self._on_add_clicked)
         button_row.addWidget(self.add_button)
 
         # Clear all button
         self.clear_button = QPushButton("Clear All")
         self.clear_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.clear_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {theme.text_disabled};
-                border: 1px solid {theme.border_subtle};
-                border-radius: {metrics.radius_small}px;
-                padding: {metrics.padding_small}px {metrics.padding_medium}px;
-                font-size: {metrics.font_small}px;
-                font-family: {fonts.ui};
-            }}
-            QPushButton:hover {{
-                background-color: {theme.background_elevated};
-                color: {theme.error};
-                border-color: {theme.error};
-            }}
-        """)
+        self.clear_button.setStyleSheet(_CLEAR_BUTTON_QSS)
         self.clear_button.clicked.connect(self._on_clear_clicked)
         button_row.addWidget(self.clear_button)
 
         layout.addLayout(button_row)
 
-        # Premium frame styling
-        self.setStyleSheet(f"""
-            DocumentPanel {{
-                background-color: {theme.background_elevated};
-                border-radius: {metrics.radius_large}px;
-                border: 1px solid {theme.border_subtle};
-            }}
-        """)
+    def _get_file_dialog(self) -> QFileDialog:
+        """Return the shared file picker, creating it on first use."""
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(
+                self,
+                "Select Document",
+                "",
+                "Documents (*.pdf *.txt *.md *.docx);;All Files (*.*)"
+            )
+            self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._file_dialog.fileSelected.connect(self.document_added)
+        return self._file_dialog
 
     def _on_add_clicked(self) -> None:
-        """Handle add document button click."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Document",
-            "",
-            "Documents (*.pdf *.txt *.md *.docx);;All Files (*.*)"
-        )
-        if file_path:
-            self.document_added.emit(file_path)
+        """Handle add document button click.
+
+        The picker is opened window-modal with open() rather than the
+        blocking static getter, so no nested event loop runs; the chosen
+        path arrives via fileSelected.
+        """
+        self._get_file_dialog().open()
 
     def _on_clear_clicked(self) -> None:
         """Handle clear all documents button click."""
-        if self._documents:
+        if self._documents.document_count():
             self.clear()
             self.documents_cleared.emit()
 
-    def _show_context_menu(self, pos) -> None:
+    def _show_context_menu(self, pos: QPoint) -> None:
         """Show context menu for document list."""
-        item = self.doc_list.itemAt(pos)
-        if not item:
+        index = self.doc_list.indexAt(pos)
+        if not index.isValid():
             return
 
-        menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-                padding: {metrics.padding_small}px;
-                font-family: {fonts.ui};
-                font-size: {metrics.font_normal}px;
-            }}
-            QMenu::item {{
-                padding: {metrics.padding_small}px {metrics.padding_large}px;
-                border-radius: {metrics.radius_small}px;
-            }}
-            QMenu::item:selected {{
-                background-color: {theme.accent};
-            }}
-        """)
-
-        remove_action = menu.addAction("Remove")
-        action = menu.exec_(self.doc_list.mapToGlobal(pos))
-
-        if action == remove_action:
-            doc_id = item.data(Qt.ItemDataRole.UserRole)
+        # One menu serves every right-click
+        if self._context_menu is None:
+            self._context_menu = QMenu(self)
+            self._context_menu.setStyleSheet(_MENU_QSS)
+            self._remove_action = self._context_menu.addAction("Remove")
+
+        action = self._context_menu.exec_(self.doc_list.viewport().mapToGlobal(pos))
+
+        if action is self._remove_action:
+            doc_id = index.data(Qt.ItemDataRole.UserRole)
             if doc_id:
                 self.document_removed.emit(doc_id)
                 self._remove_document(doc_id)
@@ -510,16 +763,15 @@ class DocumentPanel(QFrame):
             name: Display name
             path: File path
         """
-        self._documents.append({
-            "doc_id": doc_id,
-            "name": name,
-            "path": path
-        })
+        self._documents.add(doc_id, name, path)
 
-        item = QListWidgetItem(name)
-        item.setData(Qt.ItemDataRole.UserRole, doc_id)
-        item.setToolTip(path)
-        self.doc_list.addItem(item)
+    def add_documents(self, documents: List[tuple[str, str, str]]) -> None:
+        """Add several documents to the list at once.
+
+        Args:
+            documents: (doc_id, name, path) tuples in order
+        """
+        self._documents.add_many(documents)
 
     def _remove_document(self, doc_id: str) -> None:
         """Remove a document from the list.
@@ -527,20 +779,15 @@ class DocumentPanel(QFrame):
         Args:
             doc_id: Document ID to remove
         """
-        for i, doc in enumerate(self._documents):
-            if doc["doc_id"] == doc_id:
-                self._documents.pop(i)
-                self.doc_list.takeItem(i)
-                break
+        self._documents.remove(doc_id)
 
     def get_document_count(self) -> int:
         """Get the number of attached documents."""
-        return len(self._documents)
+        return self._documents.document_count()
 
     def clear(self) -> None:
         """Clear all documents."""
         self._documents.clear()
-        self.doc_list.clear()
 
 
 class CruciblePanel(QFrame):
@@ -556,6 +803,7 @@ class CruciblePanel(QFrame):
             parent: Parent widget
         """
         super().__init__(parent)
+        self.refresh_env()
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -571,42 +819,12 @@ class CruciblePanel(QFrame):
 
         # Section label
         label = QLabel("CRUCIBLE")
-        label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_muted};
-                font-size: {metrics.font_small}px;
-                font-weight: 600;
-                font-family: {fonts.ui};
-                letter-spacing: 1px;
-                background: transparent;
-            }}
-        """)
+        label.setObjectName("sidebarSectionLabel")
         layout.addWidget(label)
 
         # Enable toggle checkbox
         self.enable_toggle = QCheckBox("Enable Crucible")
-        self.enable_toggle.setStyleSheet(f"""
-            QCheckBox {{
-                color: {theme.text_primary};
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.ui};
-                spacing: {metrics.padding_small}px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border-radius: {metrics.radius_small}px;
-                border: 1px solid {theme.border};
-                background-color: {theme.background};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {theme.accent};
-                border-color: {theme.accent};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {theme.accent};
-            }}
-        """)
+        self.enable_toggle.setStyleSheet(_TOGGLE_QSS)
         self.enable_toggle.stateChanged.connect(self._on_toggle_changed)
         layout.addWidget(self.enable_toggle)
 
@@ -615,96 +833,36 @@ class CruciblePanel(QFrame):
         router_row.setSpacing(metrics.padding_small)
 
         router_label = QLabel("Router:")
-        router_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.text_secondary};
-                font-size: {metrics.font_small}px;
-                font-family: {fonts.ui};
-                background: transparent;
-            }}
-        """)
+        router_label.setStyleSheet(_ROUTER_LABEL_QSS)
         router_row.addWidget(router_label)
 
         self.router_dropdown = QComboBox()
-        self.router_dropdown.addItems(["Auto", "Custom-Role", "Custom-Cost"])
-        self.router_dropdown.setCurrentText("Auto")
+        self.router_dropdown.addItems(_ROUTER_MODES)
+        self.router_dropdown.setCurrentText(_ROUTER_MODES[0])
         self.router_dropdown.setEnabled(False)
-        self.router_dropdown.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_small}px;
-                padding: {metrics.padding_small}px;
-                min-height: 20px;
-                font-family: {fonts.ui};
-                font-size: {metrics.font_small}px;
-            }}
-            QComboBox:hover {{
-                border-color: {theme.accent};
-            }}
-            QComboBox:disabled {{
-                color: {theme.text_disabled};
-                background-color: {theme.background};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid {theme.text_muted};
-                margin-right: {metrics.padding_small}px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                selection-background-color: {theme.accent};
-            }}
-        """)
-        self.router_dropdown.currentTextChanged.connect(self._on_router_changed)
+        self.router_dropdown.setStyleSheet(_ROUTER_COMBO_QSS)
+        self.router_dropdown.textActivated.connect(self._on_router_changed)
         router_row.addWidget(self.router_dropdown, stretch=1)
 
         layout.addLayout(router_row)
 
         # Warning label (hidden by default)
         self.warning_label = QLabel("Model selection disabled")
-        self.warning_label.setStyleSheet(f"""
-            QLabel {{
-                color: {theme.budget_orange};
-                font-size: {metrics.font_small}px;
-                font-family: {fonts.ui};
-                background: transparent;
-            }}
-        """)
+        self.warning_label.setStyleSheet(_WARNING_LABEL_QSS)
         self.warning_label.setVisible(False)
         layout.addWidget(self.warning_label)
 
-        # Premium frame styling
-        self.setStyleSheet(f"""
-            CruciblePanel {{
-                background-color: {theme.background_elevated};
-                border-radius: {metrics.radius_large}px;
-                border: 1px solid {theme.border_subtle};
-            }}
-        """)
-
     def _on_toggle_changed(self, state: int) -> None:
         """Handle toggle state change.
 
         Args:
             state: Qt check state
         """
-        import os
-
         enabled = state == Qt.CheckState.Checked.value
 
         if enabled:
             # Check for OPENROUTER_KEY
-            if not os.environ.get("OPENROUTER_KEY"):
+            if not self._has_openrouter_key:
                 QMessageBox.warning(
                     self,
                     "OpenRouter Key Required",
@@ -722,6 +880,10 @@ class CruciblePanel(QFrame):
         # Emit signal
         self.crucible_toggled.emit(enabled)
 
+    def refresh_env(self) -> None:
+        """Re-read API key environment variables (e.g., after keys change)."""
+        self._has_openrouter_key = bool(os.environ.get("OPENROUTER_KEY"))
+
     def _on_router_changed(self, router_mode: str) -> None:
         """Handle router mode change.
 
@@ -785,11 +947,27 @@ class Sidebar(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
-        self._setup_ui()
+        # Built on the first idle tick so they don't delay the first paint
+        self.document_panel: DocumentPanel | None = None
+        self.crucible_panel: CruciblePanel | None = None
+        self.toc_panel: TOCPanel | None = None
+        # State set before the deferred panels exist; applied when built
+        self._pending_documents: List[tuple[str, str, str]] = []
+        self._crucible_enabled = False
+        self._crucible_router = _ROUTER_MODES[0]
+        self._pending_toc: List[TOCEntry] = []
+        self._pending_toc_index: int | None = None
+        # Lay out all sections before allowing a paint
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+        QTimer.singleShot(0, self._build_deferred)
 
     def _setup_ui(self) -> None:
         """Set up the premium sidebar UI."""
-        layout = QVBoxLayout(self)
+        self._layout = layout = QVBoxLayout(self)
         layout.setContentsMargins(
             metrics.padding_medium,
             metrics.padding_large,
@@ -807,57 +985,20 @@ class Sidebar(QWidget):
         self.context_indicator = ContextBudgetIndicator()
         layout.addWidget(self.context_indicator)
 
-        # Document panel
-        self.document_panel = DocumentPanel()
-        self.document_panel.document_added.connect(self.document_added)
-        self.document_panel.document_removed.connect(self.document_removed)
-        self.document_panel.documents_cleared.connect(self.documents_cleared)
-        layout.addWidget(self.document_panel)
-
-        # Crucible panel
-        self.crucible_panel = CruciblePanel()
-        self.crucible_panel.crucible_toggled.connect(self._on_crucible_toggled)
-        self.crucible_panel.router_changed.connect(self.crucible_router_changed)
-        layout.addWidget(self.crucible_panel)
-
-        # Table of Contents panel
-        self.toc_panel = TOCPanel()
-        self.toc_panel.jump_to_message.connect(self.jump_to_message)
-        layout.addWidget(self.toc_panel, stretch=1)
+        # Document, Crucible and TOC panels are inserted here later
+        self._deferred_index = layout.count()
 
         # Regenerate button - secondary style
         self.regenerate_button = QPushButton("Regenerate")
         self.regenerate_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.regenerate_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {theme.text_secondary};
-                border: 1px solid {theme.border};
-                border-radius: {metrics.radius_medium}px;
-                padding: {metrics.padding_medium}px;
-                font-size: {metrics.font_normal}px;
-                font-family: {fonts.ui};
-            }}
-            QPushButton:hover {{
-                background-color: {theme.background_elevated};
-                color: {theme.text_primary};
-                border-color: {theme.accent};
-            }}
-            QPushButton:pressed {{
-                background-color: {theme.accent_pressed};
-                color: white;
-            }}
-            QPushButton:disabled {{
-                color: {theme.text_disabled};
-                border-color: {theme.border_subtle};
-            }}
-        """)
+        self.regenerate_button.setStyleSheet(_REGENERATE_BUTTON_QSS)
         self.regenerate_button.clicked.connect(self.regenerate_requested)
         layout.addWidget(self.regenerate_button)
 
         # Inspector toggle button
         self.inspector_button = QPushButton("Inspector")
         self.inspector_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.inspector_button.setObjectName("inspectorButton")
         self._inspector_active = False
         self._update_inspector_button_style()
         self.inspector_button.clicked.connect(self._on_inspector_toggle)
@@ -869,13 +1010,54 @@ class Sidebar(QWidget):
         # Set width
         self.setFixedWidth(260)
 
-        # Premium sidebar styling - recessed background
-        self.setStyleSheet(f"""
-            Sidebar {{
-                background-color: {theme.background_tertiary};
-                border-right: 1px solid {theme.border_subtle};
-            }}
-        """)
+    def _build_deferred(self) -> None:
+        """Create the deferred panels, repainting once when they are all in."""
+        if self.toc_panel is not None:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            self._create_deferred_panels()
+        finally:
+            self.setUpdatesEnabled(True)
+        # Restoring Crucible can open a warning dialog (missing key), so it
+        # runs only once painting is back on
+        self.crucible_panel.set_router(self._crucible_router)
+        self.crucible_panel.set_enabled(self._crucible_enabled)
+
+    def _create_deferred_panels(self) -> None:
+        """Create the document, Crucible and TOC panels.
+
+        Pending documents and TOC entries are applied here; the Crucible
+        state is applied by _build_deferred() afterwards.
+        """
+        layout = self._layout
+        index = self._deferred_index
+
+        # Document panel
+        self.document_panel = DocumentPanel()
+        self.document_panel.document_added.connect(self.document_added)
+        self.document_panel.document_removed.connect(self.document_removed)
+        self.document_panel.documents_cleared.connect(self.documents_cleared)
+        layout.insertWidget(index, self.document_panel)
+        self.document_panel.add_documents(self._pending_documents)
+        self._pending_documents = []
+
+        # Crucible panel
+        self.crucible_panel = CruciblePanel()
+        self.crucible_panel.crucible_toggled.connect(self._on_crucible_toggled)
+        self.crucible_panel.router_changed.connect(self.crucible_router_changed)
+        layout.insertWidget(index + 1, self.crucible_panel)
+
+        # Table of Contents panel
+        self.toc_panel = TOCPanel()
+        self.toc_panel.jump_to_message.connect(self.jump_to_message)
+        layout.insertWidget(index + 2, self.toc_panel, stretch=1)
+        if self._pending_toc:
+            self.toc_panel.set_entries(self._pending_toc)
+        if self._pending_toc_index is not None:
+            self.toc_panel.set_current_index(self._pending_toc_index)
+        self._pending_toc = []
+        self._pending_toc_index = None
 
     def _on_inspector_toggle(self) -> None:
         """Handle inspector toggle button click."""
@@ -884,40 +1066,17 @@ class Sidebar(QWidget):
         self.inspector_toggled.emit(self._inspector_active)
 
     def _update_inspector_button_style(self) -> None:
-        """Update inspector button style based on state."""
-        if self._inspector_active:
-            self.inspector_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {theme.accent};
-                    color: white;
-                    border: none;
-                    border-radius: {metrics.radius_medium}px;
-                    padding: {metrics.padding_medium}px;
-                    font-size: {metrics.font_normal}px;
-                    font-family: {fonts.ui};
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background-color: {theme.accent_hover};
-                }}
-            """)
-        else:
-            self.inspector_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    color: {theme.text_muted};
-                    border: 1px solid {theme.border_subtle};
-                    border-radius: {metrics.radius_medium}px;
-                    padding: {metrics.padding_medium}px;
-                    font-size: {metrics.font_normal}px;
-                    font-family: {fonts.ui};
-                }}
-                QPushButton:hover {{
-                    background-color: {theme.background_elevated};
-                    color: {theme.text_primary};
-                    border-color: {theme.accent};
-                }}
-            """)
+        """Update inspector button style based on state.
+
+        The global stylesheet styles both states by the "inspectorActive"
+        property, so a repolish is enough; no QSS is parsed.
+        """
+        button = self.inspector_button
+        button.setProperty("inspectorActive", self._inspector_active)
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
+        button.update()
 
     def set_model(self, model_id: str) -> None:
         """Set the currently selected model.
@@ -960,6 +1119,9 @@ class Sidebar(QWidget):
             name: Display name
             path: File path
         """
+        if self.document_panel is None:
+            self._pending_documents.append((doc_id, name, path))
+            return
         self.document_panel.add_document(doc_id, name, path)
 
     def set_inspector_active(self, active: bool) -> None:
@@ -968,11 +1130,17 @@ class Sidebar(QWidget):
         Args:
             active: Whether inspector is visible
         """
+        # MainWindow re-asserts the state on close/escape; skip restyling
+        if active == self._inspector_active:
+            return
         self._inspector_active = active
         self._update_inspector_button_style()
 
     def clear_documents(self) -> None:
         """Clear all documents from the document panel."""
+        if self.document_panel is None:
+            self._pending_documents.clear()
+            return
         self.document_panel.clear()
 
     def set_toc_entries(self, entries: List[TOCEntry]) -> None:
@@ -981,6 +1149,9 @@ class Sidebar(QWidget):
         Args:
             entries: List of TOC entries
         """
+        if self.toc_panel is None:
+            self._pending_toc = list(entries)
+            return
         self.toc_panel.set_entries(entries)
 
     def add_toc_entry(self, entry: TOCEntry) -> None:
@@ -989,18 +1160,39 @@ class Sidebar(QWidget):
         Args:
             entry: The entry to add
         """
+        if self.toc_panel is None:
+            self._pending_toc.append(entry)
+            return
         self.toc_panel.add_entry(entry)
 
+    def add_toc_entries_bulk(self, entries: List[TOCEntry]) -> None:
+        """Add several TOC entries at once.
+
+        Args:
+            entries: TOC entries to add
+        """
+        if self.toc_panel is None:
+            self._pending_toc.extend(entries)
+            return
+        self.toc_panel.add_entries(entries)
+
     def set_toc_current_index(self, message_index: int) -> None:
         """Set the current message index for TOC highlighting.
 
         Args:
             message_index: Current message index
         """
+        if self.toc_panel is None:
+            self._pending_toc_index = message_index
+            return
         self.toc_panel.set_current_index(message_index)
 
     def clear_toc(self) -> None:
         """Clear the TOC panel."""
+        if self.toc_panel is None:
+            self._pending_toc = []
+            self._pending_toc_index = None
+            return
         self.toc_panel.clear()
 
     def _on_crucible_toggled(self, enabled: bool) -> None:
@@ -1022,7 +1214,10 @@ class Sidebar(QWidget):
         Args:
             enabled: Whether Crucible is enabled
         """
-        self.crucible_panel.set_enabled(enabled)
+        if self.crucible_panel is None:
+            self._crucible_enabled = enabled
+        else:
+            self.crucible_panel.set_enabled(enabled)
         self.model_selector.setEnabled(not enabled)
 
     def set_crucible_router(self, router_mode: str) -> None:
@@ -1031,6 +1226,9 @@ class Sidebar(QWidget):
         Args:
             router_mode: Router mode ("Auto", "Custom-Role", or "Custom-Cost")
         """
+        if self.crucible_panel is None:
+            self._crucible_router = router_mode
+            return
         self.crucible_panel.set_router(router_mode)
 
     def get_crucible_enabled(self) -> bool:
@@ -1039,6 +1237,8 @@ class Sidebar(QWidget):
         Returns:
             True if enabled
         """
+        if self.crucible_panel is None:
+            return self._crucible_enabled
         return self.crucible_panel.get_enabled()
 
     def get_crucible_router(self) -> str:
@@ -1047,4 +1247,6 @@ class Sidebar(QWidget):
         Returns:
             Router mode string
         """
+        if self.crucible_panel is None:
+            return self._crucible_router
         return self.crucible_panel.get_router()
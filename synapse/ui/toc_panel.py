@@ -239,6 +239,24 @@ class TOCPanel(QWidget):
         self._entries.sort(key=lambda e: e.message_index)
         self._rebuild_entries()
 
+    def add_entries(self, entries: List[TOCEntry]) -> None:
+        """Add several entries to the TOC with a single rebuild.
+
+        Args:
+            entries: The entries to add
+        """
+        if not entries:
+            return
+
+        self._entries.extend(entries)
+        self._entries.sort(key=lambda e: e.message_index)
+
+        self._content.setUpdatesEnabled(False)
+        try:
+            self._rebuild_entries()
+        finally:
+            self._content.setUpdatesEnabled(True)
+
     def _rebuild_entries(self) -> None:
         """Rebuild the entry widgets."""
         # Remove only TOC entry widgets, NOT the empty label or stretch
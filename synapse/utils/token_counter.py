@@ -1,5 +1,6 @@
 """Model-aware token counting utilities."""
 
+from hashlib import blake2b
 from typing import List, Dict, Any
 
 import tiktoken
@@ -10,6 +11,9 @@ class TokenCounter:
 
     Uses tiktoken for OpenAI models and a character-based approximation
     for Claude and other models (since they don't expose public tokenizers).
+
+    Tokenizer results are cached by content hash, so recounting a growing
+    conversation only tokenizes messages that have not been seen before.
     """
 
     def __init__(self, model_id: str = "claude-sonnet-4-5-20250514") -> None:
@@ -20,6 +24,7 @@ class TokenCounter:
         """
         self.model_id = model_id
         self._tiktoken_encoder = None
+        self._cache: Dict[bytes, int] = {}
 
         # Determine provider from model ID
         if model_id.startswith("claude"):
@@ -51,12 +56,39 @@ class TokenCounter:
             return 0
 
         if self.provider == "openai" and self._tiktoken_encoder:
-            return len(self._tiktoken_encoder.encode(text))
+            key = self._cache_key(text)
+            count = self._cache.get(key)
+            if count is None:
+                count = len(self._tiktoken_encoder.encode(text))
+                self._cache[key] = count
+            return count
 
         # For Claude and other models, use character-based approximation
         # Most tokenizers average ~4 characters per token for English
         return len(text) // 4
 
+    def evict(self, *texts: str) -> None:
+        """Drop cached counts for texts that left the conversation.
+
+        Args:
+            texts: Texts whose cached counts are no longer needed
+        """
+        for text in texts:
+            if text:
+                self._cache.pop(self._cache_key(text), None)
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Hash text into a compact cache key.
+
+        Args:
+            text: The text to hash
+
+        Returns:
+            16-byte blake2b digest
+        """
+        return blake2b(text.encode("utf-8"), digest_size=16).digest()
+
     def count_messages(self, messages: List[Dict[str, Any]]) -> int:
         """Count tokens in a list of messages.
 